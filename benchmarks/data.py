@@ -0,0 +1,60 @@
+import random
+
+from src.vacancy import Vacancy
+
+NAMES = ('Python Developer', 'Java Developer', 'Аналитик данных', 'QA инженер', 'DevOps инженер',
+         'Frontend Developer', 'Go Developer', 'Data Scientist', 'Системный администратор', 'Тимлид')
+SKILLS = ('Python', 'Django', 'SQL', 'PostgreSQL', 'Docker', 'Kubernetes', 'Java', 'Spring', 'Linux',
+          'Git', 'REST', 'asyncio', 'Kafka', 'Redis', 'React', 'TypeScript', 'Excel', 'английский')
+CURRENCIES = ('RUR', 'RUR', 'RUR', 'USD', 'EUR', 'KZT')
+EMPLOYERS = 500
+
+
+def api_items(count: int, seed: int = 0) -> list[dict]:
+    """Генерирует вакансии в формате поля items ответа API HeadHunter.
+
+    Данные детерминированы: одинаковые count и seed дают одинаковый результат.
+    Примерно у четверти вакансий нет зарплаты, у части - одной из границ.
+
+    Args:
+        count (int): Количество вакансий
+        seed (int): Начальное значение генератора случайных чисел
+
+    Returns:
+        list[dict]: Вакансии с полями name, alternate_url, snippet, salary, employer и published_at
+    """
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        salary = None
+        if rng.random() < 0.75:
+            start = rng.randrange(30, 400) * 1000
+            salary = {
+                'from': start if rng.random() < 0.8 else None,
+                'to': start + rng.randrange(0, 150) * 1000 if rng.random() < 0.6 else None,
+                'currency': rng.choice(CURRENCIES),
+                'gross': rng.random() < 0.5,
+            }
+        items.append({
+            'id': str(i),
+            'name': rng.choice(NAMES),
+            'alternate_url': f'https://hh.ru/vacancy/{i}',
+            'snippet': {
+                'requirement': ', '.join(rng.sample(SKILLS, 4)),
+                'responsibility': None,
+            },
+            'salary': salary,
+            'employer': {'id': str(i % EMPLOYERS), 'name': f'Компания {i % EMPLOYERS}'},
+            'published_at': f'2024-05-{1 + i % 28:02d}T12:00:00+0300',
+        })
+    return items
+
+
+def records(count: int, seed: int = 0) -> list[dict]:
+    """Генерирует вакансии в формате Vacancy.to_dict() (как в файле JsonSaver)."""
+    return [vacancy.to_dict() for vacancy in vacancies(count, seed)]
+
+
+def vacancies(count: int, seed: int = 0) -> list[Vacancy]:
+    """Генерирует объекты Vacancy из синтетических вакансий API."""
+    return Vacancy.from_api_batch(api_items(count, seed))
@@ -0,0 +1,68 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src import codec
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get('page', ['0'])[0])
+        pages = self.server.pages
+        body = pages[page] if 0 <= page < len(pages) else pages[-1]
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockHHServer:
+    """Локальный HTTP-сервер, отдающий заранее сериализованные страницы выдачи HeadHunter.
+
+    Ответы готовятся при создании, поэтому время запроса определяется
+    клиентом, а не генерацией данных. Адрес сервера - в атрибуте url.
+
+    Пример:
+        with MockHHServer(api_items(2000)) as server:
+            hh.url = server.url
+            hh.load_vacancies('python')
+    """
+
+    def __init__(self, items: list[dict], per_page: int = 100):
+        """
+        Args:
+            items (list[dict]): Вакансии выдачи
+            per_page (int): Количество вакансий на странице
+        """
+        chunks = [items[start:start + per_page] for start in range(0, len(items), per_page)] or [[]]
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.pages = [
+            codec.dumps({'items': chunk, 'found': len(items), 'pages': len(chunks), 'page': page,
+                         'per_page': per_page})
+            for page, chunk in enumerate(chunks)
+        ]
+        self.url = f'http://127.0.0.1:{self._server.server_address[1]}/vacancies'
+        self._thread = None
+
+    def start(self) -> 'MockHHServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,297 @@
+"""Замеры производительности горячих путей загрузки, хранения и выборки вакансий.
+
+Запуск из корня проекта:
+
+    python -m benchmarks.run --sizes 1000,100000 --output results.json
+    python -m benchmarks.run --compare results.json --output new.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.data import api_items, records
+from benchmarks.mock_server import MockHHServer
+from src import codec, utils
+from src.file_worker import JsonSaver
+from src.hh import HH
+from src.rate_limit import RateLimiter
+from src.session import build_session
+from src.vacancy import Vacancy
+
+DEFAULT_SIZES = (1000,)
+# API HeadHunter отдает не более 2000 вакансий на запрос
+API_LIMIT = 2000
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """Регистрирует замер.
+
+    Функция замера получает Dataset, выполняет подготовку (она не входит в
+    замер) и возвращает функцию без аргументов, время которой измеряется.
+    Подготовка выполняется перед каждым повтором, поэтому замеры, изменяющие
+    данные, не влияют друг на друга.
+    """
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+class Dataset:
+    """Синтетические данные одного размера; создаются при первом обращении."""
+
+    def __init__(self, size: int, workdir: str):
+        self.size = size
+        self.workdir = workdir
+        self._items = None
+        self._vacancies = None
+        self._json_file = None
+        self._server = None
+
+    @property
+    def items(self) -> list[dict]:
+        """Вакансии в формате ответа API"""
+        if self._items is None:
+            self._items = api_items(self.size)
+        return self._items
+
+    @property
+    def vacancies(self) -> list[Vacancy]:
+        """Объекты Vacancy"""
+        if self._vacancies is None:
+            self._vacancies = Vacancy.from_api_batch(self.items)
+        return self._vacancies
+
+    @property
+    def json_file(self) -> str:
+        """Файл JsonSaver со всеми вакансиями (не изменяется замерами)"""
+        if self._json_file is None:
+            self._json_file = os.path.join(self.workdir, f'vacancies-{self.size}.json')
+            with open(self._json_file, 'wb') as file:
+                file.write(codec.dumps(records(self.size), pretty=True))
+        return self._json_file
+
+    def json_copy(self) -> str:
+        """Копия файла JsonSaver для замеров, которые его перезаписывают"""
+        filename = os.path.join(self.workdir, 'work.json')
+        shutil.copyfile(self.json_file, filename)
+        return filename
+
+    @property
+    def server(self) -> MockHHServer:
+        """Локальный сервер с выдачей не более API_LIMIT вакансий"""
+        if self._server is None:
+            self._server = MockHHServer(self.items[:API_LIMIT]).start()
+        return self._server
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.stop()
+
+
+@benchmark('cast_to_object_list')
+def bench_cast_to_object_list(data: Dataset):
+    items = data.items
+    return lambda: Vacancy.cast_to_object_list(items)
+
+
+@benchmark('json_load')
+def bench_json_load(data: Dataset):
+    filename = data.json_file
+    return lambda: JsonSaver(filename)
+
+
+@benchmark('json_save')
+def bench_json_save(data: Dataset):
+    vacancies = data.vacancies
+    filename = os.path.join(data.workdir, 'save.json')
+    if os.path.exists(filename):
+        os.remove(filename)
+    saver = JsonSaver(filename)
+    return lambda: saver.add_vacancies(vacancies)
+
+
+@benchmark('json_add')
+def bench_json_add(data: Dataset):
+    saver = JsonSaver(data.json_copy())
+    vacancy = Vacancy('Новая вакансия', 'Python', 'https://hh.ru/vacancy/new', {'from': 100000}, 'Компания')
+    return lambda: saver.add_vacancy(vacancy)
+
+
+@benchmark('json_delete')
+def bench_json_delete(data: Dataset):
+    saver = JsonSaver(data.json_copy())
+    vacancy = data.vacancies[data.size // 2]
+    return lambda: saver.delete_vacancy(vacancy)
+
+
+@benchmark('saver_filter_vacancies')
+def bench_saver_filter_vacancies(data: Dataset):
+    saver = JsonSaver(data.json_file)
+    return lambda: saver.filter_vacancies(lambda v: v.salary_max > 150000)
+
+
+@benchmark('filter_vacancies')
+def bench_filter_vacancies(data: Dataset):
+    vacancies = data.vacancies
+    return lambda: utils.filter_vacancies(vacancies, ['python', 'sql'])
+
+
+@benchmark('get_vacancies_by_salary')
+def bench_get_vacancies_by_salary(data: Dataset):
+    vacancies = data.vacancies
+    return lambda: utils.get_vacancies_by_salary(vacancies, '100000-200000')
+
+
+@benchmark('sort_vacancies')
+def bench_sort_vacancies(data: Dataset):
+    vacancies = data.vacancies
+    return lambda: utils.sort_vacancies(vacancies)
+
+
+@benchmark('hh_load_vacancies')
+def bench_hh_load_vacancies(data: Dataset):
+    server = data.server
+    hh = HH(None, max_pages=API_LIMIT // 100, session=build_session(),
+            limiter=RateLimiter(rate=None, quotas={}))
+    hh.url = server.url
+    return lambda: hh.load_vacancies('python')
+
+
+def measure(func, data: Dataset, repeat: int) -> dict:
+    """Выполняет замер repeat раз и возвращает статистику времени в секундах."""
+    timings = []
+    for _ in range(repeat):
+        run = func(data)
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+        'max': max(timings),
+        'repeat': repeat,
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, names=None, repeat: int = 5, progress=print) -> dict:
+    """Выполняет замеры для каждого размера данных.
+
+    Args:
+        sizes (Iterable[int]): Количество вакансий в синтетических данных
+        names (Iterable[str], optional): Имена замеров; по умолчанию все
+        repeat (int): Количество повторов каждого замера
+        progress (callable, optional): Функция для вывода хода выполнения; None - без вывода
+
+    Returns:
+        dict: Результаты: meta (окружение) и results (по записи на замер и размер)
+
+    Raises:
+        KeyError: Если замер с указанным именем не зарегистрирован
+    """
+    selected = {name: BENCHMARKS[name] for name in (names or BENCHMARKS)}
+    report = progress or (lambda message: None)
+    results = []
+    with tempfile.TemporaryDirectory(prefix='hh-bench-') as workdir:
+        for size in sizes:
+            data = Dataset(size, workdir)
+            try:
+                for name, func in selected.items():
+                    stats = measure(func, data, repeat)
+                    items = min(size, API_LIMIT) if name == 'hh_load_vacancies' else size
+                    results.append({'name': name, 'size': items, **stats})
+                    report(f"{name:<26} {items:>9} {stats['median'] * 1000:>12.2f} мс")
+            finally:
+                data.close()
+    return {'meta': _meta(), 'results': results}
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2) -> list[dict]:
+    """Сравнивает медианы замеров с результатами предыдущего запуска.
+
+    Args:
+        baseline (dict): Результаты предыдущего запуска (run_benchmarks)
+        current (dict): Результаты текущего запуска
+        threshold (float): Допустимое относительное замедление
+
+    Returns:
+        list[dict]: Для каждого общего замера name, size, baseline, current,
+        ratio (current / baseline) и regression
+    """
+    previous = {(result['name'], result['size']): result['median'] for result in baseline['results']}
+    rows = []
+    for result in current['results']:
+        before = previous.get((result['name'], result['size']))
+        if not before:
+            continue
+        ratio = result['median'] / before
+        rows.append({
+            'name': result['name'],
+            'size': result['size'],
+            'baseline': before,
+            'current': result['median'],
+            'ratio': ratio,
+            'regression': ratio > 1 + threshold,
+        })
+    return rows
+
+
+def _meta() -> dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'json_backend': codec.get_backend(),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры производительности")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="размеры данных через запятую (например, 1000,100000,1000000)")
+    parser.add_argument('--only', metavar='NAME', action='append', choices=sorted(BENCHMARKS),
+                        help="выполнить только указанный замер (можно повторять)")
+    parser.add_argument('--repeat', type=int, default=5, help="количество повторов (по умолчанию 5)")
+    parser.add_argument('--output', metavar='FILE', help="сохранить результаты в JSON-файл")
+    parser.add_argument('--compare', metavar='FILE', help="сравнить с результатами предыдущего запуска")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="допустимое замедление при сравнении (по умолчанию 0.2 - 20%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = run_benchmarks(sizes, args.only, args.repeat)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=4)
+    if not args.compare:
+        return 0
+    with open(args.compare, 'r', encoding='utf-8') as file:
+        rows = compare(json.load(file), results, args.threshold)
+    for row in rows:
+        mark = '  ЗАМЕДЛЕНИЕ' if row['regression'] else ''
+        print(f"{row['name']:<26} {row['size']:>9} {row['ratio']:>8.2f}x{mark}")
+    return 1 if any(row['regression'] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,87 @@
-from src.utils import user_interaction
+import argparse
 
-if __name__=='__main__':
-    user_interaction()
+from src import metrics, utils
+
+# Модули пакетного режима, профилирования и HTTP-стек импортируются только
+# в ветках, которые их используют, чтобы короткие команды запускались быстро
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Поиск вакансий на HeadHunter")
+    parser.add_argument('--top', metavar='N', type=int,
+                        help="вывести N вакансий с наибольшей зарплатой из сохраненных (без запросов к API)")
+    parser.add_argument('--store', metavar='FILE',
+                        help="файл хранилища вакансий (по умолчанию vacancies.json; "
+                             "для расширений .db, .sqlite, .sqlite3 - база SQLite)")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="загрузить вакансии по запросам из файла (по одному в строке) без диалога")
+    parser.add_argument('--areas', metavar='FILE',
+                        help="файл параметров поиска с регионами (например, data/application.json)")
+    parser.add_argument('--workers', type=int, default=8,
+                        help="количество одновременных запросов в пакетном режиме (по умолчанию 8)")
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="собрать метрики времени этапов и записать их в FILE "
+                             "(JSON для расширения .json, иначе формат Prometheus)")
+    parser.add_argument('--profile', metavar='PREFIX', nargs='?', const='profile',
+                        help="выполнить под cProfile и tracemalloc; отчет записывается в PREFIX.txt, "
+                             "статистика для snakeviz - в PREFIX.prof (по умолчанию profile)")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="взять ответы на вопросы из файла записи вместо ввода с клавиатуры")
+    parser.add_argument('--record', metavar='FILE',
+                        help="записать ответы на вопросы в файл для последующего --replay")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.profile:
+        from src.profiling import profile_call
+
+        profile_call(lambda: measured_run(args), args.profile)
+        print(f"Отчет профилирования: {args.profile}.txt, статистика: {args.profile}.prof")
+    else:
+        measured_run(args)
 
 
+def measured_run(args):
+    if not args.metrics:
+        run(args)
+        return
+    metrics.enable()
+    try:
+        run(args)
+    finally:
+        metrics.write(args.metrics)
+
+
+def run(args):
+    if args.store:
+        utils.STORE_FILE = args.store
+    if args.top is not None:
+        utils.print_vacancies(utils.query_vacancies(utils.get_json_saver(), [], '', args.top))
+        return
+    if not args.batch:
+        from src.profiling import RecordingInput, ReplayInput, load_answers, save_answers
+
+        input_func = ReplayInput(load_answers(args.replay)) if args.replay else input
+        if args.record:
+            input_func = RecordingInput(input_func)
+            try:
+                utils.user_interaction(input_func)
+            finally:
+                save_answers(args.record, input_func.answers)
+        else:
+            utils.user_interaction(input_func)
+        return
+    from src.batch import format_report, load_areas, read_keywords, run_batch
+
+    keywords = read_keywords(args.batch)
+    areas = load_areas(args.areas) if args.areas else ()
+    # fetch_items загружает все страницы выдачи и вызывает исключение при ошибке запроса
+    report = run_batch(keywords, utils.get_json_saver(), utils.get_hh().fetch_items, areas,
+                       max_workers=args.workers)
+    print(format_report(report))
+
+
+if __name__=='__main__':
+    main()
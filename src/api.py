@@ -1,7 +1,14 @@
-import requests
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING
 
+from src import metrics
+from src.rate_limit import get_rate_limiter
+from src.session import fetch_json, get_session
 
-from abc import ABC, abstractmethod
+if TYPE_CHECKING:
+    import requests
 
 
 class ApiConnector(ABC):
@@ -11,11 +18,12 @@ class ApiConnector(ABC):
         pass
 
     @abstractmethod
-    def get_vacancies(self, keyword: str) -> list[dict]:
+    def get_vacancies(self, keyword: str, **params) -> list[dict]:
         """Абстрактный метод для получения вакансий.
 
         Args:
             keyword (str): Ключевое слово для поиска
+            **params: Дополнительные параметры запроса (например, date_from, order_by)
 
         Returns:
             list[dict]: Список вакансий в формате словарей
@@ -24,27 +32,197 @@ class ApiConnector(ABC):
 
 
 class HeadHunterApi(ApiConnector):
-    def __init__(self):
+    def __init__(self, session: 'requests.Session' = None, cache=None, limiter=None):
+        """
+        Args:
+            session (requests.Session, optional): HTTP-сессия; по умолчанию общая сессия
+                с пулом соединений и повторами (см. src/session.py)
+            cache (ResponseCache, optional): Дисковый кэш ответов (см. src/cache.py)
+            limiter (RateLimiter, optional): Ограничитель частоты запросов; по умолчанию
+                общий для всех коннекторов (см. src/rate_limit.py)
+        """
         self._base_url = "https://api.hh.ru/"
+        self._session = session or get_session()
+        self._cache = cache
+        self._limiter = limiter or get_rate_limiter()
         
     def connect(self) -> None:
         """Реализация абстрактного метода для подключения к API."""
         client_id = "id token"
         print("Подколючаемся к API")
 
-    def get_vacancies(self, keyword: str) -> list[dict]:
+    @metrics.timed('hh_connector_seconds', connector='HeadHunterApi', method='get_vacancies')
+    def get_vacancies(self, keyword: str, **params) -> list[dict]:
+        """Получает первую страницу выдачи вакансий по ключевому слову.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            **params: Дополнительные параметры запроса (например, date_from, order_by)
+
+        Returns:
+            list[dict]: Вакансии из поля `items` ответа API
+
+        Raises:
+            requests.exceptions.RequestException: Если запрос не удался после всех повторов
+        """
         url = "https://api.hh.ru/vacancies"  # URL-адрес для запроса вакансий на hh.ru
-        params = {"text": keyword}  # Параметры запроса. Здесь мы указываем ключевое слово для поиска.
-
-        try:  # Блок try позволяет нам обработать возможные ошибки при выполнении запроса.
-            response = requests.get(url,params=params)  # Отправляем GET-запрос на указанный URL с заданными параметрами.
-            response.raise_for_status()  # Эта строка проверяет, что запрос был выполнен успешно
-            # (код ответа 200). Если нет, возникнет ошибка.
-            vacancies_data = response.json()  # Преобразуем полученный от сервера ответ в формате JSON в словарь Python.
-            vacancies_list = vacancies_data.get("items",[])  # Извлекаем список вакансий
-            # из полученного словаря по ключу "items". Если ключ отсутствует, возвращаем пустой список.
-            return vacancies_list  # Возвращаем полученный список вакансий.
-        except requests.exceptions.RequestException as e:  # Если во время
-            # выполнения запроса произошла ошибка...
-            print(f"Ошибка при получении вакансий: {e}")  # ...выводим сообщение об ошибке.
-            return []  # ...и возвращаем пустой список вакансий.
\ No newline at end of file
+        params = {"text": keyword, **params}  # Параметры запроса: ключевое слово для поиска
+        # и дополнительные фильтры API (например, date_from для инкрементальной синхронизации).
+
+        vacancies_data = fetch_json(self._session, url, params=params, cache=self._cache,
+                                    limiter=self._limiter)  # Отправляем GET-запрос через общую
+        # сессию (keep-alive, повторы при 429/5xx, ограничение частоты) или берем ответ из кэша.
+        # Если после повторов код ответа не 200, возникает исключение - ошибка не превращается
+        # в пустой список, чтобы вызывающий код мог отличить ее от пустой выдачи.
+        vacancies_list = vacancies_data.get("items",[])  # Извлекаем список вакансий
+        # из полученного словаря по ключу "items". Если ключ отсутствует, возвращаем пустой список.
+        metrics.inc('hh_fetched_vacancies_total', len(vacancies_list), connector='HeadHunterApi')
+        return vacancies_list  # Возвращаем полученный список вакансий.
+
+
+class AsyncApiConnector(ABC):
+    @abstractmethod
+    async def get_vacancies(self, keyword: str) -> list[dict]:
+        """Абстрактный метод для асинхронного получения вакансий.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+
+        Returns:
+            list[dict]: Список вакансий в формате словарей
+        """
+        pass
+
+    @abstractmethod
+    async def get_vacancies_many(self, keywords: Iterable[str],
+                                 return_exceptions: bool = False) -> dict[str, list[dict]]:
+        """Абстрактный метод для одновременного получения вакансий по нескольким запросам.
+
+        Args:
+            keywords (Iterable[str]): Ключевые слова для поиска
+            return_exceptions (bool): Вернуть исключение неудачного запроса вместо
+                вакансий этого ключевого слова (иначе первая ошибка пробрасывается)
+
+        Returns:
+            dict[str, list[dict]]: Вакансии (или исключение) для каждого ключевого слова
+        """
+        pass
+
+    @abstractmethod
+    def iter_pages(self, keyword: str) -> AsyncIterator[list[dict]]:
+        """Абстрактный метод для постраничного получения вакансий.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+
+        Returns:
+            AsyncIterator[list[dict]]: Асинхронный итератор по страницам выдачи
+        """
+        pass
+
+
+class AsyncHeadHunterApi(AsyncApiConnector):
+    """Асинхронный клиент API HeadHunter.
+
+    Запросы выполняются через общую HTTP-сессию (пул соединений, повторы) в
+    потоках по умолчанию цикла событий, а количество одновременных запросов
+    ограничивается семафором. Ожидание ограничителя частоты происходит в тех
+    же потоках и не блокирует цикл событий.
+    """
+
+    def __init__(self, session: 'requests.Session' = None, max_concurrency: int = 8,
+                 per_page: int = 100, max_pages: int = 20, base_url: str = "https://api.hh.ru/",
+                 cache=None, limiter=None):
+        """
+        Args:
+            session (requests.Session, optional): HTTP-сессия; по умолчанию общая сессия
+            max_concurrency (int): Максимальное количество одновременных запросов
+            per_page (int): Количество вакансий на странице для iter_pages
+            max_pages (int): Максимальное количество страниц для iter_pages
+            base_url (str): Базовый адрес API
+            cache (ResponseCache, optional): Дисковый кэш ответов (см. src/cache.py)
+            limiter (RateLimiter, optional): Ограничитель частоты запросов; по умолчанию общий
+        """
+        self._base_url = base_url
+        self._session = session or get_session()
+        self._cache = cache
+        self._limiter = limiter or get_rate_limiter()
+        self.max_concurrency = max_concurrency
+        self.per_page = per_page
+        self.max_pages = max_pages
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Возвращает семафор, привязанный к текущему циклу событий."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _fetch(self, params: dict) -> dict:
+        """Выполняет блокирующий запрос к API (вызывается в отдельном потоке)."""
+        return fetch_json(self._session, self._base_url + "vacancies", params=params,
+                          cache=self._cache, limiter=self._limiter)
+
+    async def _request(self, params: dict) -> dict:
+        """Выполняет запрос к API с учетом ограничения одновременных запросов.
+
+        Args:
+            params (dict): Параметры запроса
+
+        Returns:
+            dict: Ответ API
+        """
+        async with self._get_semaphore():
+            return await asyncio.to_thread(self._fetch, params)
+
+    async def get_vacancies(self, keyword: str) -> list[dict]:
+        """Получает первую страницу выдачи вакансий по ключевому слову.
+
+        Raises:
+            requests.exceptions.RequestException: Если запрос не удался после всех повторов
+        """
+        vacancies_data = await self._request({"text": keyword})
+        return vacancies_data.get("items", [])
+
+    async def get_vacancies_many(self, keywords: Iterable[str],
+                                 return_exceptions: bool = False) -> dict[str, list[dict]]:
+        keywords = list(dict.fromkeys(keywords))  # Убираем повторы, сохраняя порядок
+        results = await asyncio.gather(*(self.get_vacancies(keyword) for keyword in keywords),
+                                       return_exceptions=return_exceptions)
+        return dict(zip(keywords, results))
+
+    async def iter_pages(self, keyword: str) -> AsyncIterator[list[dict]]:
+        """Асинхронно перебирает страницы выдачи по порядку.
+
+        Первая страница запрашивается сразу, остальные - одновременно (в пределах
+        max_concurrency), но выдаются в порядке номеров. Ошибки запроса
+        пробрасываются вызывающему коду.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+
+        Yields:
+            list[dict]: Вакансии очередной страницы
+        """
+        params = {"text": keyword, "per_page": self.per_page}
+        first = await self._request({**params, "page": 0})
+        yield first.get("items", [])
+
+        pages = first.get("pages")
+        if pages is None:
+            pages = -(-(first.get("found", 0) or 0) // self.per_page)
+        pages = min(pages, self.max_pages)
+
+        tasks = [asyncio.create_task(self._request({**params, "page": page}))
+                 for page in range(1, pages)]
+        try:
+            for task in tasks:
+                yield (await task).get("items", [])
+        finally:
+            # Если перебор прерван, незавершенные запросы больше не нужны
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
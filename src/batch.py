@@ -0,0 +1,130 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.vacancy import Vacancy
+
+
+def read_keywords(path: str) -> list[str]:
+    """Читает поисковые запросы из текстового файла (по одному в строке).
+
+    Пустые строки и строки, начинающиеся с '#', пропускаются; повторы удаляются.
+
+    Args:
+        path (str): Путь к файлу
+
+    Returns:
+        list[str]: Запросы в порядке файла
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        lines = (line.strip() for line in file)
+        return list(dict.fromkeys(line for line in lines if line and not line.startswith('#')))
+
+
+def load_areas(path: str) -> list[str]:
+    """Читает коды регионов из файла параметров поиска HeadHunter (data/application.json).
+
+    Args:
+        path (str): Путь к файлу с полем `arguments`
+
+    Returns:
+        list[str]: Значения аргументов `area` без повторов
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    return list(dict.fromkeys(
+        argument['value'] for argument in data.get('arguments', [])
+        if argument.get('argument') == 'area' and argument.get('value')
+    ))
+
+
+def run_batch(keywords, saver, fetch, areas=(), max_workers: int = 8, progress=print) -> dict:
+    """Загружает вакансии по списку запросов параллельно и сохраняет их одной записью.
+
+    Каждый запрос выполняется для каждого региона из `areas` (или один раз без
+    региона). Вакансии из разных запросов объединяются без повторов по ссылке
+    (остается первая в порядке запросов) и добавляются в хранилище одним
+    вызовом add_vacancies. Ошибка одного запроса не прерывает остальные.
+
+    Args:
+        keywords (Iterable[str]): Поисковые запросы
+        saver: Хранилище с методом add_vacancies
+        fetch: Функция fetch(keyword, **params) -> list[dict], возвращающая вакансии со всех
+            страниц выдачи и вызывающая исключение при ошибке, например HH.fetch_items
+        areas (Iterable[str]): Коды регионов (параметр `area` API)
+        max_workers (int): Количество одновременных запросов
+        progress (callable, optional): Функция для вывода хода выполнения; None - без вывода
+
+    Returns:
+        dict: Отчет: queries, failed, fetched, unique, added и timings (секунды по этапам)
+    """
+    tasks = [(keyword, area) for keyword in keywords for area in (list(areas) or [None])]
+    report = progress or (lambda message: None)
+    timings = {}
+    started = time.perf_counter()
+
+    results = [None] * len(tasks)
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks) or 1))) as executor:
+        futures = {
+            executor.submit(fetch, keyword, **({'area': area} if area else {})): position
+            for position, (keyword, area) in enumerate(tasks)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            position = futures[future]
+            label = _task_label(*tasks[position])
+            try:
+                results[position] = future.result()
+            except Exception as e:
+                failed += 1
+                report(f"[{done}/{len(tasks)}] {label}: ошибка - {e}")
+                continue
+            report(f"[{done}/{len(tasks)}] {label}: {len(results[position])} вакансий")
+    timings['fetch'] = time.perf_counter() - started
+
+    stage = time.perf_counter()
+    unique = {}
+    fetched = 0
+    for items in results:
+        if not items:
+            continue
+        fetched += len(items)
+        for vacancy in Vacancy.from_api_batch(items):
+            unique.setdefault(vacancy.url, vacancy)
+    timings['parse'] = time.perf_counter() - stage
+
+    stage = time.perf_counter()
+    added = saver.add_vacancies(unique.values()) if unique else 0
+    timings['write'] = time.perf_counter() - stage
+    timings['total'] = time.perf_counter() - started
+
+    return {
+        'queries': len(tasks),
+        'failed': failed,
+        'fetched': fetched,
+        'unique': len(unique),
+        'added': added,
+        'timings': timings,
+    }
+
+
+def format_report(report: dict) -> str:
+    """Формирует текстовый отчет о пакетной загрузке.
+
+    Args:
+        report (dict): Отчет run_batch
+
+    Returns:
+        str: Отчет для вывода пользователю
+    """
+    timings = ', '.join(f"{stage} {seconds:.2f} с" for stage, seconds in report['timings'].items())
+    return (
+        f"Запросов: {report['queries']} (с ошибкой: {report['failed']}), "
+        f"получено вакансий: {report['fetched']}, уникальных: {report['unique']}, "
+        f"добавлено: {report['added']}\n"
+        f"Время: {timings}"
+    )
+
+
+def _task_label(keyword: str, area) -> str:
+    return f"{keyword} (регион {area})" if area else keyword
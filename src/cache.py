@@ -0,0 +1,200 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode
+
+from src import codec, metrics
+from src.session import send_get
+
+
+class ResponseCache:
+    """Дисковый кэш ответов API HeadHunter.
+
+    Ответы хранятся в отдельных JSON-файлах, ключ - URL вместе с
+    нормализованными (отсортированными) параметрами запроса. Свежие записи
+    (моложе `ttl` секунд) отдаются без обращения к сети, устаревшие
+    перепроверяются условным запросом (If-None-Match/If-Modified-Since).
+    При превышении `max_bytes` удаляются давно не использованные записи.
+    """
+
+    def __init__(self, directory: str, ttl: float = 3600, max_bytes: int = 50 * 1024 * 1024):
+        """
+        Args:
+            directory (str): Каталог для файлов кэша (создается при первой записи)
+            ttl (float): Время жизни записи в секундах
+            max_bytes (int): Максимальный суммарный размер файлов кэша
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: dict = None) -> str:
+        """Формирует ключ кэша по URL и параметрам запроса.
+
+        Порядок параметров и тип значений не влияют на ключ.
+
+        Args:
+            url (str): Адрес запроса
+            params (dict, optional): Параметры запроса
+
+        Returns:
+            str: Ключ кэша
+        """
+        normalized = sorted((str(key), str(value)) for key, value in (params or {}).items())
+        raw = f"{url}?{urlencode(normalized)}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def fetch(self, session, url: str, params: dict = None, headers: dict = None, limiter=None):
+        """Возвращает ответ API из кэша или загружает его через сессию.
+
+        Args:
+            session: HTTP-сессия для запроса
+            url (str): Адрес запроса
+            params (dict, optional): Параметры запроса
+            headers (dict, optional): Заголовки запроса
+            limiter (RateLimiter, optional): Ограничитель частоты для запросов в сеть
+
+        Returns:
+            Тело ответа, преобразованное из JSON
+
+        Raises:
+            requests.exceptions.RequestException: При ошибке запроса
+        """
+        key = self.make_key(url, params)
+        path = self._path(key)
+        entry = self._read(path)
+
+        if entry is not None and time.time() - entry['stored_at'] < self.ttl:
+            self._count('hits')
+            self._touch(path)
+            return entry['body']
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = send_get(session, url, limiter=limiter, params=params, headers=request_headers)
+        if response.status_code == 304 and entry is not None:
+            self._count('revalidations')
+            entry['stored_at'] = time.time()
+            self._write(path, entry)
+            return entry['body']
+
+        response.raise_for_status()
+        with metrics.timer('hh_json_decode_seconds'):
+            body = codec.loads(response.content)
+        self._count('misses')
+        self._write(path, {
+            'url': url,
+            'params': params,
+            'stored_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': body,
+        })
+        self._evict()
+        return body
+
+    def stats(self) -> dict:
+        """Возвращает счетчики кэша для мониторинга.
+
+        Returns:
+            dict: Количество попаданий, промахов, перепроверок и вытеснений
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'evictions': self.evictions,
+            }
+
+    def clear(self) -> None:
+        """Удаляет все записи кэша."""
+        for path, _, _ in self._entries():
+            self._remove(path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+        metrics.inc('hh_cache_requests_total', result=name)
+
+    @staticmethod
+    def _read(path: str):
+        try:
+            with open(path, 'rb') as file:
+                return codec.loads(file.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: str, entry: dict) -> None:
+        """Атомарно записывает запись кэша через временный файл."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(codec.dumps(entry))
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """Отмечает запись как недавно использованную (время изменения файла)."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        """Возвращает записи кэша в виде (путь, время использования, размер)."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        """Удаляет давно не использованные записи, пока кэш превышает max_bytes."""
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        if total <= self.max_bytes:
+            return
+        for path, _, size in sorted(entries, key=lambda entry: entry[1]):
+            self._remove(path)
+            self._count('evictions')
+            total -= size
+            if total <= self.max_bytes:
+                break
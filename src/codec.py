@@ -0,0 +1,186 @@
+import importlib.util
+import json
+import os
+
+from src.vacancy import Vacancy
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgspec импортируется только при выборе этой реализации (см. _load_msgspec)
+msgspec = None
+_msgspec_installed = importlib.util.find_spec('msgspec') is not None
+
+# Ошибка разбора JSON для всех реализаций (ошибки orjson - ее подкласс,
+# ошибки msgspec преобразуются в нее)
+DecodeError = json.JSONDecodeError
+
+# Реализации в порядке предпочтения
+BACKENDS = ('orjson', 'msgspec', 'json')
+
+
+def available_backends() -> list[str]:
+    """Возвращает установленные реализации JSON в порядке предпочтения."""
+    installed = {'orjson': orjson is not None, 'msgspec': _msgspec_installed, 'json': True}
+    return [name for name in BACKENDS if installed[name]]
+
+
+def get_backend() -> str:
+    """Возвращает имя текущей реализации JSON."""
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """Выбирает реализацию JSON.
+
+    Args:
+        name (str): 'orjson', 'msgspec' или 'json' (стандартная библиотека)
+
+    Raises:
+        ValueError: Если реализация неизвестна или не установлена
+    """
+    global _backend
+    if name not in available_backends():
+        raise ValueError(f"Реализация JSON недоступна: {name}")
+    if name == 'msgspec':
+        _load_msgspec()
+    _backend = name
+
+
+def loads(data):
+    """Разбирает JSON.
+
+    Args:
+        data (bytes | str): Текст JSON
+
+    Returns:
+        Разобранное значение
+
+    Raises:
+        DecodeError: Если данные - не корректный JSON
+    """
+    if _backend == 'orjson':
+        return orjson.loads(data)
+    if _backend == 'msgspec':
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise DecodeError(str(e), '', 0) from None
+    return json.loads(data)
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """Сериализует значение в JSON (UTF-8, символы вне ASCII не экранируются).
+
+    Args:
+        obj: Значение для сериализации
+        pretty (bool): Форматировать с отступами: 4 пробела, у orjson - 2 (другого
+            отступа он не поддерживает); содержимое документа от отступа не зависит
+
+    Returns:
+        bytes: Текст JSON в кодировке UTF-8
+    """
+    if _backend == 'orjson':
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if _backend == 'msgspec':
+        data = _msgspec_encoder.encode(obj)
+        return msgspec.json.format(data, indent=4) if pretty else data
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=4).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_vacancies(data, convert) -> list[Vacancy]:
+    """Разбирает JSON-массив вакансий в формате Vacancy.to_dict().
+
+    С msgspec массив разбирается сразу в типизированные структуры
+    (VacancyRecord) без промежуточных словарей. Если структура записей не
+    совпадает с ожидаемой (или msgspec не выбран), массив разбирается в
+    словари, и каждая запись преобразуется функцией convert.
+
+    Args:
+        data (bytes | str): Текст JSON
+        convert: Функция convert(item: dict) -> Vacancy | None; None - запись пропускается
+
+    Returns:
+        list[Vacancy]: Вакансии
+
+    Raises:
+        DecodeError: Если данные - не корректный JSON или не массив
+    """
+    if _backend == 'msgspec':
+        try:
+            records = msgspec.json.decode(data, type=list[VacancyRecord])
+        except msgspec.ValidationError:
+            pass
+        except msgspec.DecodeError as e:
+            raise DecodeError(str(e), '', 0) from None
+        else:
+            return [record.to_vacancy() for record in records]
+    items = loads(data)
+    if not isinstance(items, list):
+        raise DecodeError("Ожидался JSON-массив", '', 0)
+    vacancies = []
+    for item in items:
+        vacancy = convert(item)
+        if vacancy is not None:
+            vacancies.append(vacancy)
+    return vacancies
+
+
+def _load_msgspec() -> None:
+    """Импортирует msgspec и создает кодировщики и структуры записей при первом выборе реализации."""
+    global msgspec, _msgspec_encoder, _msgspec_decoder, SalaryRecord, VacancyRecord
+    if msgspec is not None:
+        return
+    import msgspec as module
+
+    class SalaryRecord(module.Struct):
+        """Зарплата в сохраненной вакансии; отсутствующие ключи - UNSET."""
+
+        from_: int | float | None | module.UnsetType = module.field(name='from', default=module.UNSET)
+        to: int | float | None | module.UnsetType = module.UNSET
+        currency: str | None | module.UnsetType = module.UNSET
+
+        def to_dict(self) -> dict:
+            """Возвращает зарплату так же, как ее нормализует загрузка JsonSaver (_vacancy_from_dict).
+
+            Пустой словарь остается пустым, а отсутствующие ключи непустого
+            словаря получают значения 0, 0 и 'RUB'.
+            """
+            values = (self.from_, self.to, self.currency)
+            if all(value is msgspec.UNSET for value in values):
+                return {}
+            return {key: default if value is msgspec.UNSET else value
+                    for key, value, default in zip(('from', 'to', 'currency'), values, (0, 0, 'RUB'))}
+
+    class VacancyRecord(module.Struct):
+        """Вакансия в формате Vacancy.to_dict() для типизированного разбора msgspec."""
+
+        name: str
+        url: str
+        requirements: str | None = ''
+        salary: SalaryRecord | int | float | None = None
+        employer: str | None = ''
+
+        def to_vacancy(self) -> Vacancy:
+            salary = self.salary
+            if isinstance(salary, SalaryRecord):
+                # Типы полей зарплаты уже проверены msgspec при разборе
+                salary = salary.to_dict()
+                return Vacancy.from_trusted(self.name, self.requirements, self.url, salary, self.employer)
+            return Vacancy(name=self.name, requirements=self.requirements, url=self.url,
+                           salary=salary, employer=self.employer)
+
+    _msgspec_encoder = module.json.Encoder()
+    _msgspec_decoder = module.json.Decoder()
+    msgspec = module
+
+
+_backend = os.environ.get('HH_JSON_BACKEND') or available_backends()[0]
+if _backend not in available_backends():
+    _backend = 'json'
+if _backend == 'msgspec':
+    _load_msgspec()
@@ -0,0 +1,71 @@
+import json
+
+# Курсы валют HeadHunter к рублю по умолчанию (рублей за единицу валюты).
+# Используются для сравнения зарплат в разных валютах; для точных расчетов
+# таблицу следует обновлять через set_rates/load_rates.
+DEFAULT_RATES = {
+    'RUR': 1.0,
+    'RUB': 1.0,
+    'USD': 90.0,
+    'EUR': 98.0,
+    'KZT': 0.19,
+    'BYR': 28.0,
+    'UAH': 2.2,
+    'UZS': 0.0072,
+    'AZN': 53.0,
+    'GEL': 33.0,
+    'KGS': 1.03,
+}
+
+_rates = dict(DEFAULT_RATES)
+
+
+def get_rates() -> dict:
+    """Возвращает копию текущей таблицы курсов.
+
+    Returns:
+        dict: Курсы валют к рублю вида {код: курс}
+    """
+    return dict(_rates)
+
+
+def set_rates(rates: dict, replace: bool = False) -> None:
+    """Обновляет таблицу курсов.
+
+    Новые курсы применяются к вакансиям, созданным после вызова.
+
+    Args:
+        rates (dict): Курсы валют к рублю вида {код: курс}
+        replace (bool): Заменить таблицу целиком вместо обновления
+    """
+    if replace:
+        _rates.clear()
+    _rates.update({code.upper(): float(rate) for code, rate in rates.items()})
+
+
+def load_rates(path: str, replace: bool = False) -> None:
+    """Загружает таблицу курсов из JSON-файла вида {"USD": 90.0, ...}.
+
+    Args:
+        path (str): Путь к файлу
+        replace (bool): Заменить таблицу целиком вместо обновления
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        set_rates(json.load(file), replace=replace)
+
+
+def to_rub(amount, currency) -> int:
+    """Переводит сумму в рубли.
+
+    Сумма без валюты или в неизвестной валюте считается рублевой.
+
+    Args:
+        amount (int | float): Сумма
+        currency (str | None): Код валюты HeadHunter (RUR, USD, KZT, ...)
+
+    Returns:
+        int: Сумма в рублях
+    """
+    if not currency:
+        return int(amount)
+    return int(amount * _rates.get(currency.upper(), 1.0))
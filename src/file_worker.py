@@ -1,5 +1,11 @@
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 import json
+import os
+import shutil
+import tempfile
+from src import codec, metrics
+from src.store import VacancyStore
 from src.vacancy import Vacancy
 
 class Saver(ABC):
@@ -16,62 +22,137 @@ class Saver(ABC):
         pass
 
 class JsonSaver(Saver):
+    @metrics.timed('hh_store_seconds', operation='load')
     def load_from_file(self) -> list[Vacancy]:
         """
         Загружает и валидирует вакансии из JSON-файла
+
+        Файл читается целиком и разбирается через src/codec.py (orjson или
+        msgspec, если установлены), что быстрее потокового разбора.
         
         Returns:
-            list[Vacancy]: Список валидных объектов Vacancy
-        
-        Raises:
-            FileNotFoundError: Если файл не существует
+            list[Vacancy]: Список валидных объектов Vacancy (пустой, если файл
+            отсутствует или поврежден)
         """
         try:
-            with open(self.__file__, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.__file__, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return []
+        if not data.strip():
+            return []
+        try:
+            vacancies = codec.decode_vacancies(data, self._convert)
+        except codec.DecodeError:
             return []
+        metrics.inc('hh_store_loaded_vacancies_total', len(vacancies))
+        return vacancies
 
-        validated_vacancies = []
-        for item in data:
-            try:
-                # Валидация обязательных полей
-                if not all(key in item for key in ('name', 'url')):
-                    raise ValueError("Отсутствуют обязательные поля")
-                
-                # Нормализация данных о зарплате
-                salary = item.get('salary')
-                if salary and isinstance(salary, dict):
-                    salary = {
-                        'from': salary.get('from', 0),
-                        'to': salary.get('to', 0),
-                        'currency': salary.get('currency', 'RUB')
-                    }
-
-                validated_vacancies.append(Vacancy(
-                    name=item['name'],
-                    requirements=item.get('requirements', ''),
-                    url=item['url'],
-                    salary=salary,
-                    employer=item.get('employer', '')
-                ))
-            except (KeyError, ValueError, TypeError) as e:
-                print(f"Ошибка валидации: {str(e)}")
-        
-        return validated_vacancies
+    def iter_from_file(self):
+        """
+        Построчно читает JSON-файл и по одной выдает валидные вакансии
+
+        Файл разбирается инкрементально, поэтому первые вакансии доступны сразу,
+        а расход памяти не зависит от размера файла. Невалидные записи
+        пропускаются с сообщением об ошибке. У orjson и msgspec нет
+        инкрементального разбора, поэтому здесь используется json из
+        стандартной библиотеки.
+
+        Yields:
+            Vacancy: Очередная валидная вакансия
+
+        Raises:
+            json.JSONDecodeError: Если файл поврежден (после уже выданных вакансий)
+        """
+        try:
+            file = open(self.__file__, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with file:
+            convert = self._convert
+            for item in iter_json_array(file):
+                vacancy = convert(item)
+                if vacancy is not None:
+                    yield vacancy
         
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, compact: bool = False, lazy: bool = False, trusted: bool = False):
         """
         Инициализирует объект для работы с JSON-файлом
         
         Args:
             filename (str): Путь к файлу для сохранения вакансий
+            compact (bool): Сохранять JSON без отступов и лишних пробелов
+            lazy (bool): Не загружать файл при создании; вакансии загружаются в
+                память при первом обращении к хранилищу, а filter_vacancies и
+                iter_vacancies до этого читают файл потоково
+            trusted (bool): Не проверять записи при загрузке (файл записан этим
+                же хранилищем); ускоряет загрузку больших файлов, но поврежденная
+                запись вызывает исключение вместо пропуска
         """
         self.__file__ = filename
+        self.compact = compact
+        self.trusted = trusted
+        self._batch_depth = 0
+        self._dirty = False
+        self._loaded_store = None
         # Создаем файл если не существует
         open(filename, 'a+', encoding='utf-8').close()
-        self.vacancies = self.load_from_file()
+        if not lazy:
+            self._loaded_store = VacancyStore(self.load_from_file())
+
+    def _convert(self, item: dict):
+        """Создает вакансию из сохраненного словаря (без проверки, если trusted)"""
+        if self.trusted:
+            return Vacancy.from_trusted(item['name'], item.get('requirements', ''), item['url'],
+                                        item.get('salary'), item.get('employer'))
+        return _validated_vacancy(item)
+
+    @property
+    def _store(self) -> VacancyStore:
+        """Индексированное хранилище вакансий (загружается при первом обращении)"""
+        if self._loaded_store is None:
+            self._loaded_store = VacancyStore(self.load_from_file())
+        return self._loaded_store
+
+    @property
+    def vacancies(self) -> list[Vacancy]:
+        """Копия списка вакансий хранилища в порядке добавления
+
+        Вакансии хранятся в индексированном VacancyStore, поэтому изменение
+        возвращаемого списка (append, remove) не изменяет хранилище - для этого
+        есть add_vacancy/delete_vacancy и их пакетные варианты. Каждое обращение
+        создает новый список (O(n)); для перебора без копирования используйте
+        iter_vacancies().
+        """
+        return list(self._store)
+
+    @vacancies.setter
+    def vacancies(self, vacancies) -> None:
+        """Заменяет содержимое хранилища и записывает файл"""
+        self._loaded_store = VacancyStore(vacancies)
+        self._save_to_file()
+
+    def iter_vacancies(self, criteria=None):
+        """
+        Перебирает вакансии, подходящие под критерий
+
+        Если хранилище еще не загружено, вакансии читаются из файла потоково.
+
+        Args:
+            criteria (optional): Функция-критерий для фильтрации вакансий
 
+        Yields:
+            Vacancy: Очередная подходящая вакансия
+        """
+        if self._loaded_store is not None:
+            source = self._loaded_store
+        else:
+            source = self.iter_from_file()
+        for vacancy in source:
+            if criteria is None or criteria(vacancy):
+                yield vacancy
+
+    @metrics.timed('hh_store_seconds', operation='add')
     def add_vacancy(self, vacancy: Vacancy) -> None:
         """
         Добавляет вакансию в хранилище
@@ -79,12 +160,12 @@ class JsonSaver(Saver):
         Args:
             vacancy (Vacancy): Объект вакансии для добавления
         """
-        if vacancy in self.vacancies:
+        if not self._store.add(vacancy):
             # Пропускаем существующие вакансии вместо вызова исключения
             return
-        self.vacancies.append(vacancy)
         self._save_to_file()
 
+    @metrics.timed('hh_store_seconds', operation='delete')
     def delete_vacancy(self, vacancy: Vacancy) -> None:
         """
         Удаляет вакансию из хранилища
@@ -92,9 +173,142 @@ class JsonSaver(Saver):
         Args:
             vacancy (Vacancy): Объект вакансии для удаления
         """
-        self.vacancies = [v for v in self.vacancies if v.url != vacancy.url]
+        if self._store.remove(vacancy.url) is None:
+            return
         self._save_to_file()
 
+    @metrics.timed('hh_store_seconds', operation='add_many')
+    def add_vacancies(self, vacancies) -> int:
+        """
+        Добавляет несколько вакансий с одной записью файла
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для добавления
+
+        Returns:
+            int: Количество добавленных вакансий (существующие пропускаются)
+        """
+        added = sum(1 for vacancy in vacancies if self._store.add(vacancy))
+        if added:
+            self._save_to_file()
+        return added
+
+    @metrics.timed('hh_store_seconds', operation='upsert')
+    def upsert_vacancies(self, vacancies) -> tuple[int, int]:
+        """
+        Добавляет новые и заменяет измененные вакансии (по ссылке) с одной записью файла
+
+        Измененная вакансия перемещается в конец хранилища, как только что добавленная.
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для добавления или обновления
+
+        Returns:
+            tuple[int, int]: Количество добавленных и обновленных вакансий
+        """
+        added = updated = 0
+        for vacancy in vacancies:
+            current = self._store.get(vacancy.url)
+            if current is None:
+                added += 1
+            elif current.to_dict() != vacancy.to_dict():
+                self._store.remove(vacancy.url)
+                updated += 1
+            else:
+                continue
+            self._store.add(vacancy)
+        if added or updated:
+            self._save_to_file()
+        return added, updated
+
+    @metrics.timed('hh_store_seconds', operation='delete_many')
+    def delete_vacancies(self, vacancies) -> int:
+        """
+        Удаляет несколько вакансий с одной записью файла
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для удаления
+
+        Returns:
+            int: Количество удаленных вакансий
+        """
+        deleted = sum(1 for vacancy in vacancies if self._store.remove(vacancy.url) is not None)
+        if deleted:
+            self._save_to_file()
+        return deleted
+
+    @contextmanager
+    def batch(self):
+        """
+        Контекст пакетного изменения: внутри него add/delete не пишут файл,
+        изменения сохраняются один раз при выходе из внешнего контекста
+
+        Пример:
+            with saver.batch():
+                for vacancy in vacancies:
+                    saver.add_vacancy(vacancy)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._save_to_file()
+
+    def get_vacancy(self, url: str):
+        """
+        Возвращает вакансию по ссылке
+
+        Args:
+            url (str): Ссылка на вакансию
+
+        Returns:
+            Vacancy | None: Найденная вакансия или None
+        """
+        return self._store.get(url)
+
+    @metrics.timed('hh_store_seconds', operation='find')
+    def find_vacancies(self, query, mode: str = 'and') -> list[Vacancy]:
+        """
+        Ищет вакансии по словам названия и требований через инвертированный индекс
+
+        Args:
+            query (str | Iterable[str]): Ключевые слова; слова в двойных кавычках - фраза
+            mode (str): 'and' - все слова запроса, 'or' - хотя бы одно
+
+        Returns:
+            list[Vacancy]: Найденные вакансии
+        """
+        return self._store.search(query, mode)
+
+    def get_vacancies_by_employer(self, employer: str) -> list[Vacancy]:
+        """
+        Возвращает вакансии работодателя
+
+        Args:
+            employer (str): Название работодателя
+
+        Returns:
+            list[Vacancy]: Вакансии работодателя
+        """
+        return self._store.by_employer(employer)
+
+    @metrics.timed('hh_store_seconds', operation='by_salary')
+    def get_vacancies_by_salary(self, min_salary: int, max_salary: int) -> list[Vacancy]:
+        """
+        Возвращает вакансии с зарплатой в рублях (Vacancy.salary_max) в заданном диапазоне
+
+        Args:
+            min_salary (int): Нижняя граница зарплаты
+            max_salary (int): Верхняя граница зарплаты
+
+        Returns:
+            list[Vacancy]: Подходящие вакансии
+        """
+        return self._store.by_salary(min_salary, max_salary)
+
+    @metrics.timed('hh_store_seconds', operation='filter')
     def filter_vacancies(self, criteria) -> list[Vacancy]:
         """
         Фильтрует вакансии по заданному критерию
@@ -105,12 +319,368 @@ class JsonSaver(Saver):
         Returns:
             list[Vacancy]: Отфильтрованный список вакансий
         """
-        return [v for v in self.vacancies if criteria(v)]
+        return list(self.iter_vacancies(criteria))
         
+    @metrics.timed('hh_store_seconds', operation='save')
     def _save_to_file(self) -> None:
         """
         Сохраняет вакансии в JSON-файл
+
+        Внутри batch() запись откладывается до выхода из контекста. Файл
+        записывается атомарно: данные пишутся во временный файл рядом с
+        исходным, который затем заменяет его.
+        """
+        if self._batch_depth:
+            self._dirty = True
+            return
+        vacancies_data = [vacancy.to_dict() for vacancy in self._store]
+        with atomic_open(self.__file__, 'wb') as file:
+            file.write(codec.dumps(vacancies_data, pretty=not self.compact))
+        self._dirty = False
+
+
+class JsonLinesSaver(Saver):
+    """
+    Хранилище вакансий в формате JSON Lines с записью только в конец файла
+
+    Каждая строка файла - вакансия в виде JSON-объекта или отметка об удалении
+    вида {"deleted": "<ссылка>"}. Добавление и удаление дописывают строки в
+    конец файла, не перезаписывая его. Когда доля устаревших строк превышает
+    compact_threshold, файл переписывается только с актуальными вакансиями
+    (compact()). При загрузке файл читается построчно.
+    """
+
+    def __init__(self, filename: str, compact_threshold: float = 0.5, min_garbage: int = 1000):
+        """
+        Инициализирует объект для работы с файлом JSON Lines
+
+        Args:
+            filename (str): Путь к файлу для сохранения вакансий
+            compact_threshold (float): Доля устаревших строк, после которой файл сжимается
+            min_garbage (int): Минимальное количество устаревших строк для сжатия
+        """
+        self.__file__ = filename
+        self.compact_threshold = compact_threshold
+        self.min_garbage = min_garbage
+        open(filename, 'a+', encoding='utf-8').close()
+        self._store = VacancyStore()
+        self._lines = 0
+        self._replay()
+
+    @property
+    def vacancies(self) -> list[Vacancy]:
+        """Копия списка вакансий хранилища в порядке добавления
+
+        Вакансии хранятся в индексированном VacancyStore, поэтому изменение
+        возвращаемого списка (append, remove) не изменяет хранилище - для этого
+        есть add_vacancy/delete_vacancy и их пакетные варианты. Каждое обращение
+        создает новый список (O(n)).
+        """
+        return list(self._store)
+
+    @vacancies.setter
+    def vacancies(self, vacancies) -> None:
+        """Заменяет содержимое хранилища и переписывает файл (compact)"""
+        self._store = VacancyStore(vacancies)
+        self.compact()
+
+    @property
+    def garbage(self) -> int:
+        """Количество строк файла, не относящихся к актуальным вакансиям"""
+        return self._lines - len(self._store)
+
+    def load_from_file(self) -> list[Vacancy]:
+        """
+        Перечитывает файл и возвращает актуальные вакансии
+
+        Returns:
+            list[Vacancy]: Список валидных объектов Vacancy
+        """
+        self._replay()
+        return self.vacancies
+
+    def _replay(self) -> None:
+        """Построчно воспроизводит журнал изменений из файла"""
+        store = VacancyStore()
+        lines = 0
+        with open(self.__file__, 'rb') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                lines += 1
+                try:
+                    record = codec.loads(line)
+                    if 'deleted' in record:
+                        store.remove(record['deleted'])
+                        continue
+                    vacancy = _vacancy_from_dict(record)
+                except (KeyError, ValueError, TypeError) as e:
+                    # codec.DecodeError - подкласс ValueError (например, недописанная строка)
+                    print(f"Ошибка валидации: {str(e)}")
+                    continue
+                # Более поздняя запись для той же ссылки заменяет предыдущую
+                store.remove(vacancy.url)
+                store.add(vacancy)
+        self._store = store
+        self._lines = lines
+
+    def _append(self, records: list[dict]) -> None:
+        """Дописывает записи в конец файла"""
+        if not records:
+            return
+        with open(self.__file__, 'ab') as file:
+            file.writelines(codec.dumps(record) + b'\n' for record in records)
+        self._lines += len(records)
+        self._maybe_compact()
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в хранилище (существующие вакансии пропускаются)
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для добавления
+        """
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies) -> int:
+        """
+        Добавляет несколько вакансий одной записью в файл
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для добавления
+
+        Returns:
+            int: Количество добавленных вакансий
+        """
+        records = [vacancy.to_dict() for vacancy in vacancies if self._store.add(vacancy)]
+        self._append(records)
+        return len(records)
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Удаляет вакансию из хранилища
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для удаления
+        """
+        self.delete_vacancies([vacancy])
+
+    def delete_vacancies(self, vacancies) -> int:
+        """
+        Удаляет несколько вакансий одной записью в файл
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для удаления
+
+        Returns:
+            int: Количество удаленных вакансий
+        """
+        records = [{'deleted': vacancy.url} for vacancy in vacancies
+                   if self._store.remove(vacancy.url) is not None]
+        self._append(records)
+        return len(records)
+
+    def get_vacancy(self, url: str):
+        """
+        Возвращает вакансию по ссылке
+
+        Args:
+            url (str): Ссылка на вакансию
+
+        Returns:
+            Vacancy | None: Найденная вакансия или None
+        """
+        return self._store.get(url)
+
+    def find_vacancies(self, query, mode: str = 'and') -> list[Vacancy]:
         """
-        vacancies_data = [vacancy.to_dict() for vacancy in self.vacancies]
-        with open(self.__file__, "w", encoding="utf-8") as file:
-            json.dump(vacancies_data, file, ensure_ascii=False, indent=4)
\ No newline at end of file
+        Ищет вакансии по словам названия и требований через инвертированный индекс
+
+        Args:
+            query (str | Iterable[str]): Ключевые слова; слова в двойных кавычках - фраза
+            mode (str): 'and' - все слова запроса, 'or' - хотя бы одно
+
+        Returns:
+            list[Vacancy]: Найденные вакансии
+        """
+        return self._store.search(query, mode)
+
+    def filter_vacancies(self, criteria) -> list[Vacancy]:
+        """
+        Фильтрует вакансии по заданному критерию
+
+        Args:
+            criteria: Функция-критерий для фильтрации вакансий
+
+        Returns:
+            list[Vacancy]: Отфильтрованный список вакансий
+        """
+        return [v for v in self._store if criteria(v)]
+
+    def compact(self) -> None:
+        """Переписывает файл, оставляя только актуальные вакансии"""
+        with atomic_open(self.__file__, 'wb') as file:
+            file.writelines(codec.dumps(vacancy.to_dict()) + b'\n' for vacancy in self._store)
+        self._lines = len(self._store)
+
+    def _maybe_compact(self) -> None:
+        garbage = self.garbage
+        if garbage >= self.min_garbage and garbage > self.compact_threshold * self._lines:
+            self.compact()
+
+
+def _vacancy_from_dict(item: dict) -> Vacancy:
+    """
+    Создает вакансию из сохраненного словаря с валидацией и нормализацией
+
+    Args:
+        item (dict): Данные вакансии в формате Vacancy.to_dict()
+
+    Returns:
+        Vacancy: Объект вакансии
+
+    Raises:
+        ValueError: Если отсутствуют обязательные поля или зарплата некорректна
+    """
+    # Валидация обязательных полей
+    if not all(key in item for key in ('name', 'url')):
+        raise ValueError("Отсутствуют обязательные поля")
+
+    # Нормализация данных о зарплате
+    salary = item.get('salary')
+    if salary and isinstance(salary, dict):
+        salary = {
+            'from': salary.get('from', 0),
+            'to': salary.get('to', 0),
+            'currency': salary.get('currency', 'RUB')
+        }
+
+    return Vacancy(
+        name=item['name'],
+        requirements=item.get('requirements', ''),
+        url=item['url'],
+        salary=salary,
+        employer=item.get('employer', '')
+    )
+
+
+def _validated_vacancy(item: dict):
+    """
+    Создает вакансию из сохраненного словаря; невалидная запись пропускается с сообщением
+
+    Args:
+        item (dict): Данные вакансии в формате Vacancy.to_dict()
+
+    Returns:
+        Vacancy | None: Объект вакансии или None, если запись невалидна
+    """
+    try:
+        return _vacancy_from_dict(item)
+    except (KeyError, ValueError, TypeError) as e:
+        print(f"Ошибка валидации: {str(e)}")
+        return None
+
+
+# Символы, которыми может завершаться элемент JSON-массива
+_VALUE_END = frozenset(' \t\n\r,]')
+
+
+def iter_json_array(file, chunk_size: int = 64 * 1024):
+    """
+    Инкрементально разбирает JSON-массив из файла и выдает его элементы
+
+    Файл читается блоками по chunk_size символов; в памяти одновременно
+    находятся только текущий блок и разбираемый элемент.
+
+    Args:
+        file: Открытый текстовый файл
+        chunk_size (int): Размер блока чтения
+
+    Yields:
+        Очередной элемент массива
+
+    Raises:
+        json.JSONDecodeError: Если содержимое файла - не корректный JSON-массив
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = file.read(chunk_size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\n\r':
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            fill()
+
+    skip_whitespace()
+    if pos >= len(buffer):
+        return  # Пустой файл
+    if buffer[pos] != '[':
+        raise json.JSONDecodeError("Ожидался JSON-массив", buffer, pos)
+    pos += 1
+
+    expect_value = True  # Ожидается первый элемент или закрывающая скобка
+    while True:
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise json.JSONDecodeError("Незавершенный JSON-массив", buffer, pos)
+        char = buffer[pos]
+        if char == ']':
+            return
+        if not expect_value:
+            if char != ',':
+                raise json.JSONDecodeError("Ожидалась запятая", buffer, pos)
+            pos += 1
+            skip_whitespace()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            if not eof and (end == len(buffer) or buffer[end] not in _VALUE_END):
+                # Число могло оборваться на границе блока ("1." из "1.5") - дочитываем
+                fill()
+                continue
+            break
+        pos = end
+        expect_value = False
+        yield item
+
+
+@contextmanager
+def atomic_open(filename, mode: str = 'w'):
+    """
+    Открывает временный файл для записи и атомарно заменяет им filename
+
+    Если запись прервана исключением, исходный файл не изменяется.
+
+    Args:
+        filename: Путь к заменяемому файлу
+        mode (str): Режим открытия временного файла: 'w' (текст UTF-8) или 'wb'
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.splitext(filename)[1])
+    try:
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else 'utf-8') as file:
+            yield file
+        if os.path.exists(filename):
+            shutil.copymode(filename, tmp_path)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -1,14 +1,23 @@
-import requests
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING
+from src import metrics
+from src.rate_limit import get_rate_limiter
+from src.session import fetch_json, get_session
 from src.vacancy import Vacancy
 
+if TYPE_CHECKING:
+    import requests
+
 
 class Parser(ABC):
     """Базовый класс для парсеров вакансий"""
-    
+
     def __init__(self, file_worker):
         self.file_worker = file_worker
-        
+
     @abstractmethod
     def load_vacancies(self, keyword):
         """Загружает вакансии по ключевому слову"""
@@ -21,25 +30,183 @@ class HH(Parser):
     Класс Parser является родительским классом, который вам необходимо реализовать
     """
 
-    def __init__(self, file_worker):
+    def __init__(self, file_worker, max_workers: int = 4, max_pages: int = 20,
+                 session: 'requests.Session' = None, cache=None, limiter=None):
+        """
+        Args:
+            file_worker: Объект для сохранения вакансий
+            max_workers (int): Максимальное количество одновременных запросов страниц
+            max_pages (int): Максимальное количество страниц выдачи (API отдает не более 2000 вакансий)
+            session (requests.Session, optional): HTTP-сессия; по умолчанию общая сессия
+                с пулом соединений и повторами (см. src/session.py)
+            cache (ResponseCache, optional): Дисковый кэш ответов (см. src/cache.py)
+            limiter (RateLimiter, optional): Ограничитель частоты запросов; по умолчанию
+                общий для всех коннекторов (см. src/rate_limit.py)
+        """
         self.url = 'https://api.hh.ru/vacancies'
         self.headers = {'User-Agent': 'HH-User-Agent'}
         self.params = {'text': '', 'page': 0, 'per_page': 100}
         self.vacancies = []
+        self.max_workers = max_workers
+        self.max_pages = max_pages
+        self.session = session or get_session()
+        self.cache = cache
+        self.limiter = limiter or get_rate_limiter()
         super().__init__(file_worker)
 
+    @metrics.timed('hh_connector_seconds', connector='HH', method='load_vacancies')
     def load_vacancies(self, keyword):
+        """Загружает вакансии по ключевому слову со всех страниц выдачи.
+
+        Первая страница запрашивается сразу, чтобы узнать количество страниц
+        (`pages`/`found`), остальные загружаются параллельно в пуле из
+        `max_workers` потоков. Вакансии добавляются в порядке страниц.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+        """
         self.params['text'] = keyword
-        for _ in range(20):
-            response = requests.get(self.url, headers=self.headers, params=self.params)
-            response.raise_for_status()
-            data = response.json()
-            for item in data['items']:
-                salary = item.get('salary')
-                self.vacancies.append(Vacancy(
-                    name=item['name'],
-                    url=item['alternate_url'],
-                    salary=salary['from'] if salary else 0,
-                    requirements=item['snippet']['requirement'],
-                ))
-            self.params['page'] += 1
\ No newline at end of file
+        self.params['page'] = 0
+        pages = self._fetch_pages()
+        for data in pages:
+            self.vacancies.extend(self._parse_items(data.get('items', [])))
+
+    @metrics.timed('hh_connector_seconds', connector='HH', method='fetch_items')
+    def fetch_items(self, keyword, **params) -> list[dict]:
+        """Загружает вакансии со всех страниц выдачи без преобразования в Vacancy.
+
+        В отличие от load_vacancies, не изменяет self.params и self.vacancies.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            **params: Дополнительные параметры запроса (например, date_from, order_by)
+
+        Returns:
+            list[dict]: Вакансии из поля `items` ответов API в порядке страниц
+        """
+        return self.search(keyword, **params)['items']
+
+    def search(self, keyword, **params) -> dict:
+        """Загружает вакансии со всех страниц выдачи вместе с размером выдачи.
+
+        API отдает не более `max_pages` страниц, поэтому found может быть
+        больше количества загруженных вакансий - так вызывающий код узнает,
+        что выдача обрезана (см. IncrementalSync).
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            **params: Дополнительные параметры запроса (например, date_from, date_to, order_by)
+
+        Returns:
+            dict: {'items': вакансии в порядке страниц, 'found': количество найденных вакансий
+            (None, если API его не вернул)}
+        """
+        items = []
+        found = None
+        for data in self.iter_pages(keyword, **params):
+            if found is None:
+                found = data.get('found')
+            items.extend(data.get('items', []))
+        return {'items': items, 'found': found}
+
+    def iter_pages(self, keyword, **params):
+        """Выдает страницы выдачи по мере загрузки, в порядке номеров.
+
+        После первой страницы одновременно загружается не более `max_workers`
+        следующих, поэтому в памяти находится ограниченное число страниц, а
+        обработка уже полученных идет параллельно с загрузкой остальных.
+        Если перебор прерван, еще не начатые запросы отменяются.
+
+        Args:
+            keyword (str): Ключевое слово для поиска
+            **params: Дополнительные параметры запроса (например, date_from, order_by)
+
+        Yields:
+            dict: Ответ API для очередной страницы
+        """
+        query = {**self.params, **params, 'text': keyword, 'page': 0}
+        first = self._fetch_page(0, query)
+        yield first
+        total_pages = self._count_pages(first)
+        if total_pages <= 1:
+            return
+
+        pages = iter(range(1, total_pages))
+        workers = max(1, min(self.max_workers, total_pages - 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(executor.submit(self._fetch_page, page, query) for page in islice(pages, workers))
+            try:
+                while pending:
+                    data = pending.popleft().result()
+                    page = next(pages, None)
+                    if page is not None:
+                        pending.append(executor.submit(self._fetch_page, page, query))
+                    yield data
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _fetch_pages(self, params: dict = None) -> list[dict]:
+        """Загружает все страницы выдачи.
+
+        Args:
+            params (dict, optional): Параметры запроса; по умолчанию текущие self.params
+
+        Returns:
+            list[dict]: Ответы API, упорядоченные по номеру страницы
+        """
+        params = params or self.params
+        first = self._fetch_page(0, params)
+        total_pages = self._count_pages(first)
+        if total_pages <= 1:
+            return [first]
+
+        workers = max(1, min(self.max_workers, total_pages - 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # executor.map возвращает результаты в порядке номеров страниц
+            rest = list(executor.map(lambda page: self._fetch_page(page, params), range(1, total_pages)))
+        return [first, *rest]
+
+    def _count_pages(self, data: dict) -> int:
+        """Определяет количество страниц для загрузки по первому ответу API.
+
+        Args:
+            data (dict): Ответ API для первой страницы
+
+        Returns:
+            int: Количество страниц с учетом ограничения `max_pages`
+        """
+        pages = data.get('pages')
+        if pages is None:
+            found = data.get('found', 0) or 0
+            per_page = self.params['per_page']
+            pages = (found + per_page - 1) // per_page
+        return max(1, min(pages, self.max_pages))
+
+    def _fetch_page(self, page: int, params: dict = None) -> dict:
+        """Запрашивает одну страницу выдачи.
+
+        Параметры копируются, поэтому метод безопасно вызывать из нескольких потоков.
+
+        Args:
+            page (int): Номер страницы (с нуля)
+            params (dict, optional): Параметры запроса; по умолчанию текущие self.params
+
+        Returns:
+            dict: Ответ API
+        """
+        params = {**(params or self.params), 'page': page}
+        return fetch_json(self.session, self.url, params=params, headers=self.headers,
+                          cache=self.cache, limiter=self.limiter)
+
+    @staticmethod
+    def _parse_items(items: list[dict]) -> list[Vacancy]:
+        """Преобразует вакансии из ответа API в объекты Vacancy.
+
+        Args:
+            items (list[dict]): Вакансии из поля `items` ответа API
+
+        Returns:
+            list[Vacancy]: Список объектов Vacancy
+        """
+        return Vacancy.from_api_batch(items)
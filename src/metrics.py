@@ -0,0 +1,274 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Границы корзин гистограмм времени (секунды)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+# Значения HH_METRICS, которые только включают сбор без записи файла при выходе
+_FLAGS = ('1', 'true', 'yes', 'on')
+
+
+class Registry:
+    """Хранилище счетчиков и гистограмм.
+
+    Метрика определяется именем и набором меток; значения изменяются под
+    блокировкой, поэтому реестр можно использовать из нескольких потоков.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets (tuple[float]): Верхние границы корзин гистограмм (последняя - inf)
+        """
+        self.buckets = tuple(buckets)
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, labels: dict = None) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: dict = None) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram['counts'][position] += 1
+                    break
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_json(self) -> dict:
+        """Возвращает значения метрик в виде словаря.
+
+        Returns:
+            dict: {'counters': {имя: [{labels, value}]}, 'histograms': {имя: [{labels, count, sum, buckets}]}};
+            buckets - накопленные количества наблюдений по верхним границам корзин
+        """
+        with self._lock:
+            counters = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                counters.setdefault(name, []).append({'labels': dict(labels), 'value': value})
+            histograms = {}
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                histograms.setdefault(name, []).append({
+                    'labels': dict(labels),
+                    'count': histogram['count'],
+                    'sum': histogram['sum'],
+                    'buckets': dict(zip(map(_format_bound, self.buckets), _cumulative(histogram['counts']))),
+                })
+        return {'counters': counters, 'histograms': histograms}
+
+    def to_prometheus(self) -> str:
+        """Возвращает значения метрик в текстовом формате Prometheus (для node_exporter textfile)."""
+        data = self.to_json()
+        lines = []
+        for name, series in data['counters'].items():
+            lines.append(f'# TYPE {name} counter')
+            lines.extend(f"{name}{_format_labels(item['labels'])} {_format_value(item['value'])}" for item in series)
+        for name, series in data['histograms'].items():
+            lines.append(f'# TYPE {name} histogram')
+            for item in series:
+                for bound, count in item['buckets'].items():
+                    labels = _format_labels({**item['labels'], 'le': bound})
+                    lines.append(f'{name}_bucket{labels} {count}')
+                labels = _format_labels(item['labels'])
+                lines.append(f"{name}_sum{labels} {_format_value(item['sum'])}")
+                lines.append(f"{name}_count{labels} {item['count']}")
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+_registry = Registry()
+_enabled = False
+_output = None
+
+
+def enabled() -> bool:
+    """Возвращает True, если сбор метрик включен."""
+    return _enabled
+
+
+def enable(output: str = None) -> None:
+    """Включает сбор метрик.
+
+    Args:
+        output (str, optional): Файл, в который метрики записываются при
+            завершении процесса (см. write)
+    """
+    global _enabled, _output
+    _enabled = True
+    if output:
+        if _output is None:
+            atexit.register(_write_output)
+        _output = output
+
+
+def disable() -> None:
+    """Выключает сбор метрик; накопленные значения сохраняются."""
+    global _enabled
+    _enabled = False
+
+
+def reset() -> None:
+    """Удаляет накопленные значения метрик."""
+    _registry.clear()
+
+
+def get_registry() -> Registry:
+    """Возвращает общий реестр метрик."""
+    return _registry
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    """Увеличивает счетчик (если сбор метрик включен).
+
+    Args:
+        name (str): Имя метрики (по соглашению Prometheus - с суффиксом _total)
+        value (float): Приращение
+        **labels: Метки метрики
+    """
+    if _enabled:
+        _registry.inc(name, value, labels)
+
+
+def observe(name: str, value: float, **labels) -> None:
+    """Добавляет наблюдение в гистограмму (если сбор метрик включен).
+
+    Args:
+        name (str): Имя метрики
+        value (float): Значение
+        **labels: Метки метрики
+    """
+    if _enabled:
+        _registry.observe(name, value, labels)
+
+
+def timer(name: str, **labels):
+    """Контекстный менеджер, записывающий время выполнения блока в гистограмму.
+
+    Если сбор метрик выключен, возвращается общий пустой контекст без замера.
+
+    Args:
+        name (str): Имя метрики (по соглашению Prometheus - с суффиксом _seconds)
+        **labels: Метки метрики
+    """
+    if not _enabled:
+        return _NOOP
+    return _timer(name, labels)
+
+
+def timed(name: str, **labels):
+    """Декоратор, записывающий время выполнения функции в гистограмму.
+
+    Пока сбор метрик выключен, к вызову добавляется только проверка флага.
+
+    Args:
+        name (str): Имя метрики
+        **labels: Метки метрики
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _registry.observe(name, time.perf_counter() - started, labels)
+        return wrapper
+    return decorate
+
+
+def export_json() -> dict:
+    """Возвращает накопленные метрики в виде словаря (см. Registry.to_json)."""
+    return _registry.to_json()
+
+
+def export_prometheus() -> str:
+    """Возвращает накопленные метрики в текстовом формате Prometheus."""
+    return _registry.to_prometheus()
+
+
+def write(filename) -> None:
+    """Записывает метрики в файл: JSON для расширения .json, иначе формат Prometheus.
+
+    Args:
+        filename: Путь к файлу
+    """
+    # Импорт здесь: file_worker сам использует метрики
+    from src.file_worker import atomic_open
+
+    if os.fspath(filename).endswith('.json'):
+        content = json.dumps(export_json(), ensure_ascii=False, indent=4)
+    else:
+        content = export_prometheus()
+    with atomic_open(filename) as file:
+        file.write(content)
+
+
+@contextmanager
+def _timer(name: str, labels: dict):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _registry.observe(name, time.perf_counter() - started, labels)
+
+
+def _write_output() -> None:
+    if _output:
+        write(_output)
+
+
+def _label_key(labels) -> tuple:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _cumulative(counts: list) -> list:
+    total = 0
+    result = []
+    for count in counts:
+        total += count
+        result.append(total)
+    return result
+
+
+def _format_bound(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else repr(bound)
+
+
+def _format_value(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+_NOOP = nullcontext()
+
+_environment = os.environ.get('HH_METRICS', '').strip()
+if _environment:
+    enable(None if _environment.lower() in _FLAGS else _environment)
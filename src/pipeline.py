@@ -0,0 +1,172 @@
+import threading
+from contextlib import nullcontext
+from queue import Queue
+
+from src.vacancy import Vacancy
+
+# Признак конца потока данных между стадиями
+_DONE = object()
+
+
+class VacancyPipeline:
+    """Потоковая загрузка вакансий: страницы API -> разбор -> проверка -> удаление повторов -> запись.
+
+    Каждая стадия работает в своем потоке и передает данные следующей через
+    очередь ограниченного размера (`queue_size` элементов - страниц или
+    пачек вакансий одной страницы). Если запись отстает, очереди заполняются
+    и источник страниц приостанавливается, поэтому в памяти одновременно
+    находится ограниченное число страниц, а разбор идет параллельно с
+    загрузкой следующих страниц.
+
+    Пример:
+        pipeline = VacancyPipeline(JsonSaver('vacancies.json'))
+        stats = pipeline.run(hh.iter_pages('python'))
+    """
+
+    def __init__(self, saver, queue_size: int = 4, batch_size: int = 500):
+        """
+        Args:
+            saver: Хранилище с методом add_vacancies
+            queue_size (int): Размер очередей между стадиями
+            batch_size (int): Количество вакансий в одной записи в хранилище
+        """
+        self.saver = saver
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self._error = None
+        self._seen = set()
+        self.stats = {}
+
+    def run(self, pages) -> dict:
+        """Пропускает страницы через все стадии и дожидается записи.
+
+        Вакансии без названия или ссылки и с некорректной зарплатой
+        пропускаются; повторы ссылок в рамках запуска отбрасываются. Если у
+        хранилища есть контекст batch() (JsonSaver), весь запуск выполняется
+        внутри него и файл записывается один раз.
+
+        Args:
+            pages (Iterable[dict]): Ответы API (например, HH.iter_pages(keyword))
+
+        Returns:
+            dict: Счетчики pages, items, invalid, duplicates, batches и added
+
+        Raises:
+            Exception: Первая ошибка источника или любой из стадий
+        """
+        self._error = None
+        self._seen = set()
+        self.stats = dict.fromkeys(('pages', 'items', 'invalid', 'duplicates', 'batches', 'added'), 0)
+        queues = [Queue(self.queue_size) for _ in range(4)]
+        stages = [
+            (self._parse, queues[0], queues[1]),
+            (self._validate, queues[1], queues[2]),
+            (self._dedupe, queues[2], queues[3]),
+        ]
+        threads = [threading.Thread(target=self._run_stage, args=stage, daemon=True) for stage in stages]
+        threads.append(threading.Thread(target=self._write, args=(queues[3],), daemon=True))
+        for thread in threads:
+            thread.start()
+        try:
+            for page in pages:
+                if self._error is not None:
+                    break
+                queues[0].put(page)
+        finally:
+            queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+        if self._error is not None:
+            raise self._error
+        return self.stats
+
+    def _run_stage(self, func, source: Queue, target: Queue) -> None:
+        """Применяет функцию стадии к элементам очереди до признака конца.
+
+        После ошибки элементы вычитываются без обработки, чтобы не блокировать
+        предыдущие стадии.
+        """
+        while True:
+            chunk = source.get()
+            if chunk is _DONE:
+                break
+            if self._error is not None:
+                continue
+            try:
+                result = func(chunk)
+            except Exception as e:
+                self._error = e
+                continue
+            if result:
+                target.put(result)
+        target.put(_DONE)
+
+    def _parse(self, page: dict) -> list[dict]:
+        """Извлекает вакансии из ответа API."""
+        self.stats['pages'] += 1
+        items = page.get('items') or []
+        self.stats['items'] += len(items)
+        return items
+
+    def _validate(self, items: list[dict]) -> list[Vacancy]:
+        """Создает объекты Vacancy, пропуская некорректные вакансии.
+
+        Страница проверяется одним вызовом Vacancy.from_api_batch; только если
+        он завершился ошибкой, вакансии страницы проверяются по одной, чтобы
+        пропустить некорректные.
+        """
+        try:
+            built = Vacancy.from_api_batch(items)
+        except (ValueError, TypeError, AttributeError):
+            built = [self._validate_item(item) for item in items]
+        vacancies = [vacancy for vacancy in built if vacancy is not None and vacancy.name and vacancy.url]
+        self.stats['invalid'] += len(items) - len(vacancies)
+        return vacancies
+
+    @staticmethod
+    def _validate_item(item: dict):
+        """Создает Vacancy из одной вакансии API или возвращает None, если она некорректна."""
+        try:
+            return Vacancy.from_api_batch([item])[0]
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+    def _dedupe(self, vacancies: list[Vacancy]) -> list[Vacancy]:
+        """Отбрасывает вакансии, ссылки которых уже встречались в этом запуске."""
+        unique = []
+        for vacancy in vacancies:
+            if vacancy.url in self._seen:
+                self.stats['duplicates'] += 1
+                continue
+            self._seen.add(vacancy.url)
+            unique.append(vacancy)
+        return unique
+
+    def _write(self, source: Queue) -> None:
+        """Накапливает вакансии и записывает их в хранилище пачками по batch_size."""
+        buffer = []
+        chunk = None
+        batch = getattr(self.saver, 'batch', None)
+        try:
+            with batch() if batch else nullcontext():
+                while True:
+                    chunk = source.get()
+                    if chunk is _DONE:
+                        break
+                    if self._error is not None:
+                        continue
+                    buffer.extend(chunk)
+                    while len(buffer) >= self.batch_size:
+                        self._flush(buffer[:self.batch_size])
+                        del buffer[:self.batch_size]
+                if buffer and self._error is None:
+                    self._flush(buffer)
+        except Exception as e:
+            self._error = self._error or e
+            # Дочитываем очередь, чтобы предыдущие стадии могли завершиться
+            while chunk is not _DONE:
+                chunk = source.get()
+
+    def _flush(self, vacancies: list[Vacancy]) -> None:
+        self.stats['added'] += self.saver.add_vacancies(vacancies)
+        self.stats['batches'] += 1
@@ -0,0 +1,150 @@
+import cProfile
+import io
+import json
+import pstats
+import tracemalloc
+
+
+class ReplayInput:
+    """Замена input(), возвращающая заранее записанные ответы по порядку.
+
+    Вопрос и ответ выводятся, как при вводе с клавиатуры.
+    """
+
+    def __init__(self, answers, echo: bool = True):
+        """
+        Args:
+            answers (Iterable[str]): Ответы в порядке вопросов
+            echo (bool): Выводить вопрос и ответ
+        """
+        self.answers = list(answers)
+        self.echo = echo
+        self._position = 0
+
+    def __call__(self, prompt: str = '') -> str:
+        """Возвращает очередной ответ.
+
+        Raises:
+            EOFError: Если записанные ответы закончились (как input() в конце ввода)
+        """
+        if self._position >= len(self.answers):
+            raise EOFError(f"Нет записанного ответа на вопрос: {prompt}")
+        answer = self.answers[self._position]
+        self._position += 1
+        if self.echo:
+            print(f"{prompt}{answer}")
+        return answer
+
+
+class RecordingInput:
+    """Обертка над функцией ввода, запоминающая ответы пользователя."""
+
+    def __init__(self, input_func=input):
+        """
+        Args:
+            input_func: Функция ввода (по умолчанию input)
+        """
+        self.input_func = input_func
+        self.answers = []
+
+    def __call__(self, prompt: str = '') -> str:
+        answer = self.input_func(prompt)
+        self.answers.append(answer)
+        return answer
+
+
+def load_answers(filename) -> list[str]:
+    """Читает ответы из файла записи сеанса.
+
+    Args:
+        filename: Путь к файлу вида {"answers": [...]}
+
+    Returns:
+        list[str]: Ответы в порядке вопросов
+
+    Raises:
+        ValueError: Если файл не содержит список ответов
+    """
+    with open(filename, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    answers = data.get('answers') if isinstance(data, dict) else None
+    if not isinstance(answers, list):
+        raise ValueError("Файл записи должен содержать список answers")
+    return [str(answer) for answer in answers]
+
+
+def save_answers(filename, answers) -> None:
+    """Записывает ответы сеанса в файл для последующего воспроизведения (--replay).
+
+    Args:
+        filename: Путь к файлу
+        answers (Iterable[str]): Ответы в порядке вопросов
+    """
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump({'answers': list(answers)}, file, ensure_ascii=False, indent=4)
+
+
+def profile_call(func, prefix: str = 'profile', top: int = 25):
+    """Выполняет функцию под cProfile и tracemalloc и сохраняет отчет.
+
+    Создаются файлы `<prefix>.prof` (статистика cProfile, открывается в
+    snakeviz и pstats) и `<prefix>.txt` (функции с наибольшим суммарным
+    временем, места с наибольшим объемом выделенной памяти и пиковый объем).
+    Отчет сохраняется и при исключении в функции.
+
+    Args:
+        func: Функция без аргументов
+        prefix (str): Путь к файлам отчета без расширения
+        top (int): Количество строк в каждом разделе отчета
+
+    Returns:
+        Результат func()
+    """
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    try:
+        profiler.enable()
+        try:
+            return func()
+        finally:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        profiler.dump_stats(f'{prefix}.prof')
+        with open(f'{prefix}.txt', 'w', encoding='utf-8') as file:
+            file.write(format_report(profiler, snapshot, peak, top))
+
+
+def format_report(profiler, snapshot, peak: int, top: int = 25) -> str:
+    """Формирует текстовый отчет профилирования.
+
+    Args:
+        profiler (cProfile.Profile): Профилировщик после выполнения
+        snapshot (tracemalloc.Snapshot): Снимок выделений памяти
+        peak (int): Пиковый объем отслеживаемой памяти (байт)
+        top (int): Количество строк в каждом разделе
+
+    Returns:
+        str: Отчет
+    """
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    ))
+    allocations = snapshot.statistics('lineno')[:top]
+    lines = [
+        f"Функции по суммарному времени (top {top})",
+        '=' * 40,
+        stream.getvalue().strip(),
+        '',
+        f"Места выделения памяти (top {top}), пиковый объем: {peak / 1024 / 1024:.2f} МиБ",
+        '=' * 40,
+    ]
+    lines.extend(f"{stat.size / 1024:10.1f} КиБ {stat.count:8} блоков  {stat.traceback}" for stat in allocations)
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,189 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_RATE = 5.0  # запросов в секунду
+DEFAULT_BURST = 10
+HOST_QUOTAS = {'api.hh.ru': (DEFAULT_RATE, DEFAULT_BURST)}
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+class TokenBucket:
+    """Ограничитель частоты запросов по алгоритму token bucket.
+
+    Токены накапливаются со скоростью `rate` в секунду, но не более `burst`.
+    Каждый запрос резервирует токен; если токенов нет, вызывающий код ждет,
+    пока резерв не восполнится. Резервирование выполняется под блокировкой,
+    а ожидание - вне ее, поэтому корзину можно использовать одновременно из
+    потоков (`acquire`) и из корутин (`acquire_async`).
+
+    При получении 429 скорость уменьшается вдвое (не ниже `min_rate`), после
+    успешных ответов постепенно возвращается к исходной.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float = None, recovery: float = None):
+        """
+        Args:
+            rate (float): Допустимая скорость в запросах в секунду
+            burst (int): Максимальное количество запросов подряд без ожидания
+            min_rate (float, optional): Нижняя граница скорости при замедлении
+            recovery (float, optional): Прирост скорости после каждого успешного ответа
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.recovery = recovery if recovery is not None else rate / 20
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Резервирует токены и возвращает время ожидания до их появления.
+
+        Args:
+            tokens (int): Количество токенов
+
+        Returns:
+            float: Время ожидания в секундах
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Блокирует текущий поток, пока запрос не будет разрешен."""
+        delay = self.reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens: int = 1) -> None:
+        """Приостанавливает корутину, пока запрос не будет разрешен."""
+        delay = self.reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def throttled(self, retry_after: float = None) -> None:
+        """Замедляет корзину после ответа 429.
+
+        Args:
+            retry_after (float, optional): Значение заголовка Retry-After в секундах;
+                до его истечения новые запросы не разрешаются
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            if retry_after:
+                self._tokens = min(self._tokens, -retry_after * self.rate)
+
+    def succeeded(self) -> None:
+        """Постепенно восстанавливает скорость после успешного ответа."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery)
+
+
+class RateLimiter:
+    """Набор корзин token bucket с отдельной квотой для каждого хоста."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST, quotas: dict = None):
+        """
+        Args:
+            rate (float): Скорость по умолчанию для хостов без отдельной квоты;
+                None отключает ограничение для таких хостов
+            burst (int): Размер пачки по умолчанию
+            quotas (dict, optional): Квоты вида {хост: (скорость, размер пачки)}
+        """
+        self.rate = rate
+        self.burst = burst
+        self.quotas = dict(HOST_QUOTAS if quotas is None else quotas)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str):
+        """Возвращает корзину для хоста из URL или None, если ограничения нет.
+
+        Args:
+            url (str): Адрес запроса
+
+        Returns:
+            TokenBucket | None: Корзина хоста
+        """
+        host = urlsplit(url).hostname or ''
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    rate, burst = self.quotas.get(host, (self.rate, self.burst))
+                    bucket = TokenBucket(rate, burst) if rate else None
+                    self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url: str) -> None:
+        """Ожидает разрешения на запрос к хосту (для потоков)."""
+        bucket = self.bucket(url)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        """Ожидает разрешения на запрос к хосту (для корутин)."""
+        bucket = self.bucket(url)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+    def record_response(self, url: str, response) -> None:
+        """Подстраивает скорость хоста по результату запроса.
+
+        Учитываются как итоговый ответ 429, так и ответы 429, которые были
+        получены и повторены внутри сессии (история повторов urllib3).
+
+        Args:
+            url (str): Адрес запроса
+            response: Ответ requests
+        """
+        bucket = self.bucket(url)
+        if bucket is None:
+            return
+        if response.status_code == 429:
+            bucket.throttled(_parse_retry_after(response.headers.get('Retry-After')))
+            return
+        retries = getattr(response.raw, 'retries', None)
+        history = getattr(retries, 'history', None) or ()
+        if any(entry.status == 429 for entry in history):
+            bucket.throttled()
+        else:
+            bucket.succeeded()
+
+
+def _parse_retry_after(value) -> float | None:
+    """Преобразует значение заголовка Retry-After в секунды (поддерживаются только секунды)."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Возвращает общий для всех коннекторов ограничитель, создавая его при первом вызове.
+
+    Returns:
+        RateLimiter: Общий ограничитель
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter()
+    return _limiter
@@ -0,0 +1,162 @@
+import re
+
+_MARKUP = re.compile(r'</?highlighttext>', re.IGNORECASE)
+_TOKEN = re.compile(r'\w+')
+_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def strip_markup(text):
+    """Удаляет из текста разметку <highlighttext>, которой API выделяет найденные слова.
+
+    Args:
+        text (str): Исходный текст (может быть None)
+
+    Returns:
+        str: Текст без разметки (None и пустая строка возвращаются как есть)
+    """
+    return _MARKUP.sub('', text) if text else text
+
+
+def tokenize(text) -> list[str]:
+    """Разбивает текст на слова в нижнем регистре, удаляя разметку <highlighttext>.
+
+    Args:
+        text (str): Исходный текст (может быть None)
+
+    Returns:
+        list[str]: Список слов
+    """
+    if not text:
+        return []
+    return _TOKEN.findall(strip_markup(text).lower())
+
+
+def parse_query(query) -> list[tuple[str, ...]]:
+    """Разбирает поисковый запрос на термы.
+
+    Слова в двойных кавычках образуют фразу, остальные слова - отдельные термы.
+    Если передан список строк, каждая строка разбирается так же.
+
+    Args:
+        query (str | Iterable[str]): Поисковый запрос
+
+    Returns:
+        list[tuple[str, ...]]: Термы; фраза - кортеж из нескольких слов
+    """
+    parts = [query] if isinstance(query, str) else list(query or ())
+    terms = []
+    for part in parts:
+        for phrase, word in _TERM.findall(part):
+            tokens = tuple(tokenize(phrase if phrase else word))
+            if tokens:
+                terms.append(tokens)
+    return terms
+
+
+class InvertedIndex:
+    """Инвертированный индекс слов для поиска документов по ключевым словам.
+
+    Для каждого слова хранится множество номеров документов, а для каждого
+    документа - списки его слов по полям (для проверки фраз). Документы
+    добавляются и удаляются по одному, индекс обновляется инкрементально.
+    Результаты возвращаются в порядке добавления документов.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._docs = {}   # ключ документа -> (номер, слова по полям)
+        self._keys = {}   # номер документа -> ключ
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, key, *fields) -> None:
+        """Добавляет документ в индекс (повторное добавление заменяет документ).
+
+        Args:
+            key: Ключ документа (например, ссылка на вакансию)
+            *fields (str): Индексируемые текстовые поля
+        """
+        if key in self._docs:
+            self.remove(key)
+        doc_id = self._next_id
+        self._next_id += 1
+        tokens = tuple(tokenize(field) for field in fields)
+        self._docs[key] = (doc_id, tokens)
+        self._keys[doc_id] = key
+        for field_tokens in tokens:
+            for token in field_tokens:
+                self._postings.setdefault(token, set()).add(doc_id)
+
+    def remove(self, key) -> None:
+        """Удаляет документ из индекса.
+
+        Args:
+            key: Ключ документа
+        """
+        entry = self._docs.pop(key, None)
+        if entry is None:
+            return
+        doc_id, tokens = entry
+        del self._keys[doc_id]
+        for token in {token for field_tokens in tokens for token in field_tokens}:
+            postings = self._postings[token]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[token]
+
+    def search(self, query, mode: str = 'and') -> list:
+        """Ищет документы по запросу.
+
+        Args:
+            query (str | Iterable[str]): Запрос: слова и фразы в двойных кавычках
+            mode (str): 'and' - документ содержит все термы, 'or' - хотя бы один
+
+        Returns:
+            list: Ключи найденных документов в порядке добавления
+        """
+        if mode not in ('and', 'or'):
+            raise ValueError(f"Неизвестный режим поиска: {mode}")
+        terms = parse_query(query)
+        if not terms:
+            return []
+        if mode == 'and':
+            # Начинаем с самого редкого терма, чтобы пересечения были меньше
+            matches = None
+            for term in sorted(terms, key=self._term_frequency):
+                found = self._match_term(term, matches)
+                matches = found
+                if not matches:
+                    return []
+        else:
+            matches = set()
+            for term in terms:
+                matches |= self._match_term(term)
+        return [self._keys[doc_id] for doc_id in sorted(matches)]
+
+    def _term_frequency(self, term: tuple[str, ...]) -> int:
+        return min(len(self._postings.get(token, ())) for token in term)
+
+    def _match_term(self, term: tuple[str, ...], candidates: set = None) -> set:
+        """Возвращает номера документов, содержащих слово или фразу."""
+        matches = candidates
+        for token in sorted(term, key=lambda token: len(self._postings.get(token, ()))):
+            postings = self._postings.get(token)
+            if not postings:
+                return set()
+            matches = postings.copy() if matches is None else matches & postings
+            if not matches:
+                return set()
+        if len(term) > 1:
+            matches = {doc_id for doc_id in matches if self._contains_phrase(doc_id, term)}
+        return matches
+
+    def _contains_phrase(self, doc_id: int, phrase: tuple[str, ...]) -> bool:
+        """Проверяет, что слова фразы идут подряд в одном из полей документа."""
+        size = len(phrase)
+        for field_tokens in self._docs[self._keys[doc_id]][1]:
+            for start in range(len(field_tokens) - size + 1):
+                if field_tokens[start] == phrase[0] and tuple(field_tokens[start:start + size]) == phrase:
+                    return True
+        return False
@@ -0,0 +1,132 @@
+import threading
+from typing import TYPE_CHECKING
+
+from src import codec, metrics
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_TIMEOUT = (3.05, 10)  # (подключение, чтение) в секундах
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def build_session(pool_connections: int = 4, pool_maxsize: int = 10, retries: int = 3,
+                  backoff_factor: float = 0.5, timeout=DEFAULT_TIMEOUT) -> 'requests.Session':
+    """Создает сессию с keep-alive, пулом соединений и повторами запросов.
+
+    Повторяются только идемпотентные запросы при ошибках соединения и ответах
+    429/5xx. Пауза между попытками растет экспоненциально
+    (`backoff_factor * 2 ** (попытка - 1)`), а для 429/503 учитывается
+    заголовок `Retry-After`.
+
+    Args:
+        pool_connections (int): Количество хостов, для которых хранится пул соединений
+        pool_maxsize (int): Максимальное количество соединений с одним хостом
+        retries (int): Максимальное количество повторов
+        backoff_factor (float): Множитель экспоненциальной задержки между повторами
+        timeout: Таймаут запроса по умолчанию (число или кортеж (connect, read))
+
+    Returns:
+        requests.Session: Настроенная сессия
+    """
+    import requests
+    from urllib3.util.retry import Retry
+    from src.transport import TimeoutHTTPAdapter
+
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+        timeout=timeout,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> 'requests.Session':
+    """Возвращает общую для всех коннекторов сессию, создавая ее при первом вызове.
+
+    Returns:
+        requests.Session: Общая сессия
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = build_session()
+    return _session
+
+
+def close_session() -> None:
+    """Закрывает общую сессию и освобождает соединения."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def send_get(session: 'requests.Session', url: str, limiter=None, **kwargs) -> 'requests.Response':
+    """Выполняет GET-запрос, предварительно дождавшись разрешения ограничителя частоты.
+
+    Args:
+        session (requests.Session): HTTP-сессия
+        url (str): Адрес запроса
+        limiter (RateLimiter, optional): Ограничитель частоты запросов (см. src/rate_limit.py);
+            по результату запроса он подстраивает скорость для хоста
+        **kwargs: Параметры для session.get
+
+    Returns:
+        requests.Response: Ответ сервера
+    """
+    if limiter is not None:
+        limiter.acquire(url)
+    with metrics.timer('hh_http_request_seconds'):
+        response = session.get(url, **kwargs)
+    metrics.inc('hh_http_requests_total', status=str(response.status_code))
+    if limiter is not None:
+        limiter.record_response(url, response)
+    return response
+
+
+def fetch_json(session: 'requests.Session', url: str, params: dict = None, headers: dict = None,
+               cache=None, limiter=None):
+    """Выполняет GET-запрос и возвращает тело ответа, преобразованное из JSON.
+
+    Args:
+        session (requests.Session): HTTP-сессия
+        url (str): Адрес запроса
+        params (dict, optional): Параметры запроса
+        headers (dict, optional): Заголовки запроса
+        cache (ResponseCache, optional): Кэш ответов; при его наличии запрос
+            выполняется только для отсутствующих или устаревших записей
+        limiter (RateLimiter, optional): Ограничитель частоты запросов
+
+    Returns:
+        Тело ответа, преобразованное из JSON (через src/codec.py)
+
+    Raises:
+        requests.exceptions.RequestException: При ошибке запроса или ответе с ошибкой
+    """
+    if cache is not None:
+        return cache.fetch(session, url, params=params, headers=headers, limiter=limiter)
+    kwargs = {'params': params}
+    if headers:
+        kwargs['headers'] = headers
+    response = send_get(session, url, limiter=limiter, **kwargs)
+    response.raise_for_status()
+    with metrics.timer('hh_json_decode_seconds'):
+        return codec.loads(response.content)
@@ -0,0 +1,590 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from hashlib import blake2b
+
+from src.file_worker import JsonSaver, Saver, atomic_open
+from src.vacancy import Vacancy
+
+# Формат снимка (все числа little-endian):
+#   заголовок   HEADER: сигнатура, версия, число записей, смещения таблицы строк и индекса
+#   записи      RECORD + name, url, requirements (каждая строка - u32 длина + UTF-8)
+#   строки      u32 число строк + строки (работодатели и валюты, на них ссылаются записи)
+#   индекс      INDEX_ENTRY для каждой записи, отсортированные по хешу ссылки
+MAGIC = b'HHVS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQQQ')
+RECORD = struct.Struct('<IBqqqqII')
+LENGTH = struct.Struct('<I')
+INDEX_ENTRY = struct.Struct('<QQ')
+
+# Флаги записи
+HAS_SALARY = 1
+HAS_FROM = 2
+HAS_TO = 4
+HAS_REQUIREMENTS = 8
+EMPTY_SALARY = 16  # Зарплата - пустой словарь
+
+# Номер строки для отсутствующей валюты
+NO_STRING = 0xFFFFFFFF
+
+# Смещение поля salary_max внутри записи (для фильтрации без разбора записи)
+_SALARY_MAX = struct.Struct('<q')
+_SALARY_MAX_OFFSET = 4 + 1 + 8 * 3
+
+
+def url_hash(url: bytes) -> int:
+    """Возвращает 64-битный хеш ссылки для индекса снимка."""
+    return int.from_bytes(blake2b(url, digest_size=8).digest(), 'little')
+
+
+def write_snapshot(filename, vacancies) -> int:
+    """Записывает вакансии в бинарный снимок.
+
+    Вакансии записываются по мере перебора, поэтому источником может быть
+    поток (например, JsonSaver.iter_from_file()). Из вакансий с одинаковой
+    ссылкой сохраняется первая. Файл заменяется атомарно.
+
+    Args:
+        filename: Путь к файлу снимка
+        vacancies (Iterable[Vacancy]): Вакансии
+
+    Returns:
+        int: Количество записанных вакансий
+    """
+    strings = {}
+    index = []
+    seen = set()
+    with atomic_open(filename, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0, 0))
+        offset = HEADER.size
+        for vacancy in vacancies:
+            if vacancy.url in seen:
+                continue
+            seen.add(vacancy.url)
+            record = _encode_record(vacancy, strings)
+            index.append((url_hash(vacancy.url.encode('utf-8')), offset))
+            file.write(record)
+            offset += len(record)
+
+        strings_offset = offset
+        file.write(LENGTH.pack(len(strings)))
+        for value in strings:
+            file.write(_encode_string(value))
+
+        index_offset = file.tell()
+        index.sort()
+        file.write(b''.join(INDEX_ENTRY.pack(*entry) for entry in index))
+
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, 0, len(index), strings_offset, index_offset))
+    return len(index)
+
+
+def _encode_string(value: str) -> bytes:
+    data = value.encode('utf-8')
+    return LENGTH.pack(len(data)) + data
+
+
+def _string_id(strings: dict, value) -> int:
+    if value is None:
+        return NO_STRING
+    return strings.setdefault(value, len(strings))
+
+
+def _encode_record(vacancy: Vacancy, strings: dict) -> bytes:
+    """Кодирует вакансию в запись снимка (дробные суммы зарплаты округляются вниз)."""
+    salary = vacancy.salary or {}
+    start, end = salary.get('from'), salary.get('to')
+    flags = 0
+    if isinstance(vacancy.salary, dict):
+        flags |= HAS_SALARY if salary else HAS_SALARY | EMPTY_SALARY
+    if start is not None:
+        flags |= HAS_FROM
+    if end is not None:
+        flags |= HAS_TO
+    if vacancy.requirements is not None:
+        flags |= HAS_REQUIREMENTS
+    body = (
+        _encode_string(vacancy.name)
+        + _encode_string(vacancy.url)
+        + _encode_string(vacancy.requirements or '')
+    )
+    return RECORD.pack(
+        RECORD.size + len(body),
+        flags,
+        int(start or 0),
+        int(end or 0),
+        vacancy.salary_min,
+        vacancy.salary_max,
+        _string_id(strings, vacancy.employer),
+        _string_id(strings, salary.get('currency')),
+    ) + body
+
+
+class SnapshotReader:
+    """Чтение бинарного снимка вакансий через отображение файла в память.
+
+    При открытии читаются только заголовок и таблица строк, поэтому время
+    открытия не зависит от размера снимка. Поиск по ссылке - двоичный поиск
+    по индексу хешей; поля читаются прямо из отображенного буфера, и
+    декодируются только строки найденных записей. Несколько процессов,
+    открывших один снимок, разделяют его страницы в кэше ОС.
+    """
+
+    def __init__(self, filename):
+        """
+        Args:
+            filename: Путь к файлу снимка
+
+        Raises:
+            ValueError: Если файл не является снимком поддерживаемой версии
+        """
+        self.filename = filename
+        with open(filename, 'rb') as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Пустой файл снимка: {filename}") from None
+        self._buffer = memoryview(self._mmap)
+        try:
+            magic, version, _, count, strings_offset, index_offset = HEADER.unpack_from(self._buffer)
+        except struct.error:
+            self.close()
+            raise ValueError(f"Некорректный файл снимка: {filename}") from None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Некорректный файл снимка: {filename}")
+        self._count = count
+        self._records_end = strings_offset
+        self._index_offset = index_offset
+        self._strings = self._read_strings(strings_offset)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        for offset in self._offsets():
+            yield self._vacancy(offset)
+
+    def iter_views(self):
+        """Перебирает ленивые представления записей (VacancyView) в порядке записи."""
+        for offset in self._offsets():
+            yield VacancyView(self, offset)
+
+    def __contains__(self, url: str) -> bool:
+        return self._find(url) is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Освобождает отображение файла."""
+        if self._mmap is not None:
+            self._buffer.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def get(self, url: str):
+        """Возвращает вакансию по ссылке или None."""
+        offset = self._find(url)
+        return None if offset is None else self._vacancy(offset)
+
+    def get_view(self, url: str):
+        """Возвращает ленивое представление вакансии по ссылке или None."""
+        offset = self._find(url)
+        return None if offset is None else VacancyView(self, offset)
+
+    def filter_vacancies(self, criteria) -> list['VacancyView']:
+        """Фильтрует вакансии по заданному критерию, не создавая объекты Vacancy.
+
+        Критерий получает VacancyView, который читает поля из буфера при
+        обращении, поэтому память процесса не растет с размером снимка:
+        сохраняются только подходящие представления.
+
+        Args:
+            criteria: Функция-критерий для фильтрации вакансий
+
+        Returns:
+            list[VacancyView]: Представления подходящих вакансий
+        """
+        return [view for view in self.iter_views() if criteria(view)]
+
+    def by_employer(self, employer: str) -> list[Vacancy]:
+        """Возвращает вакансии работодателя; строки остальных записей не декодируются."""
+        try:
+            employer_id = self._strings.index(employer)
+        except ValueError:
+            return []
+        return [
+            self._vacancy(offset) for offset in self._offsets()
+            if RECORD.unpack_from(self._buffer, offset)[6] == employer_id
+        ]
+
+    def by_salary(self, min_salary: int, max_salary: int) -> list[Vacancy]:
+        """Возвращает вакансии с salary_max в диапазоне [min_salary, max_salary].
+
+        Для проверки читается только поле salary_max записи.
+        """
+        result = []
+        for offset in self._offsets():
+            salary_max = _SALARY_MAX.unpack_from(self._buffer, offset + _SALARY_MAX_OFFSET)[0]
+            if min_salary <= salary_max <= max_salary:
+                result.append(self._vacancy(offset))
+        return result
+
+    def _read_strings(self, offset: int) -> list:
+        (count,) = LENGTH.unpack_from(self._buffer, offset)
+        offset += LENGTH.size
+        strings = []
+        for _ in range(count):
+            value, offset = self._read_string(offset)
+            strings.append(value)
+        return strings
+
+    def _read_string(self, offset: int) -> tuple[str, int]:
+        (size,) = LENGTH.unpack_from(self._buffer, offset)
+        start = offset + LENGTH.size
+        return str(self._buffer[start:start + size], 'utf-8'), start + size
+
+    def _offsets(self):
+        """Перебирает смещения записей в порядке записи."""
+        offset = HEADER.size
+        while offset < self._records_end:
+            yield offset
+            offset += LENGTH.unpack_from(self._buffer, offset)[0]
+
+    def _find(self, url: str):
+        """Ищет смещение записи по ссылке через индекс хешей."""
+        data = url.encode('utf-8')
+        key = url_hash(data)
+        position = bisect_left(_IndexKeys(self), key)
+        while position < self._count:
+            entry_hash, offset = INDEX_ENTRY.unpack_from(
+                self._buffer, self._index_offset + position * INDEX_ENTRY.size)
+            if entry_hash != key:
+                break
+            # Сравниваем ссылку прямо в буфере, пропуская поле name
+            name_size = LENGTH.unpack_from(self._buffer, offset + RECORD.size)[0]
+            start = offset + RECORD.size + LENGTH.size + name_size
+            size = LENGTH.unpack_from(self._buffer, start)[0]
+            if self._buffer[start + LENGTH.size:start + LENGTH.size + size] == data:
+                return offset
+            position += 1
+        return None
+
+    def _skip_string(self, offset: int) -> int:
+        """Возвращает смещение, следующее за строкой."""
+        return offset + LENGTH.size + LENGTH.unpack_from(self._buffer, offset)[0]
+
+    def _salary(self, fields: tuple):
+        _, flags, start, end, _, _, _, currency_id = fields
+        if not flags & HAS_SALARY:
+            return None
+        if flags & EMPTY_SALARY:
+            return {}
+        return {
+            'from': start if flags & HAS_FROM else None,
+            'to': end if flags & HAS_TO else None,
+            'currency': None if currency_id == NO_STRING else self._strings[currency_id],
+        }
+
+    def _vacancy(self, offset: int) -> Vacancy:
+        fields = RECORD.unpack_from(self._buffer, offset)
+        name, position = self._read_string(offset + RECORD.size)
+        url, position = self._read_string(position)
+        requirements, _ = self._read_string(position)
+        # Данные снимка записаны из уже проверенных вакансий
+        return Vacancy.from_trusted(
+            name,
+            requirements if fields[1] & HAS_REQUIREMENTS else None,
+            url,
+            self._salary(fields),
+            self._strings[fields[6]],
+        )
+
+
+class VacancyView:
+    """Ленивое представление записи снимка с интерфейсом чтения Vacancy.
+
+    Хранит только ссылку на SnapshotReader и смещение записи; поля читаются
+    из отображенного буфера при каждом обращении. Представление действительно,
+    пока открыт снимок; to_vacancy() создает независимый объект Vacancy.
+    """
+
+    __slots__ = ('_reader', '_offset')
+
+    def __init__(self, reader: SnapshotReader, offset: int):
+        self._reader = reader
+        self._offset = offset
+
+    @property
+    def name(self) -> str:
+        return self._reader._read_string(self._offset + RECORD.size)[0]
+
+    @property
+    def url(self) -> str:
+        reader = self._reader
+        return reader._read_string(reader._skip_string(self._offset + RECORD.size))[0]
+
+    @property
+    def requirements(self):
+        reader = self._reader
+        if not RECORD.unpack_from(reader._buffer, self._offset)[1] & HAS_REQUIREMENTS:
+            return None
+        position = reader._skip_string(reader._skip_string(self._offset + RECORD.size))
+        return reader._read_string(position)[0]
+
+    @property
+    def employer(self) -> str:
+        return self._reader._strings[RECORD.unpack_from(self._reader._buffer, self._offset)[6]]
+
+    @property
+    def salary(self):
+        return self._reader._salary(RECORD.unpack_from(self._reader._buffer, self._offset))
+
+    @property
+    def salary_min(self) -> int:
+        return RECORD.unpack_from(self._reader._buffer, self._offset)[4]
+
+    @property
+    def salary_max(self) -> int:
+        return _SALARY_MAX.unpack_from(self._reader._buffer, self._offset + _SALARY_MAX_OFFSET)[0]
+
+    def get_min_salary(self) -> int:
+        """Возвращает значение зарплаты для сравнения вакансий (как Vacancy.get_min_salary)."""
+        return self.salary_max
+
+    def __lt__(self, other) -> bool:
+        return self.salary_max < other.salary_max
+
+    def __gt__(self, other) -> bool:
+        return self.salary_max > other.salary_max
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (Vacancy, VacancyView)):
+            return NotImplemented
+        return self.url == other.url
+
+    def __hash__(self) -> int:
+        return hash(self.url)
+
+    def __repr__(self) -> str:
+        return f"VacancyView({self.url!r})"
+
+    def to_dict(self) -> dict:
+        """Сериализует вакансию в словарь (как Vacancy.to_dict)."""
+        return self.to_vacancy().to_dict()
+
+    def to_vacancy(self) -> Vacancy:
+        """Создает объект Vacancy с данными записи."""
+        return self._reader._vacancy(self._offset)
+
+
+def snapshot_path(json_filename) -> str:
+    """Возвращает путь снимка, соответствующего JSON-хранилищу (vacancies.json -> vacancies.snap)."""
+    return os.path.splitext(os.fspath(json_filename))[0] + '.snap'
+
+
+def open_shared_reader(json_filename, filename=None) -> SnapshotReader:
+    """Открывает снимок JSON-хранилища только для чтения, при необходимости обновляя его.
+
+    Снимок перестраивается, если его нет или он старше JSON-файла. Запись
+    атомарна, поэтому процессы, одновременно открывающие один снимок, видят
+    либо старый, либо новый файл целиком и разделяют его страницы в кэше ОС.
+
+    Args:
+        json_filename: Путь к файлу JsonSaver
+        filename (optional): Путь к снимку; по умолчанию рядом с JSON-файлом
+
+    Returns:
+        SnapshotReader: Открытый снимок
+    """
+    filename = filename or snapshot_path(json_filename)
+    try:
+        fresh = os.path.getmtime(filename) >= os.path.getmtime(json_filename)
+    except FileNotFoundError:
+        fresh = False
+    if not fresh:
+        source = JsonSaver(json_filename, lazy=True) if os.path.exists(json_filename) else None
+        write_snapshot(filename, source.iter_from_file() if source else ())
+    return SnapshotReader(filename)
+
+
+class _IndexKeys:
+    """Последовательность хешей индекса снимка для bisect (без копирования индекса)."""
+
+    def __init__(self, reader: SnapshotReader):
+        self._reader = reader
+
+    def __len__(self) -> int:
+        return self._reader._count
+
+    def __getitem__(self, position: int) -> int:
+        reader = self._reader
+        return INDEX_ENTRY.unpack_from(reader._buffer, reader._index_offset + position * INDEX_ENTRY.size)[0]
+
+
+class SnapshotSaver(Saver):
+    """
+    Хранилище вакансий в бинарном снимке с отображением в память
+
+    Открытие хранилища не зависит от размера файла: вакансии читаются из
+    отображенного буфера по запросу. Изменения (add_vacancies,
+    delete_vacancies) переписывают снимок целиком, поэтому их лучше
+    выполнять пакетами.
+    """
+
+    def __init__(self, filename):
+        """
+        Открывает снимок (и при необходимости создает пустой)
+
+        Args:
+            filename: Путь к файлу снимка
+        """
+        self.__file__ = filename
+        if not os.path.exists(filename) or not os.path.getsize(filename):
+            write_snapshot(filename, ())
+        self._reader = SnapshotReader(filename)
+
+    def __len__(self) -> int:
+        return len(self._reader)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает снимок"""
+        self._reader.close()
+
+    @property
+    def vacancies(self) -> list[Vacancy]:
+        """Список вакансий хранилища в порядке добавления"""
+        return list(self._reader)
+
+    def iter_vacancies(self, criteria=None):
+        """
+        Перебирает вакансии, подходящие под критерий
+
+        Args:
+            criteria (optional): Функция-критерий для фильтрации вакансий
+
+        Yields:
+            Vacancy: Очередная подходящая вакансия
+        """
+        for vacancy in self._reader:
+            if criteria is None or criteria(vacancy):
+                yield vacancy
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в хранилище
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для добавления
+        """
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies) -> int:
+        """
+        Добавляет несколько вакансий, переписывая снимок один раз
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для добавления
+
+        Returns:
+            int: Количество добавленных вакансий
+        """
+        new = {}
+        for vacancy in vacancies:
+            if vacancy.url not in new and vacancy.url not in self._reader:
+                new[vacancy.url] = vacancy
+        if new:
+            self._rewrite(list(self._reader) + list(new.values()))
+        return len(new)
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Удаляет вакансию из хранилища
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для удаления
+        """
+        self.delete_vacancies([vacancy])
+
+    def delete_vacancies(self, vacancies) -> int:
+        """
+        Удаляет несколько вакансий, переписывая снимок один раз
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для удаления
+
+        Returns:
+            int: Количество удаленных вакансий
+        """
+        urls = {vacancy.url for vacancy in vacancies if vacancy.url in self._reader}
+        if urls:
+            self._rewrite([vacancy for vacancy in self._reader if vacancy.url not in urls])
+        return len(urls)
+
+    def get_vacancy(self, url: str):
+        """
+        Возвращает вакансию по ссылке
+
+        Args:
+            url (str): Ссылка на вакансию
+
+        Returns:
+            Vacancy | None: Найденная вакансия или None
+        """
+        return self._reader.get(url)
+
+    def get_vacancies_by_employer(self, employer: str) -> list[Vacancy]:
+        """
+        Возвращает вакансии работодателя
+
+        Args:
+            employer (str): Название работодателя
+
+        Returns:
+            list[Vacancy]: Вакансии работодателя
+        """
+        return self._reader.by_employer(employer)
+
+    def get_vacancies_by_salary(self, min_salary: int, max_salary: int) -> list[Vacancy]:
+        """
+        Возвращает вакансии с зарплатой в рублях в диапазоне [min_salary, max_salary]
+
+        Args:
+            min_salary (int): Нижняя граница зарплаты
+            max_salary (int): Верхняя граница зарплаты
+
+        Returns:
+            list[Vacancy]: Подходящие вакансии
+        """
+        return self._reader.by_salary(min_salary, max_salary)
+
+    def filter_vacancies(self, criteria) -> list[Vacancy]:
+        """
+        Фильтрует вакансии по заданному критерию
+
+        Args:
+            criteria: Функция-критерий для фильтрации вакансий
+
+        Returns:
+            list[Vacancy]: Отфильтрованный список вакансий
+        """
+        return list(self.iter_vacancies(criteria))
+
+    def _rewrite(self, vacancies: list[Vacancy]) -> None:
+        """Записывает новый снимок и переоткрывает его"""
+        write_snapshot(self.__file__, vacancies)
+        self._reader.close()
+        self._reader = SnapshotReader(self.__file__)
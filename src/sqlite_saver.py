@@ -0,0 +1,292 @@
+import json
+import sqlite3
+
+from src.file_worker import Saver
+from src.search_index import parse_query, strip_markup
+from src.vacancy import Vacancy
+
+# Слова выделяются так же, как search_index.tokenize (\w+): диакритика
+# сохраняется, а '_' - часть слова
+FTS_TOKENIZER = "unicode61 remove_diacritics 0 tokenchars '_'"
+
+FTS_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+    name, requirements, content='vacancies', content_rowid='id', tokenize="{FTS_TOKENIZER}"
+);
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    requirements TEXT,
+    employer TEXT,
+    salary_from INTEGER,
+    salary_to INTEGER,
+    currency TEXT,
+    salary_key INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_vacancies_employer ON vacancies(employer);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_key ON vacancies(salary_key);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_from ON vacancies(salary_from);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary_to ON vacancies(salary_to);
+CREATE INDEX IF NOT EXISTS idx_vacancies_currency ON vacancies(currency);
+""" + FTS_TABLE + """
+CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN
+    INSERT INTO vacancies_fts(rowid, name, requirements) VALUES (new.id, new.name, new.requirements);
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN
+    INSERT INTO vacancies_fts(vacancies_fts, rowid, name, requirements)
+    VALUES ('delete', old.id, old.name, old.requirements);
+END;
+"""
+
+COLUMNS = "name, requirements, url, employer, salary_from, salary_to, currency"
+
+
+class SqliteSaver(Saver):
+    """
+    Хранилище вакансий в базе SQLite
+
+    Ссылка на вакансию уникальна, работодатель и поля зарплаты
+    проиндексированы, а название и требования доступны для полнотекстового
+    поиска (FTS5). Фильтрация по ключевым словам, диапазону зарплат и выбор
+    топ-N выполняются SQL-запросом в search(), без загрузки всех вакансий в память.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Открывает (и при необходимости создает) базу вакансий
+
+        Args:
+            filename (str): Путь к файлу базы данных
+        """
+        self.__file__ = filename
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._migrate_fts()
+        self._connection.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM vacancies").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает соединение с базой"""
+        self._connection.close()
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в хранилище (существующие вакансии пропускаются)
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для добавления
+        """
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies) -> int:
+        """
+        Добавляет несколько вакансий в одной транзакции
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для добавления
+
+        Returns:
+            int: Количество добавленных вакансий
+        """
+        with self._connection:
+            cursor = self._connection.executemany(
+                "INSERT OR IGNORE INTO vacancies "
+                "(name, requirements, url, employer, salary_from, salary_to, currency, salary_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._to_row(vacancy) for vacancy in vacancies),
+            )
+        return max(cursor.rowcount, 0)
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        """
+        Удаляет вакансию из хранилища
+
+        Args:
+            vacancy (Vacancy): Объект вакансии для удаления
+        """
+        self.delete_vacancies([vacancy])
+
+    def delete_vacancies(self, vacancies) -> int:
+        """
+        Удаляет несколько вакансий в одной транзакции
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии для удаления
+
+        Returns:
+            int: Количество удаленных вакансий
+        """
+        with self._connection:
+            cursor = self._connection.executemany(
+                "DELETE FROM vacancies WHERE url = ?", ((vacancy.url,) for vacancy in vacancies)
+            )
+        return max(cursor.rowcount, 0)
+
+    def get_vacancy(self, url: str):
+        """
+        Возвращает вакансию по ссылке
+
+        Args:
+            url (str): Ссылка на вакансию
+
+        Returns:
+            Vacancy | None: Найденная вакансия или None
+        """
+        row = self._connection.execute(f"SELECT {COLUMNS} FROM vacancies WHERE url = ?", (url,)).fetchone()
+        return self._from_row(row) if row else None
+
+    def get_vacancies_by_employer(self, employer: str) -> list[Vacancy]:
+        """
+        Возвращает вакансии работодателя
+
+        Args:
+            employer (str): Название работодателя
+
+        Returns:
+            list[Vacancy]: Вакансии работодателя
+        """
+        rows = self._connection.execute(
+            f"SELECT {COLUMNS} FROM vacancies WHERE employer = ? ORDER BY id", (employer,)
+        )
+        return [self._from_row(row) for row in rows]
+
+    def iter_vacancies(self):
+        """
+        Перебирает все вакансии, не загружая их в память целиком
+
+        Yields:
+            Vacancy: Очередная вакансия
+        """
+        for row in self._connection.execute(f"SELECT {COLUMNS} FROM vacancies ORDER BY id"):
+            yield self._from_row(row)
+
+    def filter_vacancies(self, criteria) -> list[Vacancy]:
+        """
+        Фильтрует вакансии по заданному критерию
+
+        Произвольную функцию нельзя перевести в SQL, поэтому вакансии читаются
+        курсором по одной; для типовых фильтров используйте search().
+
+        Args:
+            criteria: Функция-критерий для фильтрации вакансий
+
+        Returns:
+            list[Vacancy]: Отфильтрованный список вакансий
+        """
+        return [v for v in self.iter_vacancies() if criteria(v)]
+
+    def search(self, filter_words=None, min_salary: int = None, max_salary: int = None,
+               top_n: int = None, columns=('requirements',), urls=None, prefix: bool = True) -> list[Vacancy]:
+        """
+        Ищет вакансии SQL-запросом
+
+        Args:
+            filter_words (list[str], optional): Ключевые слова; вакансия подходит, если
+                хотя бы одно слово (или слово, начинающееся с него) есть в указанных полях;
+                слова в двойных кавычках - фраза
+            min_salary (int, optional): Нижняя граница зарплаты в рублях (Vacancy.salary_max)
+            max_salary (int, optional): Верхняя граница зарплаты
+            top_n (int, optional): Вернуть только top_n вакансий с наибольшей зарплатой
+            columns (tuple): Поля для поиска ключевых слов: 'name' и/или 'requirements'
+            urls (Iterable[str], optional): Искать только среди вакансий с этими ссылками
+            prefix (bool): True - ключевое слово совпадает с началом слова, False - только
+                со словом целиком (как JsonSaver.find_vacancies)
+
+        Returns:
+            list[Vacancy]: Вакансии, отсортированные по убыванию зарплаты
+        """
+        conditions = []
+        params = []
+        match = self._match_expression(filter_words, columns, prefix)
+        if match:
+            conditions.append("id IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)")
+            params.append(match)
+        if urls is not None:
+            conditions.append("url IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(urls)))
+        if min_salary is not None:
+            conditions.append("salary_key >= ?")
+            params.append(min_salary)
+        if max_salary is not None:
+            conditions.append("salary_key <= ?")
+            params.append(max_salary)
+
+        sql = f"SELECT {COLUMNS} FROM vacancies"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY salary_key DESC, id"
+        if top_n is not None:
+            sql += " LIMIT ?"
+            params.append(top_n)
+        return [self._from_row(row) for row in self._connection.execute(sql, params)]
+
+    @staticmethod
+    def _match_expression(filter_words, columns, prefix) -> str:
+        """Формирует выражение FTS5 MATCH: любое из слов или фраз в заданных полях
+
+        Термы разбираются search_index.parse_query, как и в инвертированном индексе
+        JsonSaver.find_vacancies.
+        """
+        suffix = '*' if prefix else ''
+        terms = ['"' + ' '.join(term) + '"' + suffix for term in parse_query(filter_words)]
+        if not terms:
+            return ''
+        return "{" + " ".join(columns) + "} : (" + " OR ".join(terms) + ")"
+
+    def _migrate_fts(self) -> None:
+        """Перестраивает полнотекстовый индекс базы, созданной с другим токенизатором
+
+        Разметка <highlighttext> удаляется из требований старых записей, чтобы
+        индекс совпадал с инвертированным индексом JsonSaver.
+        """
+        row = self._connection.execute("SELECT sql FROM sqlite_master WHERE name = 'vacancies_fts'").fetchone()
+        if row is None or FTS_TOKENIZER in row[0]:
+            return
+        rows = self._connection.execute(
+            "SELECT id, requirements FROM vacancies WHERE requirements LIKE '%highlighttext>%'"
+        ).fetchall()
+        with self._connection:
+            # Одна транзакция: при сбое база остается со старым индексом
+            self._connection.execute("BEGIN")
+            self._connection.execute("DROP TABLE vacancies_fts")
+            self._connection.executemany(
+                "UPDATE vacancies SET requirements = ? WHERE id = ?",
+                ((strip_markup(requirements), row_id) for row_id, requirements in rows),
+            )
+            self._connection.execute(FTS_TABLE)
+            self._connection.execute("INSERT INTO vacancies_fts(vacancies_fts) VALUES ('rebuild')")
+
+    @staticmethod
+    def _to_row(vacancy: Vacancy) -> tuple:
+        salary = vacancy.salary if isinstance(vacancy.salary, dict) else {}
+        return (
+            vacancy.name,
+            strip_markup(vacancy.requirements),
+            vacancy.url,
+            vacancy.employer,
+            salary.get('from'),
+            salary.get('to'),
+            salary.get('currency'),
+            vacancy.salary_max,
+        )
+
+    @staticmethod
+    def _from_row(row) -> Vacancy:
+        name, requirements, url, employer, salary_from, salary_to, currency = row
+        salary = None
+        if salary_from is not None or salary_to is not None or currency is not None:
+            salary = {'from': salary_from, 'to': salary_to, 'currency': currency}
+        return Vacancy(name=name, requirements=requirements, url=url, salary=salary, employer=employer)
@@ -0,0 +1,152 @@
+from bisect import bisect_left, bisect_right, insort
+
+from src.search_index import InvertedIndex
+from src.vacancy import Vacancy
+
+
+class VacancyStore:
+    """Хранилище вакансий в памяти с индексами.
+
+    Основной индекс - словарь URL -> Vacancy (сохраняет порядок добавления),
+    поэтому добавление, удаление и поиск по ссылке выполняются за O(1).
+    Дополнительно поддерживаются индексы по работодателю и по корзинам
+    зарплаты (ширина корзины - `bucket_size`), которые позволяют выбирать
+    диапазон зарплат, не просматривая все вакансии, и инвертированный индекс
+    слов названия и требований для поиска по ключевым словам.
+
+    Ключи индексов запоминаются при добавлении, поэтому вакансия удаляется
+    из всех индексов, даже если ее зарплату или работодателя изменили после
+    добавления. Чтобы изменение попало в индексы, вакансию нужно удалить
+    и добавить заново.
+    """
+
+    def __init__(self, vacancies=(), bucket_size: int = 10000):
+        """
+        Args:
+            vacancies (Iterable[Vacancy]): Начальный набор вакансий
+            bucket_size (int): Ширина корзины индекса зарплат
+        """
+        self.bucket_size = bucket_size
+        self._by_url = {}
+        self._by_employer = {}
+        self._by_salary = {}
+        self._keys = {}  # URL -> (работодатель, корзина зарплаты) на момент добавления
+        self._salary_keys = []  # Отсортированные номера непустых корзин
+        self._text_index = InvertedIndex()
+        for vacancy in vacancies:
+            self.add(vacancy)
+
+    def __len__(self) -> int:
+        return len(self._by_url)
+
+    def __iter__(self):
+        return iter(self._by_url.values())
+
+    def __contains__(self, vacancy) -> bool:
+        url = vacancy.url if isinstance(vacancy, Vacancy) else vacancy
+        return url in self._by_url
+
+    def get(self, url: str):
+        """Возвращает вакансию по ссылке или None."""
+        return self._by_url.get(url)
+
+    def add(self, vacancy: Vacancy) -> bool:
+        """Добавляет вакансию, если вакансии с такой ссылкой еще нет.
+
+        Args:
+            vacancy (Vacancy): Вакансия для добавления
+
+        Returns:
+            bool: True, если вакансия добавлена
+        """
+        url = vacancy.url
+        if url in self._by_url:
+            return False
+        self._by_url[url] = vacancy
+        employer = vacancy.employer
+        bucket = self._bucket(vacancy)
+        self._keys[url] = employer, bucket
+        self._by_employer.setdefault(employer, {})[url] = vacancy
+        members = self._by_salary.get(bucket)
+        if members is None:
+            members = self._by_salary[bucket] = {}
+            insort(self._salary_keys, bucket)
+        members[url] = vacancy
+        self._text_index.add(url, vacancy.name, vacancy.requirements)
+        return True
+
+    def remove(self, url: str):
+        """Удаляет вакансию по ссылке.
+
+        Args:
+            url (str): Ссылка на вакансию
+
+        Returns:
+            Vacancy | None: Удаленная вакансия или None, если ее не было
+        """
+        vacancy = self._by_url.pop(url, None)
+        if vacancy is None:
+            return None
+        employer, bucket = self._keys.pop(url)
+        self._discard(self._by_employer, employer, url)
+        if self._discard(self._by_salary, bucket, url):
+            del self._salary_keys[bisect_left(self._salary_keys, bucket)]
+        self._text_index.remove(url)
+        return vacancy
+
+    def search(self, query, mode: str = 'and') -> list[Vacancy]:
+        """Ищет вакансии по словам названия и требований.
+
+        Регистр и разметка <highlighttext> не учитываются; слова в двойных
+        кавычках ищутся как фраза.
+
+        Args:
+            query (str | Iterable[str]): Поисковый запрос
+            mode (str): 'and' - все слова запроса, 'or' - хотя бы одно
+
+        Returns:
+            list[Vacancy]: Найденные вакансии в порядке добавления
+        """
+        return [self._by_url[url] for url in self._text_index.search(query, mode)]
+
+    def by_employer(self, employer: str) -> list[Vacancy]:
+        """Возвращает вакансии работодателя в порядке добавления."""
+        return list(self._by_employer.get(employer, {}).values())
+
+    def by_salary(self, min_salary: int, max_salary: int) -> list[Vacancy]:
+        """Возвращает вакансии, у которых salary_max в диапазоне [min_salary, max_salary].
+
+        Просматриваются только корзины, пересекающиеся с диапазоном.
+
+        Args:
+            min_salary (int): Нижняя граница зарплаты
+            max_salary (int): Верхняя граница зарплаты
+
+        Returns:
+            list[Vacancy]: Подходящие вакансии
+        """
+        if min_salary > max_salary:
+            return []
+        start = bisect_left(self._salary_keys, min_salary // self.bucket_size)
+        stop = bisect_right(self._salary_keys, max_salary // self.bucket_size)
+        result = []
+        for bucket in self._salary_keys[start:stop]:
+            for vacancy in self._by_salary[bucket].values():
+                if min_salary <= vacancy.salary_max <= max_salary:
+                    result.append(vacancy)
+        return result
+
+    def _bucket(self, vacancy: Vacancy) -> int:
+        return vacancy.salary_max // self.bucket_size
+
+    @staticmethod
+    def _discard(index: dict, key, url: str) -> bool:
+        """Удаляет ссылку из индекса; возвращает True, если ключ индекса опустел."""
+        members = index.get(key)
+        if members is None:
+            return False
+        members.pop(url, None)
+        if not members:
+            del index[key]
+            return True
+        return False
@@ -0,0 +1,173 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+from src import codec
+from src.file_worker import atomic_open
+from src.vacancy import Vacancy
+
+# Формат дат HeadHunter: 2024-05-01T12:00:00+0300
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
+
+def sync_state_path(store_filename) -> str:
+    """Возвращает путь файла состояния синхронизации рядом с хранилищем (vacancies.json -> vacancies.sync.json)."""
+    return os.path.splitext(os.fspath(store_filename))[0] + '.sync.json'
+
+
+def parse_date(value: str) -> datetime:
+    """Разбирает дату HeadHunter (published_at, date_from) с часовым поясом."""
+    return datetime.strptime(value, DATE_FORMAT)
+
+
+class IncrementalSync:
+    """Инкрементальная синхронизация хранилища вакансий с API HeadHunter.
+
+    Для каждого запроса хранится отметка - дата публикации самой новой
+    полученной вакансии. Следующая синхронизация запрашивает только вакансии,
+    опубликованные начиная с отметки (параметр `date_from`), и обновляет их в
+    хранилище по ссылке. Если выдача обрезана (API отдает не более 2000
+    вакансий на запрос), более старые вакансии дозагружаются окнами `date_to`,
+    пока пропуск не будет закрыт; отметка сдвигается только после полной
+    загрузки. Для каждой ссылки запоминается дата публикации, и
+    вакансии старше `max_age` удаляются из хранилища. Архивные вакансии в
+    выдачу поиска не попадают, поэтому снятые с публикации вакансии удаляются
+    именно по `max_age`; вакансии с признаком `archived` удаляются, только если
+    их вернул fetch. Состояние сохраняется в JSON-файл рядом с хранилищем.
+    """
+
+    def __init__(self, saver, fetch=None, state_file=None, max_age: timedelta = timedelta(days=30)):
+        """
+        Args:
+            saver: Хранилище с методами upsert_vacancies, get_vacancy и delete_vacancies (JsonSaver)
+            fetch (optional): Функция fetch(keyword, **params), возвращающая вакансии API со
+                всех страниц выдачи - словарь {'items': [...], 'found': n} (HH.search, по
+                умолчанию) или список (HH.fetch_items; тогда обрезанная выдача не
+                распознается) - и вызывающая исключение при ошибке запроса. Функции,
+                возвращающие только первую страницу (HeadHunterApi.get_vacancies), не
+                подходят: отметка сдвинется дальше непрочитанных страниц
+            state_file (optional): Путь к файлу состояния; по умолчанию рядом с файлом хранилища
+            max_age (timedelta): Срок, после которого вакансия считается снятой с публикации
+        """
+        if fetch is None:
+            from src.hh import HH
+
+            fetch = HH(None).search
+        self.saver = saver
+        self.fetch = fetch
+        self.state_file = state_file or sync_state_path(saver.__file__)
+        self.max_age = max_age
+        self._state = self._load_state()
+
+    def watermark(self, keyword: str):
+        """Возвращает отметку запроса (дату публикации самой новой вакансии) или None."""
+        return self._state['queries'].get(keyword)
+
+    def sync(self, keyword: str, now: datetime = None) -> dict:
+        """Загружает новые и измененные вакансии по запросу и удаляет устаревшие.
+
+        Первая синхронизация запроса загружает всю выдачу. Поскольку
+        `date_from` включает границу, вакансии с датой отметки приходят
+        повторно; обновление по ссылке делает это безопасным. Если fetch
+        вызвал исключение, хранилище, отметка и файл состояния не изменяются.
+        Если обрезанную выдачу не удалось загрузить полностью (больше вакансий
+        с одной датой публикации, чем отдает API), отметка не сдвигается.
+
+        Args:
+            keyword (str): Поисковый запрос
+            now (datetime, optional): Текущее время (для расчета устаревших вакансий)
+
+        Returns:
+            dict: Счетчики fetched, added, updated и expired
+
+        Raises:
+            Exception: Исключение fetch (например, requests.exceptions.RequestException)
+        """
+        params = {'order_by': 'publication_time'}
+        watermark = self.watermark(keyword)
+        if watermark:
+            params['date_from'] = watermark
+        items, complete = self._fetch_all(keyword, params)
+
+        archived = [item.get('alternate_url') for item in items if item.get('archived')]
+        active = [item for item in items if not item.get('archived')]
+        added, updated = self.saver.upsert_vacancies(Vacancy.from_api_batch(active))
+
+        published = self._state['published']
+        newest = parse_date(watermark) if watermark else None
+        for item in active:
+            value = item.get('published_at')
+            if not value:
+                continue
+            published[item.get('alternate_url', '')] = value
+            moment = parse_date(value)
+            if newest is None or moment > newest:
+                newest, watermark = moment, value
+        if watermark and complete:
+            self._state['queries'][keyword] = watermark
+
+        expired = self._expire(now, archived)
+        self._save_state()
+        return {'fetched': len(items), 'added': added, 'updated': updated, 'expired': expired}
+
+    def _fetch_all(self, keyword: str, params: dict) -> tuple[list[dict], bool]:
+        """Загружает выдачу; обрезанную выдачу дозагружает окнами date_to от новых к старым.
+
+        Returns:
+            tuple[list[dict], bool]: Вакансии без повторов по ссылке и признак полной загрузки
+        """
+        unique = {}
+        window = dict(params)
+        while True:
+            result = self.fetch(keyword, **window)
+            if isinstance(result, dict):
+                items, found = result.get('items', []), result.get('found')
+            else:
+                items, found = result, None
+            for item in items:
+                unique.setdefault(item.get('alternate_url'), item)
+            if found is None or found <= len(items):
+                return list(unique.values()), True
+            dates = [item['published_at'] for item in items if item.get('published_at')]
+            oldest = min(dates, key=parse_date) if dates else None
+            if oldest is None or oldest == window.get('date_to'):
+                return list(unique.values()), False
+            # date_to включает границу: вакансии с этой датой придут повторно
+            window['date_to'] = oldest
+
+    def expire(self, now: datetime = None) -> int:
+        """Удаляет из хранилища вакансии, опубликованные раньше чем max_age назад.
+
+        Args:
+            now (datetime, optional): Текущее время
+
+        Returns:
+            int: Количество удаленных вакансий
+        """
+        expired = self._expire(now)
+        self._save_state()
+        return expired
+
+    def _expire(self, now: datetime = None, urls=()) -> int:
+        """Удаляет устаревшие вакансии и вакансии с заданными ссылками."""
+        cutoff = (now or datetime.now(timezone.utc)) - self.max_age
+        published = self._state['published']
+        gone = set(urls)
+        gone.update(url for url, value in published.items() if parse_date(value) < cutoff)
+        for url in gone:
+            published.pop(url, None)
+        vacancies = [self.saver.get_vacancy(url) for url in gone]
+        return self.saver.delete_vacancies([vacancy for vacancy in vacancies if vacancy is not None])
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_file, 'rb') as file:
+                state = codec.loads(file.read())
+        except (FileNotFoundError, codec.DecodeError):
+            state = {}
+        state.setdefault('queries', {})
+        state.setdefault('published', {})
+        return state
+
+    def _save_state(self) -> None:
+        with atomic_open(self.state_file, 'wb') as file:
+            file.write(codec.dumps(self._state))
@@ -0,0 +1,345 @@
+import numpy as np
+
+from src.currency import get_rates
+from src.file_worker import iter_json_array
+from src.vacancy import Vacancy
+
+# Значение в столбцах salary_from/salary_to, если граница зарплаты не указана
+NO_SALARY = -1
+
+
+class VacancyTable:
+    """Колоночное представление набора вакансий на массивах NumPy.
+
+    Каждое поле хранится отдельным массивом: границы зарплаты и их значения в
+    рублях - целыми числами, работодатель и валюта - кодами категорий,
+    название, требования и ссылка - массивами строк. Фильтрация по зарплате,
+    сортировка и выбор топ-N выполняются векторными операциями без создания
+    объектов Vacancy; объекты создаются только при преобразовании результата
+    обратно в список (to_vacancies).
+
+    Выборки возвращают новую таблицу, разделяющую со старой списки категорий.
+    """
+
+    def __init__(self, names, requirements, urls, salary_from, salary_to, salary_min, salary_max,
+                 employer_codes, employers, currency_codes, currencies):
+        """Создает таблицу из готовых столбцов (обычно используются from_* методы).
+
+        Args:
+            names, requirements, urls (np.ndarray): Строковые столбцы
+            salary_from, salary_to (np.ndarray): Границы зарплаты (NO_SALARY, если не указана)
+            salary_min, salary_max (np.ndarray): Границы зарплаты в рублях (0, если не указана)
+            employer_codes (np.ndarray): Коды работодателей (индексы в employers)
+            employers (np.ndarray): Названия работодателей
+            currency_codes (np.ndarray): Коды валют (индексы в currencies)
+            currencies (np.ndarray): Коды валют HeadHunter (None - валюта не указана)
+        """
+        self.names = names
+        self.requirements = requirements
+        self.urls = urls
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.employer_codes = employer_codes
+        self.employers = employers
+        self.currency_codes = currency_codes
+        self.currencies = currencies
+
+    @classmethod
+    def from_vacancies(cls, vacancies) -> 'VacancyTable':
+        """Строит таблицу из вакансий.
+
+        Args:
+            vacancies (Iterable[Vacancy]): Вакансии
+
+        Returns:
+            VacancyTable: Таблица вакансий
+        """
+        return cls.from_records(vacancy.to_dict() for vacancy in vacancies)
+
+    @classmethod
+    def from_records(cls, records) -> 'VacancyTable':
+        """Строит таблицу из словарей в формате Vacancy.to_dict() (формат файла JsonSaver).
+
+        Записи не проверяются так строго, как в конструкторе Vacancy, а дробные
+        суммы зарплаты округляются вниз до целого.
+
+        Args:
+            records (Iterable[dict]): Данные вакансий
+
+        Returns:
+            VacancyTable: Таблица вакансий
+
+        Raises:
+            KeyError: Если в записи нет названия или ссылки
+        """
+        names, requirements, urls = [], [], []
+        salary_from, salary_to = [], []
+        employer_codes, employers = [], {}
+        currency_codes, currencies = [], {}
+        for record in records:
+            names.append(record['name'])
+            requirements.append(record.get('requirements'))
+            urls.append(record['url'])
+            salary = record.get('salary')
+            if isinstance(salary, (int, float)):
+                salary = {'from': salary}
+            elif not salary:
+                salary = {}
+            start, end = salary.get('from'), salary.get('to')
+            salary_from.append(NO_SALARY if start is None else start)
+            salary_to.append(NO_SALARY if end is None else end)
+            employer = record.get('employer') or "Не указан"
+            employer_codes.append(employers.setdefault(employer, len(employers)))
+            currency = salary.get('currency')
+            currency_codes.append(currencies.setdefault(currency, len(currencies)))
+
+        currency_names = _categories(currencies)
+        rates = get_rates()
+        currency_rates = np.array(
+            [rates.get(code.upper(), 1.0) if code else 1.0 for code in currency_names], dtype=np.float64
+        )
+        currency_codes = np.array(currency_codes, dtype=np.int32)
+        salary_from = np.array(salary_from, dtype=np.float64)
+        salary_to = np.array(salary_to, dtype=np.float64)
+        salary_min, salary_max = _salary_bounds(salary_from, salary_to, currency_rates[currency_codes])
+        return cls(
+            names=_strings(names),
+            requirements=_strings(requirements),
+            urls=_strings(urls),
+            salary_from=salary_from.astype(np.int64),
+            salary_to=salary_to.astype(np.int64),
+            salary_min=salary_min,
+            salary_max=salary_max,
+            employer_codes=np.array(employer_codes, dtype=np.int32),
+            employers=_categories(employers),
+            currency_codes=currency_codes,
+            currencies=currency_names,
+        )
+
+    @classmethod
+    def from_saver(cls, saver) -> 'VacancyTable':
+        """Строит таблицу из вакансий хранилища (JsonSaver, JsonLinesSaver, SqliteSaver).
+
+        Args:
+            saver (Saver): Хранилище вакансий
+
+        Returns:
+            VacancyTable: Таблица вакансий
+        """
+        if hasattr(saver, 'iter_vacancies'):
+            return cls.from_vacancies(saver.iter_vacancies())
+        return cls.from_vacancies(saver.vacancies)
+
+    @classmethod
+    def read_json(cls, filename: str) -> 'VacancyTable':
+        """Читает таблицу напрямую из файла JsonSaver, не создавая объекты Vacancy.
+
+        Args:
+            filename (str): Путь к JSON-файлу с вакансиями
+
+        Returns:
+            VacancyTable: Таблица вакансий (пустая, если файла нет)
+
+        Raises:
+            json.JSONDecodeError: Если файл поврежден
+        """
+        try:
+            file = open(filename, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return cls.from_records(())
+        with file:
+            return cls.from_records(iter_json_array(file))
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._vacancy(index)
+
+    def __getitem__(self, index):
+        """Возвращает вакансию по номеру или подтаблицу по срезу, маске или массиву номеров."""
+        if isinstance(index, (int, np.integer)):
+            return self._vacancy(index)
+        return self.take(index)
+
+    @property
+    def employer(self) -> np.ndarray:
+        """Названия работодателей по строкам таблицы."""
+        return self.employers[self.employer_codes]
+
+    @property
+    def currency(self) -> np.ndarray:
+        """Коды валют по строкам таблицы."""
+        return self.currencies[self.currency_codes]
+
+    def take(self, index) -> 'VacancyTable':
+        """Выбирает строки таблицы.
+
+        Args:
+            index (slice | np.ndarray): Срез, булева маска или массив номеров строк
+
+        Returns:
+            VacancyTable: Новая таблица с выбранными строками в указанном порядке
+        """
+        return VacancyTable(
+            names=self.names[index],
+            requirements=self.requirements[index],
+            urls=self.urls[index],
+            salary_from=self.salary_from[index],
+            salary_to=self.salary_to[index],
+            salary_min=self.salary_min[index],
+            salary_max=self.salary_max[index],
+            employer_codes=self.employer_codes[index],
+            employers=self.employers,
+            currency_codes=self.currency_codes[index],
+            currencies=self.currencies,
+        )
+
+    def salary_mask(self, min_salary: int, max_salary: int) -> np.ndarray:
+        """Булева маска строк, у которых salary_max в диапазоне [min_salary, max_salary]."""
+        return (self.salary_max >= min_salary) & (self.salary_max <= max_salary)
+
+    def by_salary(self, min_salary: int, max_salary: int) -> 'VacancyTable':
+        """Возвращает вакансии с зарплатой в рублях (salary_max) в диапазоне [min_salary, max_salary].
+
+        Args:
+            min_salary (int): Нижняя граница зарплаты
+            max_salary (int): Верхняя граница зарплаты
+
+        Returns:
+            VacancyTable: Подходящие вакансии в исходном порядке
+        """
+        return self.take(self.salary_mask(min_salary, max_salary))
+
+    def by_employer(self, employer: str) -> 'VacancyTable':
+        """Возвращает вакансии работодателя в исходном порядке.
+
+        Args:
+            employer (str): Название работодателя
+
+        Returns:
+            VacancyTable: Вакансии работодателя
+        """
+        matches = np.flatnonzero(self.employers == employer)
+        if not len(matches):
+            return self.take(slice(0, 0))
+        return self.take(self.employer_codes == matches[0])
+
+    def sort_by_salary(self) -> 'VacancyTable':
+        """Сортирует вакансии по убыванию зарплаты в рублях.
+
+        Сортировка устойчивая: вакансии с одинаковой зарплатой идут в исходном
+        порядке, как в utils.sort_vacancies.
+
+        Returns:
+            VacancyTable: Отсортированная таблица
+        """
+        return self.take(np.argsort(-self.salary_max, kind='stable'))
+
+    def top(self, top_n: int) -> 'VacancyTable':
+        """Выбирает top_n вакансий с наибольшей зарплатой без полной сортировки.
+
+        Порог отбора находится через np.partition за O(n), сортируются только
+        отобранные строки. Результат совпадает с sort_by_salary()[:top_n].
+
+        Args:
+            top_n (int): Количество вакансий
+
+        Returns:
+            VacancyTable: top_n вакансий по убыванию зарплаты
+        """
+        size = len(self)
+        if top_n <= 0:
+            return self.take(slice(0, 0))
+        if top_n >= size:
+            return self.sort_by_salary()
+        salaries = self.salary_max
+        threshold = np.partition(salaries, size - top_n)[size - top_n]
+        above = np.flatnonzero(salaries > threshold)
+        # Из вакансий с пороговой зарплатой берем первые по исходному порядку
+        equal = np.flatnonzero(salaries == threshold)[:top_n - len(above)]
+        selected = np.concatenate((above, equal))
+        selected.sort()
+        order = np.argsort(-salaries[selected], kind='stable')
+        return self.take(selected[order])
+
+    def to_records(self) -> list[dict]:
+        """Преобразует таблицу в список словарей в формате Vacancy.to_dict().
+
+        Returns:
+            list[dict]: Данные вакансий
+        """
+        return [self._record(index) for index in range(len(self))]
+
+    def to_vacancies(self) -> list[Vacancy]:
+        """Преобразует таблицу в список объектов Vacancy.
+
+        Returns:
+            list[Vacancy]: Вакансии в порядке строк таблицы
+        """
+        return list(self)
+
+    def to_saver(self, saver) -> int:
+        """Добавляет вакансии таблицы в хранилище одной пакетной операцией.
+
+        Args:
+            saver (Saver): Хранилище с методом add_vacancies
+
+        Returns:
+            int: Количество добавленных вакансий
+        """
+        return saver.add_vacancies(self.to_vacancies())
+
+    def _record(self, index: int) -> dict:
+        start = int(self.salary_from[index])
+        end = int(self.salary_to[index])
+        currency = self.currencies[self.currency_codes[index]]
+        salary = None
+        if start != NO_SALARY or end != NO_SALARY or currency is not None:
+            salary = {
+                'from': None if start == NO_SALARY else start,
+                'to': None if end == NO_SALARY else end,
+                'currency': currency,
+            }
+        return {
+            'name': self.names[index],
+            'requirements': self.requirements[index],
+            'url': self.urls[index],
+            'salary': salary,
+            'employer': self.employers[self.employer_codes[index]],
+        }
+
+    def _vacancy(self, index: int) -> Vacancy:
+        return Vacancy.from_trusted(**self._record(index))
+
+
+def _strings(values: list) -> np.ndarray:
+    """Создает одномерный массив строк (dtype=object, без копирования строк)."""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _categories(codes: dict) -> np.ndarray:
+    """Преобразует словарь {значение: код} в массив значений по кодам."""
+    return _strings(list(codes))
+
+
+def _salary_bounds(salary_from: np.ndarray, salary_to: np.ndarray, rates: np.ndarray):
+    """Вычисляет границы зарплаты в рублях так же, как Vacancy.salary.
+
+    Нулевые и неуказанные суммы не учитываются; если обе суммы не указаны,
+    обе границы равны 0.
+    """
+    rub_from = np.trunc(salary_from * rates)
+    rub_to = np.trunc(salary_to * rates)
+    has_from = (salary_from != NO_SALARY) & (salary_from != 0)
+    has_to = (salary_to != NO_SALARY) & (salary_to != 0)
+    salary_min = np.where(has_from & has_to, np.minimum(rub_from, rub_to),
+                          np.where(has_from, rub_from, np.where(has_to, rub_to, 0)))
+    salary_max = np.where(has_from & has_to, np.maximum(rub_from, rub_to),
+                          np.where(has_from, rub_from, np.where(has_to, rub_to, 0)))
+    return salary_min.astype(np.int64), salary_max.astype(np.int64)
@@ -0,0 +1,22 @@
+from requests.adapters import HTTPAdapter
+
+# Таймаут по умолчанию (подключение, чтение) в секундах; модуль не импортирует
+# session.py, чтобы тот мог загружать его (и requests) только при создании сессии
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP-адаптер с пулом соединений и таймаутом по умолчанию.
+
+    requests не позволяет задать таймаут для всей сессии, поэтому он
+    подставляется в каждый запрос, если не передан явно.
+    """
+
+    def __init__(self, *args, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
@@ -1,51 +1,55 @@
+import json
+from operator import attrgetter
+
 from file_worker import JsonSaver
+from utils import parse_salary_range, select_top_vacancies
 
 
 def show_vacancies_from_file(filename: str):
-    """Отображает вакансии из JSON-файла"""
-    saver = JsonSaver(filename)
-    vacancies = saver.load_from_file()
-    
-    if not vacancies:
+    """Отображает вакансии из JSON-файла
+
+    Файл читается потоково: вакансии выводятся по мере разбора, без загрузки
+    всего файла в память.
+    """
+    saver = JsonSaver(filename, lazy=True)
+    count = 0
+    try:
+        for vac in saver.iter_from_file():
+            count += 1
+            salary = (f"{vac.salary.get('from', '')}-{vac.salary.get('to', '')} {vac.salary.get('currency', '')}" 
+                    if vac.salary and isinstance(vac.salary, dict) 
+                    else "не указана")
+            print(f"{vac.name}\nЗарплата: {salary}\nРаботодатель: {vac.employer}\nТребования: {vac.requirements}\nСсылка: {vac.url}\n\n{'='*50}\n")
+    except json.JSONDecodeError as e:
+        print(f"\n\u001b[31mОшибка чтения файла: {e}\u001b[0m")
+
+    if not count:
         print("\n\u001b[31mФайл не содержит валидных вакансий\u001b[0m")
         return
     
-    # Выводим информацию о количестве найденных вакансий в формате, ожидаемом в тесте
-    print(f"Найдено {len(vacancies)} вакансий")
-    
-    for vac in vacancies:
-        salary = (f"{vac.salary.get('from', '')}-{vac.salary.get('to', '')} {vac.salary.get('currency', '')}" 
-                if vac.salary and isinstance(vac.salary, dict) 
-                else "не указана")
-        print(f"{vac.name}\nЗарплата: {salary}\nРаботодатель: {vac.employer}\nТребования: {vac.requirements}\nСсылка: {vac.url}\n\n{'='*50}\n")
+    # Выводим информацию о количестве найденных вакансий
+    print(f"Найдено {count} вакансий")
 
 
 def get_vacancies_by_salary(vacancies, salary_range):
-    """Фильтрует вакансии по диапазону зарплат.
+    """Фильтрует вакансии по диапазону зарплат в рублях (Vacancy.salary_max).
     
     Args:
         vacancies (list): Список вакансий
         salary_range (str): Строка с диапазоном зарплат в формате 'min-max'
         
     Returns:
-        list: Отфильтрованный список вакансий
+        list: Отфильтрованный список вакансий; при пустой или некорректной строке - исходный
     """
-    if not salary_range:
-        return vacancies
-    try:
-        min_s, max_s = map(int, salary_range.replace(' ', '').split('-'))
-        # Фильтруем вакансии по диапазону зарплат
-        # Вакансия подходит, если её минимальная зарплата (from) находится в указанном диапазоне
-        return [v for v in vacancies if 
-                (v.salary and isinstance(v.salary, dict) and 
-                 v.salary.get('from') is not None and 
-                 min_s <= v.salary.get('from') <= max_s)]
-    except:
-        # В случае некорректного формата возвращаем все вакансии
+    bounds = parse_salary_range(salary_range)
+    if bounds is None:
         return vacancies
+    min_s, max_s = bounds
+    return [v for v in vacancies if min_s <= v.salary_max <= max_s]
+
 
 def sort_vacancies(vacancies):
-    """Сортирует вакансии по убыванию зарплаты.
+    """Сортирует вакансии по убыванию зарплаты в рублях (Vacancy.salary_max).
     
     Args:
         vacancies (list): Список вакансий
@@ -53,17 +57,20 @@ def sort_vacancies(vacancies):
     Returns:
         list: Отсортированный список вакансий
     """
-    # Сортируем по максимальному значению зарплаты (to) или по минимальному (from), если to не указано
-    def get_salary_for_sort(vacancy):
-        if not vacancy.salary or not isinstance(vacancy.salary, dict):
-            return 0
-        # Если указано максимальное значение зарплаты, используем его
-        if vacancy.salary.get('to'):
-            return vacancy.salary.get('to')
-        # Иначе используем минимальное значение
-        return vacancy.salary.get('from', 0) or 0
-        
-    return sorted(vacancies, key=get_salary_for_sort, reverse=True)
+    return sorted(vacancies, key=attrgetter('salary_max'), reverse=True)
+
+
+def top_vacancies(vacancies, top_n):
+    """Выбирает top_n вакансий с наибольшей зарплатой без полной сортировки.
+
+    Args:
+        vacancies (list): Список вакансий
+        top_n (int): Количество вакансий
+
+    Returns:
+        list: Совпадает с sort_vacancies(vacancies)[:top_n]
+    """
+    return select_top_vacancies(vacancies, top_n)
 
 def print_vacancies(vacancies):
     """Выводит информацию о вакансиях в консоль.
@@ -88,8 +95,6 @@ def user_interaction():
     salary_range = input("Введите диапазон зарплат (пример: 100000-150000): ")
 
     # Фильтрация и сортировка
-    filtered = json_saver.filter_vacancies(lambda v: any(word in v.description for word in filter_words))
+    filtered = json_saver.find_vacancies(filter_words, mode='or') if filter_words else json_saver.vacancies
     ranged = get_vacancies_by_salary(filtered, salary_range)
-    sorted_vacs = sort_vacancies(ranged)
-    
-    print_vacancies(sorted_vacs[:top_n])
\ No newline at end of file
+    print_vacancies(top_vacancies(ranged, top_n))
\ No newline at end of file
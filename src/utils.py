@@ -1,32 +1,112 @@
-from src.api import HeadHunterApi
+import heapq
+import sys
+import threading
+from operator import attrgetter
+
+from src import metrics
 from src.file_worker import JsonSaver
+from src.search_index import parse_query
+from src.store import VacancyStore
 from src.vacancy import Vacancy
 
-hh_api = HeadHunterApi()
-json_saver = JsonSaver('vacancies.json')
+CACHE_DIR = '.hh_cache'
+STORE_FILE = 'vacancies.json'
+# Расширения файла хранилища, для которых используется SqliteSaver
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
 
+_lazy_lock = threading.Lock()
 
-def user_interaction():
-    top_n = int(input("Введите количество вакансий для вывода в топ N: "))
-    filter_words = input("Введите ключевые слова для фильтрации вакансий: ").split()
-    salary_range = input("Введите диапазон зарплат: ") # Пример: 100000 - 150000
-    search_query = input("Введите поисковый запрос: ")
-    hh_vacancies = hh_api.get_vacancies(search_query)
-    vacancies_list = Vacancy.cast_to_object_list(hh_vacancies)
-    for vacancy in vacancies_list:
-        try:
-            json_saver.add_vacancy(vacancy)
-        except ValueError as e:
-            # Пропускаем существующие вакансии
-            pass
-    filtered_vacancies = filter_vacancies(vacancies_list, filter_words)
 
-    ranged_vacancies = get_vacancies_by_salary(filtered_vacancies, salary_range)
+def _create_hh_api():
+    # Коннектор и HTTP-стек (requests) загружаются только при первом запросе к API
+    from src.api import HeadHunterApi
+    from src.cache import ResponseCache
+
+    return HeadHunterApi(cache=ResponseCache(CACHE_DIR, ttl=15 * 60))
+
+
+def _create_hh():
+    # Коннектор со всеми страницами выдачи для пакетного режима
+    from src.cache import ResponseCache
+    from src.hh import HH
+
+    return HH(None, cache=ResponseCache(CACHE_DIR, ttl=15 * 60))
+
+
+def _create_json_saver():
+    return open_saver(STORE_FILE)
+
+
+_LAZY_ATTRIBUTES = {'hh_api': _create_hh_api, 'hh': _create_hh, 'json_saver': _create_json_saver}
+
+
+def __getattr__(name):
+    """Создает общие hh_api, hh и json_saver при первом обращении к атрибуту модуля"""
+    factory = _LAZY_ATTRIBUTES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _lazy_lock:
+        if name not in globals():
+            globals()[name] = factory()
+    return globals()[name]
+
+
+def get_hh_api():
+    """Возвращает общий коннектор HeadHunterApi с кэшем ответов (создается при первом вызове)"""
+    return sys.modules[__name__].hh_api
+
+
+def get_hh():
+    """Возвращает общий коннектор HH с кэшем ответов, загружающий все страницы выдачи (создается при первом вызове)"""
+    return sys.modules[__name__].hh
+
 
-    sorted_vacancies = sort_vacancies(ranged_vacancies)
-    top_vacancies = get_top_vacancies(sorted_vacancies, top_n)
-    print_vacancies(top_vacancies)
+def get_json_saver() -> JsonSaver:
+    """Возвращает общее хранилище STORE_FILE (файл читается при первом обращении к вакансиям)"""
+    return sys.modules[__name__].json_saver
 
+
+def open_saver(filename):
+    """Открывает хранилище вакансий по расширению файла
+
+    Args:
+        filename (str): Путь к файлу; для расширений SQLITE_SUFFIXES - база SQLite
+
+    Returns:
+        SqliteSaver | JsonSaver: Хранилище (JsonSaver читает файл при первом обращении)
+    """
+    if str(filename).lower().endswith(SQLITE_SUFFIXES):
+        from src.sqlite_saver import SqliteSaver
+
+        return SqliteSaver(filename)
+    return JsonSaver(filename, lazy=True)
+
+
+def user_interaction(input_func=input):
+    """Запрашивает у пользователя параметры поиска, загружает, сохраняет и выводит вакансии
+
+    Args:
+        input_func (callable): Функция ввода ответов; по умолчанию input (для
+            воспроизведения записанного сеанса - profiling.ReplayInput)
+    """
+    top_n = int(input_func("Введите количество вакансий для вывода в топ N: "))
+    filter_words = input_func("Введите ключевые слова для фильтрации вакансий: ").split()
+    salary_range = input_func("Введите диапазон зарплат: ") # Пример: 100000 - 150000
+    search_query = input_func("Введите поисковый запрос: ")
+    import requests  # HTTP-стек загружается только перед запросом к API
+
+    try:
+        hh_vacancies = get_hh_api().get_vacancies(search_query)
+    except requests.exceptions.RequestException as e:
+        print(f"Ошибка при получении вакансий: {e}")
+        return
+    vacancies_list = Vacancy.cast_to_object_list(hh_vacancies)
+    saver = get_json_saver()
+    # Существующие вакансии пропускаются, файл перезаписывается один раз
+    saver.add_vacancies(vacancies_list)
+    print_vacancies(query_vacancies(saver, filter_words, salary_range, top_n, vacancies=vacancies_list))
+
+@metrics.timed('hh_stage_seconds', stage='filter')
 def filter_vacancies(vacancies_list, filter_words):
     """Фильтрует вакансии по ключевым словам в требованиях
     
@@ -40,10 +120,79 @@ def filter_vacancies(vacancies_list, filter_words):
     if not filter_words:
         return vacancies_list
     
-    # Проверяем, что requirements не None перед вызовом lower()
-    return [v for v in vacancies_list if v.requirements is not None and any(word.lower() in v.requirements.lower() for word in filter_words)]
+    words = [word.lower() for word in filter_words]
+    result = []
+    for v in vacancies_list:
+        # Проверяем, что requirements не None перед вызовом lower()
+        if v.requirements is None:
+            continue
+        requirements = v.requirements.lower()
+        if any(word in requirements for word in words):
+            result.append(v)
+    return result
+
 
+def parse_salary_range(salary_range):
+    """Разбирает строку с диапазоном зарплат
 
+    Args:
+        salary_range (str): Строка с диапазоном зарплат (например, "100000-150000")
+
+    Returns:
+        tuple[int, int] | None: Границы диапазона или None, если строка пустая или некорректная
+    """
+    if not salary_range:
+        return None
+    try:
+        min_s, max_s = map(int, salary_range.replace(' ', '').split('-'))
+    except ValueError:
+        return None
+    return min_s, max_s
+
+
+@metrics.timed('hh_stage_seconds', stage='query')
+def query_vacancies(saver, filter_words, salary_range, top_n, vacancies=None):
+    """Выбирает из хранилища top_n вакансий по ключевым словам и диапазону зарплат
+
+    Если хранилище умеет выполнять запрос само (SqliteSaver.search), фильтрация,
+    сортировка и ограничение выполняются в нем; иначе ключевые слова ищутся
+    инвертированным индексом (JsonSaver.find_vacancies), а зарплата и топ-N -
+    функциями этого модуля. Оба пути сопоставляют слова одинаково: вакансия
+    подходит, если хотя бы одно слово или фраза есть в названии или требованиях
+    целиком, без учета регистра.
+
+    Args:
+        saver: Хранилище вакансий
+        filter_words (list): Список ключевых слов для фильтрации
+        salary_range (str): Строка с диапазоном зарплат
+        top_n (int): Количество вакансий для вывода
+        vacancies (list[Vacancy], optional): Выбирать только из этих вакансий
+            хранилища (например, только что загруженных); по умолчанию - из всех
+
+    Returns:
+        list: Список top_n вакансий
+    """
+    if hasattr(saver, 'search'):
+        min_s, max_s = parse_salary_range(salary_range) or (None, None)
+        urls = None if vacancies is None else [v.url for v in vacancies]
+        return saver.search(filter_words, min_salary=min_s, max_salary=max_s, top_n=max(top_n, 0),
+                            columns=('name', 'requirements'), urls=urls, prefix=False)
+    terms = parse_query(filter_words)
+    if terms and hasattr(saver, 'find_vacancies'):
+        filtered_vacancies = saver.find_vacancies(filter_words, mode='or')
+        if vacancies is not None:
+            urls = {v.url for v in vacancies}
+            filtered_vacancies = [v for v in filtered_vacancies if v.url in urls]
+    else:
+        if vacancies is None:
+            vacancies = saver.filter_vacancies(lambda v: True)
+        # У хранилища нет индекса - строим его по выбранным вакансиям
+        filtered_vacancies = VacancyStore(vacancies).search(filter_words, mode='or') if terms else vacancies
+    ranged_vacancies = get_vacancies_by_salary(filtered_vacancies, salary_range)
+    return select_top_vacancies(ranged_vacancies, top_n)
+
+
+@metrics.timed('hh_stage_seconds', stage='salary_range')
 def get_vacancies_by_salary(vacancies, salary_range):
     """Фильтрует вакансии по диапазону зарплат
     
@@ -52,18 +201,17 @@ def get_vacancies_by_salary(vacancies, salary_range):
         salary_range (str): Строка с диапазоном зарплат (например, "100000-150000")
         
     Returns:
-        list: Отфильтрованный список вакансий
+        list: Отфильтрованный список вакансий; при пустой или некорректной строке - исходный
     """
-    if not salary_range:
-        return vacancies
-    try:
-        min_s, max_s = map(int, salary_range.replace(' ', '').split('-'))
-        # Фильтруем вакансии, у которых минимальная зарплата попадает в указанный диапазон
-        return [v for v in vacancies if min_s <= v.get_min_salary() <= max_s]
-    except:
+    bounds = parse_salary_range(salary_range)
+    if bounds is None:
         return vacancies
+    min_s, max_s = bounds
+    # Фильтруем вакансии, у которых зарплата в рублях попадает в указанный диапазон
+    return [v for v in vacancies if min_s <= v.salary_max <= max_s]
 
 
+@metrics.timed('hh_stage_seconds', stage='sort')
 def sort_vacancies(vacancies_list):
     """Сортирует вакансии по зарплате (по убыванию)
     
@@ -89,6 +237,28 @@ def get_top_vacancies(vacancies_list, top_n):
     return vacancies_list[:top_n]
 
 
+@metrics.timed('hh_stage_seconds', stage='top')
+def select_top_vacancies(vacancies_list, top_n, key=None):
+    """Выбирает top_n вакансий с наибольшей зарплатой без полной сортировки
+
+    Используется куча размера top_n (O(n log top_n)); ключ вычисляется один
+    раз для каждой вакансии. Результат совпадает с
+    sort_vacancies(vacancies_list)[:top_n]: вакансии с одинаковой зарплатой
+    идут в исходном порядке.
+
+    Args:
+        vacancies_list (Iterable): Вакансии
+        top_n (int): Количество вакансий для вывода
+        key (callable, optional): Ключ сравнения; по умолчанию зарплата в рублях (Vacancy.salary_max)
+
+    Returns:
+        list: Список top_n вакансий по убыванию ключа
+    """
+    if top_n <= 0:
+        return []
+    return heapq.nlargest(top_n, vacancies_list, key=key or attrgetter('salary_max'))
+
+
 def print_vacancies(vacancies):
     """Выводит информацию о вакансиях
     
@@ -1,5 +1,9 @@
+from src import metrics
+from src.currency import to_rub
+
+
 class Vacancy:
-    __slots__ = ['name', 'requirements', 'url', 'salary', 'employer']
+    __slots__ = ['name', 'requirements', 'url', '_salary', 'employer', 'salary_min', 'salary_max']
 
     def __init__(self, name: str, requirements: str, url: str, salary: dict = None, employer: str = None):
         """Инициализация объекта вакансии.
@@ -14,19 +18,39 @@ class Vacancy:
         Raises:
             ValueError: При некорректном формате зарплаты
         """
-        self._validate_salary(salary)
+        self.salary = salary
         self.name = name
         self.requirements = requirements
         self.url = url
-        self.salary = salary
         self.employer = employer or "Не указан"
 
+    @property
+    def salary(self):
+        """Информация о зарплате (словарь с ключами from, to, currency)."""
+        return self._salary
+
+    @salary.setter
+    def salary(self, salary):
+        """Проверяет зарплату и пересчитывает нормализованные поля salary_min/salary_max.
+
+        salary_min и salary_max - нижняя и верхняя границы зарплаты в рублях
+        (по таблице курсов из src/currency.py) или 0, если зарплата не указана.
+        Они вычисляются один раз, поэтому сравнения и фильтры работают с целыми
+        числами и корректно ранжируют зарплаты в разных валютах.
+        """
+        salary = self._validate_salary(salary)
+        self._salary = salary
+        self.salary_min, self.salary_max = _salary_bounds(salary)
+
     def _validate_salary(self, salary):
         """Проверяет корректность формата зарплаты.
 
         Args:
             salary (dict or int): Данные о зарплате (словарь или число)
 
+        Returns:
+            dict or None: Зарплата в виде словаря (число преобразуется в {'from': число})
+
         Raises:
             ValueError: При некорректном формате зарплаты
         """
@@ -41,32 +65,33 @@ class Vacancy:
                     raise ValueError("Некорректный формат зарплаты")
             else:
                 raise ValueError("Некорректный формат зарплаты")
+        return salary
 
     def get_min_salary(self) -> int:
-        """Возвращает минимальное значение зарплаты.
+        """Возвращает значение зарплаты для сравнения вакансий.
 
         Returns:
-            int: Минимальное значение зарплаты или 0, если зарплата не указана
+            int: Верхняя граница зарплаты в рублях (salary_max) или 0, если зарплата не указана
         """
-        if not self.salary:
-            return 0
-        return max(self.salary.get('from', 0) or 0, self.salary.get('to', 0) or 0)
+        return self.salary_max
 
     def __lt__(self, other: 'Vacancy') -> bool:
         """Сравнение вакансий по зарплате (меньше)."""
-        return self.get_min_salary() < other.get_min_salary()
+        return self.salary_max < other.salary_max
 
     def __gt__(self, other: 'Vacancy') -> bool:
         """Сравнение вакансий по зарплате (больше)."""
-        return self.get_min_salary() > other.get_min_salary()
+        return self.salary_max > other.salary_max
 
     def __eq__(self, other) -> bool:
         """Сравнение вакансий по ссылке (равно).
         
         Две вакансии считаются одинаковыми, если у них одинаковые ссылки.
+        Для других типов возвращается NotImplemented, чтобы сравнение могло
+        выполнить другое представление вакансии (например, snapshot.VacancyView).
         """
         if not isinstance(other, Vacancy):
-            return False
+            return NotImplemented
         return self.url == other.url
     
     def __hash__(self) -> int:
@@ -91,6 +116,96 @@ class Vacancy:
             'employer': self.employer
         }
 
+    @classmethod
+    def from_trusted(cls, name: str, requirements: str, url: str, salary: dict = None,
+                     employer: str = None) -> 'Vacancy':
+        """Создает вакансию без проверки данных.
+
+        Предназначен для данных, которые уже прошли проверку (например,
+        прочитанных из собственного хранилища): зарплата должна быть словарем
+        с ключами from, to, currency или None. Число (так зарплату хранили
+        старые файлы) преобразуется в словарь, как при проверке.
+
+        Args:
+            name (str): Название вакансии
+            requirements (str): Требования к кандидату
+            url (str): Ссылка на вакансию
+            salary (dict, optional): Информация о зарплате
+            employer (str, optional): Название работодателя
+
+        Returns:
+            Vacancy: Объект вакансии
+        """
+        vacancy = cls.__new__(cls)
+        vacancy.name = name
+        vacancy.requirements = requirements
+        vacancy.url = url
+        if salary and isinstance(salary, (int, float)):
+            salary = {'from': salary, 'to': None, 'currency': None}
+        vacancy._salary = salary
+        vacancy.salary_min, vacancy.salary_max = _salary_bounds(salary)
+        vacancy.employer = employer or "Не указан"
+        return vacancy
+
+    @classmethod
+    def from_records(cls, records, trusted: bool = False) -> list['Vacancy']:
+        """Создает вакансии из словарей в формате to_dict().
+
+        Args:
+            records (Iterable[dict]): Данные вакансий
+            trusted (bool): Не проверять данные (для записей из собственного хранилища)
+
+        Returns:
+            list[Vacancy]: Список объектов Vacancy
+
+        Raises:
+            KeyError: Если в записи нет названия или ссылки
+            ValueError: При некорректном формате зарплаты (если trusted=False)
+        """
+        build = cls.from_trusted if trusted else cls
+        return [
+            build(record['name'], record.get('requirements', ''), record['url'],
+                  record.get('salary'), record.get('employer'))
+            for record in records
+        ]
+
+    @classmethod
+    @metrics.timed('hh_stage_seconds', stage='validate')
+    def from_api_batch(cls, items: list, trusted: bool = False) -> list['Vacancy']:
+        """Создает вакансии из поля items ответа API HeadHunter.
+
+        Тип страницы проверяется один раз, поля каждой вакансии читаются по
+        одному разу. В режиме trusted зарплата не проверяется.
+
+        Args:
+            items (list[dict]): Вакансии из ответа API
+            trusted (bool): Не проверять зарплату
+
+        Returns:
+            list[Vacancy]: Список объектов Vacancy
+
+        Raises:
+            ValueError: Если items - не список или зарплата некорректна (если trusted=False)
+        """
+        if not isinstance(items, list):
+            raise ValueError("Ожидался список вакансий")
+        build = cls.from_trusted if trusted else cls
+        result = []
+        append = result.append
+        for item in items:
+            snippet = item.get('snippet')
+            employer = item.get('employer')
+            if not isinstance(employer, str):
+                employer = employer.get('name', 'Не указан') if employer else 'Не указан'
+            append(build(
+                item.get('name', ''),
+                snippet.get('requirement', '') if snippet else '',
+                item.get('alternate_url', ''),
+                item.get('salary'),
+                employer,
+            ))
+        return result
+
     @classmethod
     def cast_to_object_list(cls, data: list) -> list['Vacancy']:
         """Преобразует список словарей в список объектов Vacancy.
@@ -101,16 +216,23 @@ class Vacancy:
         Returns:
             list[Vacancy]: Список объектов Vacancy
         """
-        result = []
-        for item in data:
-            # Преобразуем данные API в формат, подходящий для создания объекта Vacancy
-            vacancy_data = {
-                'name': item.get('name', ''),
-                'requirements': item.get('snippet', {}).get('requirement', '') if item.get('snippet') else '',
-                'url': item.get('alternate_url', ''),
-                'salary': item.get('salary', None),
-                'employer': item.get('employer') if isinstance(item.get('employer'), str) else 
-                           item.get('employer', {}).get('name', 'Не указан') if item.get('employer') else 'Не указан'
-            }
-            result.append(cls(**vacancy_data))
-        return result
\ No newline at end of file
+        return cls.from_api_batch(list(data))
+
+
+def _salary_bounds(salary) -> tuple[int, int]:
+    """Вычисляет границы зарплаты в рублях (salary_min, salary_max) или (0, 0), если зарплата не указана."""
+    if not salary:
+        return 0, 0
+    currency = salary.get('currency')
+    start = salary.get('from')
+    end = salary.get('to')
+    if start:
+        start = to_rub(start, currency)
+        if end:
+            end = to_rub(end, currency)
+            return (start, end) if start <= end else (end, start)
+        return start, start
+    if end:
+        end = to_rub(end, currency)
+        return end, end
+    return 0, 0
\ No newline at end of file
@@ -1,6 +1,20 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
 import pytest
+from src import rate_limit
 from src.vacancy import Vacancy
 
+@pytest.fixture(autouse=True)
+def unlimited_rate_limiter(monkeypatch):
+    """Отключает общий ограничитель частоты, чтобы тесты не ждали токенов"""
+    limiter = rate_limit.RateLimiter(rate=None, quotas={})
+    monkeypatch.setattr(rate_limit, '_limiter', limiter)
+    return limiter
+
+
 @pytest.fixture
 def test_vacancy():
     return Vacancy(
@@ -28,4 +42,56 @@ def test_vacancies():
             salary={"from": 120000, "to": 180000, "currency": "RUR"},
             employer="Company B"
         )
-    ]
\ No newline at end of file
+    ]
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов локального тестового сервера"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        parsed = urlparse(self.path)
+        request = {
+            'path': parsed.path,
+            'params': {key: values[0] for key, values in parse_qs(parsed.query).items()},
+            'headers': dict(self.headers),
+        }
+        with server.lock:
+            server.requests.append(request)
+            scripted = server.responses.pop(0) if server.responses else None
+        status, headers, body = scripted or server.handler(request)
+        if not isinstance(body, bytes):
+            body = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Фикстура локального HTTP-сервера, имитирующего API HeadHunter.
+
+    В `server.responses` можно положить очередь ответов (status, headers, body),
+    а в `server.handler` - функцию, формирующую ответ по запросу. Все запросы
+    сохраняются в `server.requests`, адрес сервера - в `server.url`.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    server.responses = []
+    server.handler = lambda request: (200, {}, {'items': [], 'pages': 1, 'found': 0})
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -1,11 +1,22 @@
+import asyncio
+import json
+import threading
+import time
+
 import pytest
 import requests
-from unittest.mock import patch, MagicMock
-from src.api import HeadHunterApi, ApiConnector
+from unittest.mock import MagicMock
+from src.api import HeadHunterApi, ApiConnector, AsyncHeadHunterApi, AsyncApiConnector
+from src.session import get_session
 
 # Тесты для API HeadHunter
 
 
+@pytest.fixture
+def mock_session():
+    """Фикстура для создания мок-объекта HTTP-сессии"""
+    return MagicMock(spec=requests.Session)
+
 
 def test_headhunter_api_instance():
     """Проверка создания экземпляра HeadHunterApi"""
@@ -14,15 +25,20 @@ def test_headhunter_api_instance():
     assert api._base_url == "https://api.hh.ru/"
 
 
-@patch('requests.get')
-def test_get_vacancies_success(mock_get):
+def test_headhunter_api_shared_session():
+    """Проверка, что по умолчанию используется общая сессия"""
+    assert HeadHunterApi()._session is get_session()
+    assert HeadHunterApi()._session is HeadHunterApi()._session
+
+
+def test_get_vacancies_success(mock_session):
     """Проверка успешного получения вакансий"""
 
     mock_response = MagicMock()
-    mock_response.json.return_value = {"items": [{"name": "Python Developer"}]}
-    mock_get.return_value = mock_response
+    mock_response.content = json.dumps({"items": [{"name": "Python Developer"}]}).encode()
+    mock_session.get.return_value = mock_response
     
-    api = HeadHunterApi()
+    api = HeadHunterApi(session=mock_session)
     result = api.get_vacancies("Python")
     
     # Проверки
@@ -31,33 +47,138 @@ def test_get_vacancies_success(mock_get):
     assert 'name' in result[0]
     assert result[0]['name'] == "Python Developer"
     
-    # Проверка вызова requests.get с правильными параметрами
-    mock_get.assert_called_once_with("https://api.hh.ru/vacancies", params={"text": "Python"})
+    # Проверка вызова session.get с правильными параметрами
+    mock_session.get.assert_called_once_with("https://api.hh.ru/vacancies", params={"text": "Python"})
+
 
+def test_get_vacancies_extra_params(mock_session):
+    """Проверка передачи дополнительных параметров запроса"""
+    mock_session.get.return_value.content = json.dumps({"items": []}).encode()
 
-@patch('requests.get')
-def test_get_vacancies_empty_response(mock_get):
+    api = HeadHunterApi(session=mock_session)
+    api.get_vacancies("Python", date_from="2024-05-01T12:00:00+0300", order_by="publication_time")
+
+    mock_session.get.assert_called_once_with("https://api.hh.ru/vacancies", params={
+        "text": "Python", "date_from": "2024-05-01T12:00:00+0300", "order_by": "publication_time"})
+
+
+def test_get_vacancies_empty_response(mock_session):
     """Проверка получения пустого списка вакансий"""
     mock_response = MagicMock()
-    mock_response.json.return_value = {"items": []}
-    mock_get.return_value = mock_response
+    mock_response.content = json.dumps({"items": []}).encode()
+    mock_session.get.return_value = mock_response
     
-    api = HeadHunterApi()
+    api = HeadHunterApi(session=mock_session)
     result = api.get_vacancies("NonExistentKeyword")
     
     assert isinstance(result, list)
     assert len(result) == 0
 
 
-@patch('requests.get')
-def test_get_vacancies_request_exception(mock_get):
-    """Проверка обработки исключения при запросе"""
-    mock_get.side_effect = requests.exceptions.RequestException("Connection error")
+def test_get_vacancies_request_exception(mock_session):
+    """Проверка, что ошибка запроса не превращается в пустой список"""
+    mock_session.get.side_effect = requests.exceptions.RequestException("Connection error")
     
-    api = HeadHunterApi()
-    result = api.get_vacancies("Python")
-    
-    assert result == []
+    api = HeadHunterApi(session=mock_session)
+    with pytest.raises(requests.exceptions.RequestException):
+        api.get_vacancies("Python")
+
+
+# Удаляем нерабочие тесты с проблемными запросами
+
+def _stub_page(request, pages=3):
+    """Формирует ответ тестового сервера для страницы выдачи"""
+    page = int(request['params'].get('page', 0))
+    text = request['params']['text']
+    items = [{"name": f"{text} {page}"}]
+    return 200, {}, {"items": items, "page": page, "pages": pages, "found": pages}
+
+
+def test_async_api_instance():
+    """Проверка создания экземпляра AsyncHeadHunterApi"""
+    api = AsyncHeadHunterApi()
+    assert isinstance(api, AsyncApiConnector)
+    assert api._session is get_session()
+
+
+def test_async_get_vacancies(stub_server):
+    """Проверка асинхронного получения вакансий с тестового сервера"""
+    stub_server.handler = _stub_page
+    api = AsyncHeadHunterApi(base_url=stub_server.url + "/")
+
+    result = asyncio.run(api.get_vacancies("Python"))
+
+    assert result == [{"name": "Python 0"}]
+    assert stub_server.requests[0]['path'] == "/vacancies"
+    assert stub_server.requests[0]['params'] == {"text": "Python"}
+
+
+def test_async_get_vacancies_error(stub_server):
+    """Проверка обработки ошибки при асинхронном запросе"""
+    stub_server.handler = lambda request: (404, {}, {})
+    api = AsyncHeadHunterApi(base_url=stub_server.url + "/")
+
+    with pytest.raises(requests.exceptions.RequestException):
+        asyncio.run(api.get_vacancies("Python"))
+
+
+def test_async_get_vacancies_many_errors(stub_server):
+    """Проверка, что ошибка одного запроса возвращается для своего ключевого слова или пробрасывается"""
+    stub_server.handler = lambda request: (404, {}, {}) if request["params"]["text"] == "bad" else _stub_page(request)
+    api = AsyncHeadHunterApi(base_url=stub_server.url + "/")
+
+    result = asyncio.run(api.get_vacancies_many(["Python", "bad"], return_exceptions=True))
+
+    assert result["Python"] == [{"name": "Python 0"}]
+    assert isinstance(result["bad"], requests.exceptions.HTTPError)
+    with pytest.raises(requests.exceptions.HTTPError):
+        asyncio.run(api.get_vacancies_many(["Python", "bad"]))
+
+
+def test_async_get_vacancies_many(stub_server):
+    """Проверка одновременного получения вакансий по нескольким запросам"""
+    stub_server.handler = _stub_page
+    api = AsyncHeadHunterApi(base_url=stub_server.url + "/")
+
+    result = asyncio.run(api.get_vacancies_many(["Python", "Java", "Python"]))
+
+    assert list(result) == ["Python", "Java"]
+    assert result["Java"] == [{"name": "Java 0"}]
+    assert len(stub_server.requests) == 2
+
+
+def test_async_concurrency_limit(stub_server):
+    """Проверка ограничения количества одновременных запросов"""
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return _stub_page(request)
+
+    stub_server.handler = handler
+    api = AsyncHeadHunterApi(base_url=stub_server.url + "/", max_concurrency=2)
+
+    result = asyncio.run(api.get_vacancies_many([f"kw{i}" for i in range(6)]))
+
+    assert len(result) == 6
+    assert state["peak"] <= 2
+
+
+def test_async_iter_pages(stub_server):
+    """Проверка асинхронного перебора страниц в порядке номеров"""
+    stub_server.handler = lambda request: _stub_page(request, pages=4)
+    api = AsyncHeadHunterApi(base_url=stub_server.url + "/", per_page=1)
+
+    async def collect():
+        return [page async for page in api.iter_pages("Python")]
 
+    pages = asyncio.run(collect())
 
-# Удаляем нерабочие тесты с проблемными запросами
\ No newline at end of file
+    assert pages == [[{"name": f"Python {i}"}] for i in range(4)]
+    assert all(r['params']['per_page'] == "1" for r in stub_server.requests)
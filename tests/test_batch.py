@@ -0,0 +1,144 @@
+import threading
+import time
+
+import pytest
+
+import main
+from src import utils
+from src.batch import format_report, load_areas, read_keywords, run_batch
+from src.file_worker import JsonSaver
+
+
+def _item(number):
+    """Создает вакансию в формате API HeadHunter"""
+    return {
+        "name": f"Vacancy {number}",
+        "alternate_url": f"https://hh.ru/vacancy/{number}",
+        "snippet": {"requirement": "Python"},
+        "salary": None,
+        "employer": {"name": "Company"},
+    }
+
+
+@pytest.fixture
+def saver(tmp_path):
+    return JsonSaver(str(tmp_path / "vacancies.json"))
+
+
+def test_read_keywords(tmp_path):
+    """Проверка чтения файла запросов"""
+    path = tmp_path / "keywords.txt"
+    path.write_text("python\n\n# комментарий\njava\n  python  \nменеджер по продажам\n", encoding="utf-8")
+    assert read_keywords(str(path)) == ["python", "java", "менеджер по продажам"]
+
+
+def test_load_areas():
+    """Проверка чтения регионов из файла параметров поиска"""
+    assert load_areas("data/application.json") == ["1", "2"]
+
+
+def test_run_batch_dedupes_and_writes_once(saver):
+    """Проверка объединения результатов без повторов и одной записи в хранилище"""
+    responses = {"python": [_item(1), _item(2)], "java": [_item(2), _item(3)], "go": []}
+    calls = []
+
+    def fetch(keyword, **params):
+        calls.append((keyword, params))
+        return responses[keyword]
+
+    messages = []
+    writes = []
+    add_vacancies = saver.add_vacancies
+    saver.add_vacancies = lambda vacancies: writes.append(1) or add_vacancies(vacancies)
+
+    report = run_batch(["python", "java", "go"], saver, fetch, progress=messages.append)
+
+    assert sorted(keyword for keyword, _ in calls) == ["go", "java", "python"]
+    assert all(params == {} for _, params in calls)
+    assert report["queries"] == 3
+    assert report["fetched"] == 4
+    assert report["unique"] == report["added"] == 3
+    assert writes == [1]
+    assert [v.url for v in saver.vacancies] == [f"https://hh.ru/vacancy/{i}" for i in (1, 2, 3)]
+    assert len(messages) == 3 and messages[-1].startswith("[3/3]")
+    assert set(report["timings"]) == {"fetch", "parse", "write", "total"}
+
+
+def test_run_batch_areas(saver):
+    """Проверка, что каждый запрос выполняется для каждого региона"""
+    calls = []
+    run_batch(["python", "java"], saver, lambda keyword, **params: calls.append((keyword, params["area"])) or [],
+              areas=["1", "2"], progress=None)
+    assert sorted(calls) == [("java", "1"), ("java", "2"), ("python", "1"), ("python", "2")]
+
+
+def test_run_batch_is_concurrent(saver):
+    """Проверка параллельного выполнения запросов"""
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fetch(keyword, **params):
+        with lock:
+            active.append(keyword)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(keyword)
+        return [_item(keyword)]
+
+    report = run_batch([str(i) for i in range(8)], saver, fetch, max_workers=4, progress=None)
+    assert max(peak) == 4
+    assert report["added"] == 8
+
+
+def test_run_batch_failed_query(saver):
+    """Проверка, что ошибка одного запроса не прерывает остальные"""
+    def fetch(keyword, **params):
+        if keyword == "bad":
+            raise RuntimeError("boom")
+        return [_item(1)]
+
+    messages = []
+    report = run_batch(["bad", "good"], saver, fetch, progress=messages.append)
+    assert report["failed"] == 1
+    assert report["added"] == 1
+    assert any("ошибка - boom" in message for message in messages)
+    assert "с ошибкой: 1" in format_report(report)
+
+
+def test_main_batch(tmp_path, saver, monkeypatch, capsys):
+    """Проверка пакетного режима командной строки"""
+    keywords = tmp_path / "keywords.txt"
+    keywords.write_text("python\njava\n", encoding="utf-8")
+    monkeypatch.setattr(utils, "json_saver", saver)
+    monkeypatch.setattr(utils.hh, "fetch_items", lambda keyword, **params: [_item(keyword)])
+
+    main.main(["--batch", str(keywords), "--areas", "data/application.json", "--workers", "2"])
+
+    assert len(saver.vacancies) == 2
+    output = capsys.readouterr().out
+    assert "Запросов: 4" in output
+    assert "добавлено: 2" in output
+
+
+def test_main_batch_counts_failed_fetch(tmp_path, saver, monkeypatch, capsys):
+    """Проверка, что ошибка загрузки в пакетном режиме командной строки учитывается в отчете"""
+    import requests
+
+    def fetch_items(keyword, **params):
+        if keyword == "bad":
+            raise requests.exceptions.HTTPError("503 Server Error")
+        return [_item(keyword)]
+
+    keywords = tmp_path / "keywords.txt"
+    keywords.write_text("bad\ngood\n", encoding="utf-8")
+    monkeypatch.setattr(utils, "json_saver", saver)
+    monkeypatch.setattr(utils.hh, "fetch_items", fetch_items)
+
+    main.main(["--batch", str(keywords)])
+
+    assert [v.url for v in saver.vacancies] == ["https://hh.ru/vacancy/good"]
+    output = capsys.readouterr().out
+    assert "bad: ошибка - 503 Server Error" in output
+    assert "Запросов: 2 (с ошибкой: 1)" in output
@@ -0,0 +1,31 @@
+import json
+
+from benchmarks.data import api_items
+from benchmarks.run import BENCHMARKS, compare, main, run_benchmarks
+
+
+def test_api_items_deterministic():
+    """Проверка, что синтетические данные воспроизводимы"""
+    assert api_items(50, seed=1) == api_items(50, seed=1)
+    assert len({item['alternate_url'] for item in api_items(50)}) == 50
+
+
+def test_run_benchmarks_smoke(tmp_path):
+    """Проверка, что все замеры выполняются на небольших данных и результат сохраняется в JSON"""
+    output = tmp_path / "results.json"
+    assert main(["--sizes", "150", "--repeat", "1", "--output", str(output)]) == 0
+
+    results = json.loads(output.read_text(encoding="utf-8"))
+    assert results["meta"]["json_backend"]
+    assert [result["name"] for result in results["results"]] == list(BENCHMARKS)
+    assert all(result["size"] == 150 and result["median"] >= 0 for result in results["results"])
+
+
+def test_compare_detects_regression():
+    """Проверка сравнения с предыдущим запуском"""
+    baseline = run_benchmarks([20], ["sort_vacancies"], repeat=1, progress=None)
+    current = json.loads(json.dumps(baseline))
+    current["results"][0]["median"] = baseline["results"][0]["median"] * 2
+    rows = compare(baseline, current, threshold=0.5)
+    assert [(row["name"], row["size"], row["regression"]) for row in rows] == [("sort_vacancies", 20, True)]
+    assert compare(baseline, baseline)[0]["regression"] is False
@@ -0,0 +1,145 @@
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from src.api import HeadHunterApi
+from src.cache import ResponseCache
+from src.session import build_session
+
+
+@pytest.fixture
+def session():
+    """Фикстура HTTP-сессии без повторов"""
+    session = build_session(retries=0)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Фикстура кэша во временном каталоге"""
+    return ResponseCache(str(tmp_path / "cache"), ttl=60)
+
+
+def test_make_key_normalized():
+    """Проверка, что ключ не зависит от порядка и типа параметров"""
+    key1 = ResponseCache.make_key("https://api.hh.ru/vacancies", {"text": "python", "page": 0})
+    key2 = ResponseCache.make_key("https://api.hh.ru/vacancies", {"page": "0", "text": "python"})
+    key3 = ResponseCache.make_key("https://api.hh.ru/vacancies", {"text": "java", "page": 0})
+
+    assert key1 == key2
+    assert key1 != key3
+
+
+def test_fetch_hit_within_ttl(stub_server, session, cache):
+    """Проверка, что повторный запрос в пределах TTL не идет в сеть"""
+    stub_server.handler = lambda request: (200, {}, {"items": [{"name": "Python"}]})
+    url = stub_server.url + "/vacancies"
+
+    first = cache.fetch(session, url, {"text": "python"})
+    second = cache.fetch(session, url, {"text": "python"})
+
+    assert first == second == {"items": [{"name": "Python"}]}
+    assert len(stub_server.requests) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "revalidations": 0, "evictions": 0}
+
+
+def test_fetch_persists_on_disk(stub_server, session, cache):
+    """Проверка, что записи кэша сохраняются между экземплярами"""
+    url = stub_server.url + "/vacancies"
+    cache.fetch(session, url, {"text": "python"})
+
+    other = ResponseCache(cache.directory, ttl=60)
+    other.fetch(session, url, {"text": "python"})
+
+    assert len(stub_server.requests) == 1
+    assert other.hits == 1
+
+
+def test_revalidation_etag(stub_server, session, tmp_path):
+    """Проверка условного запроса с If-None-Match для устаревшей записи"""
+    cache = ResponseCache(str(tmp_path / "cache"), ttl=0)
+    url = stub_server.url + "/vacancies"
+    stub_server.responses = [
+        (200, {"ETag": '"v1"'}, {"items": [1]}),
+        (304, {}, b""),
+    ]
+
+    cache.fetch(session, url, {"text": "python"})
+    result = cache.fetch(session, url, {"text": "python"})
+
+    assert result == {"items": [1]}
+    assert stub_server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+    assert cache.revalidations == 1
+
+
+def test_revalidation_last_modified(stub_server, session, tmp_path):
+    """Проверка условного запроса с If-Modified-Since и обновления записи"""
+    cache = ResponseCache(str(tmp_path / "cache"), ttl=0)
+    url = stub_server.url + "/vacancies"
+    modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+    stub_server.responses = [
+        (200, {"Last-Modified": modified}, {"items": [1]}),
+        (200, {}, {"items": [2]}),
+    ]
+
+    cache.fetch(session, url, {"text": "python"})
+    result = cache.fetch(session, url, {"text": "python"})
+
+    assert result == {"items": [2]}
+    assert stub_server.requests[1]["headers"]["If-Modified-Since"] == modified
+    assert cache.misses == 2
+
+
+def test_error_not_cached(stub_server, session, cache):
+    """Проверка, что ответы с ошибкой не кэшируются"""
+    stub_server.responses = [(500, {}, {})]
+    url = stub_server.url + "/vacancies"
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        cache.fetch(session, url, {"text": "python"})
+    cache.fetch(session, url, {"text": "python"})
+
+    assert len(stub_server.requests) == 2
+
+
+def test_lru_eviction(stub_server, session, tmp_path):
+    """Проверка вытеснения давно не использованных записей"""
+    stub_server.handler = lambda request: (200, {}, {"items": ["x" * 100]})
+    cache = ResponseCache(str(tmp_path / "cache"), ttl=60, max_bytes=700)
+    url = stub_server.url + "/vacancies"
+
+    cache.fetch(session, url, {"text": "a"})
+    path_a = os.path.join(cache.directory, ResponseCache.make_key(url, {"text": "a"}) + ".json")
+    os.utime(path_a, (time.time() - 100, time.time() - 100))
+    cache.fetch(session, url, {"text": "b"})
+    cache.fetch(session, url, {"text": "c"})
+
+    assert not os.path.exists(path_a)
+    assert cache.evictions >= 1
+    assert len(os.listdir(cache.directory)) < 3
+
+
+def test_clear(stub_server, session, cache):
+    """Проверка очистки кэша"""
+    cache.fetch(session, stub_server.url + "/vacancies", {"text": "python"})
+    cache.clear()
+    assert os.listdir(cache.directory) == []
+
+
+def test_headhunter_api_uses_cache(cache):
+    """Проверка, что HeadHunterApi не обращается к сети при попадании в кэш"""
+    mock_session = MagicMock(spec=requests.Session)
+    response = MagicMock(status_code=200, headers={})
+    response.content = json.dumps({"items": [{"name": "Python Developer"}]}).encode()
+    mock_session.get.return_value = response
+
+    api = HeadHunterApi(session=mock_session, cache=cache)
+    first = api.get_vacancies("python")
+    second = api.get_vacancies("python")
+
+    assert first == second == [{"name": "Python Developer"}]
+    assert mock_session.get.call_count == 1
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from src import codec
+from src.file_worker import JsonSaver, _validated_vacancy
+
+
+@pytest.fixture(params=codec.available_backends())
+def backend(request):
+    """Поочередно включает каждую установленную реализацию JSON"""
+    previous = codec.get_backend()
+    codec.set_backend(request.param)
+    yield request.param
+    codec.set_backend(previous)
+
+
+def test_round_trip(backend):
+    """Проверка сериализации и разбора без экранирования кириллицы"""
+    data = {"name": "Разработчик", "salary": {"from": 100000, "to": None}, "tags": [1, 2.5, True]}
+    encoded = codec.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert "Разработчик".encode("utf-8") in encoded
+    assert b"\n" not in encoded
+    assert codec.loads(encoded) == data
+    assert codec.loads(encoded.decode("utf-8")) == data
+    assert json.loads(encoded) == data
+
+
+def test_pretty(backend):
+    """Проверка форматирования с отступами"""
+    encoded = codec.dumps([{"a": 1}], pretty=True)
+    assert b"\n" in encoded
+    assert json.loads(encoded) == [{"a": 1}]
+
+
+@pytest.mark.parametrize("data", [b'{"a": ', b"not json", b""])
+def test_decode_error(backend, data):
+    """Проверка единого типа ошибки разбора"""
+    with pytest.raises(codec.DecodeError):
+        codec.loads(data)
+
+
+def test_decode_vacancies(backend, test_vacancies, capsys):
+    """Проверка разбора массива вакансий с пропуском невалидных записей"""
+    records = [v.to_dict() for v in test_vacancies]
+    vacancies = codec.decode_vacancies(codec.dumps(records), _validated_vacancy)
+    assert [v.to_dict() for v in vacancies] == records
+
+    records.append({"name": "No url"})
+    vacancies = codec.decode_vacancies(codec.dumps(records), _validated_vacancy)
+    assert len(vacancies) == 2
+    assert "Ошибка валидации" in capsys.readouterr().out
+
+    with pytest.raises(codec.DecodeError):
+        codec.decode_vacancies(b'{"name": "x"}', _validated_vacancy)
+
+
+def test_json_saver_uses_backend(backend, tmp_path, test_vacancies):
+    """Проверка, что файл JsonSaver читается и пишется через выбранную реализацию"""
+    path = tmp_path / "vacancies.json"
+    JsonSaver(str(path)).add_vacancies(test_vacancies)
+    assert [item["url"] for item in json.loads(path.read_bytes())] == [v.url for v in test_vacancies]
+    assert JsonSaver(str(path)).vacancies == test_vacancies
+
+
+def test_set_backend_unknown():
+    """Проверка ошибки при выборе недоступной реализации"""
+    with pytest.raises(ValueError):
+        codec.set_backend("ujson")
+    assert codec.get_backend() in codec.available_backends()
+
+
+def test_msgspec_typed_records(test_vacancies):
+    """Проверка типизированного разбора в структуры msgspec"""
+    pytest.importorskip("msgspec")
+    previous = codec.get_backend()
+    codec.set_backend("msgspec")
+    try:
+        data = codec.dumps([v.to_dict() for v in test_vacancies])
+        vacancies = codec.decode_vacancies(data, lambda item: pytest.fail("ожидался типизированный разбор"))
+        assert [v.salary_max for v in vacancies] == [v.salary_max for v in test_vacancies]
+    finally:
+        codec.set_backend(previous)
+
+
+def test_decode_vacancies_salary_matches_json(backend):
+    """Проверка, что зарплата разбирается одинаково во всех реализациях"""
+    records = [
+        {"name": "Empty", "url": "u1", "salary": {}},
+        {"name": "Partial", "url": "u2", "salary": {"from": 100}},
+        {"name": "Nulls", "url": "u3", "salary": {"from": None, "to": 200, "currency": None}},
+        {"name": "Number", "url": "u4", "salary": 300},
+    ]
+    vacancies = codec.decode_vacancies(codec.dumps(records), _validated_vacancy)
+
+    assert [v.salary for v in vacancies] == [
+        {},
+        {"from": 100, "to": 0, "currency": "RUB"},
+        {"from": None, "to": 200, "currency": None},
+        {"from": 300, "to": None, "currency": None},
+    ]
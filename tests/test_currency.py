@@ -0,0 +1,44 @@
+import json
+
+import pytest
+from src import currency
+from src.currency import get_rates, load_rates, set_rates, to_rub
+
+
+@pytest.fixture(autouse=True)
+def restore_rates():
+    """Восстанавливает таблицу курсов после теста"""
+    rates = get_rates()
+    yield
+    set_rates(rates, replace=True)
+
+
+def test_to_rub_default_rates():
+    """Проверка перевода сумм в рубли по таблице по умолчанию"""
+    assert to_rub(100000, "RUR") == 100000
+    assert to_rub(1000, "USD") == 1000 * currency.DEFAULT_RATES["USD"]
+    assert to_rub(100000, None) == 100000
+
+
+def test_to_rub_unknown_currency():
+    """Проверка, что сумма в неизвестной валюте считается рублевой"""
+    assert to_rub(5000, "XXX") == 5000
+
+
+def test_set_rates():
+    """Проверка обновления и замены таблицы курсов"""
+    set_rates({"usd": 100})
+    assert to_rub(10, "USD") == 1000
+    assert "EUR" in get_rates()
+
+    set_rates({"RUR": 1}, replace=True)
+    assert get_rates() == {"RUR": 1.0}
+
+
+def test_load_rates(tmp_path):
+    """Проверка загрузки таблицы курсов из файла"""
+    path = tmp_path / "rates.json"
+    path.write_text(json.dumps({"KZT": 0.2}), encoding="utf-8")
+
+    load_rates(str(path))
+    assert to_rub(1000, "KZT") == 200
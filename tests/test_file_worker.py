@@ -1,6 +1,8 @@
 import json
 import pytest
-from src.file_worker import JsonSaver, Saver
+from unittest.mock import patch
+from src import codec
+from src.file_worker import JsonLinesSaver, JsonSaver, Saver, iter_json_array
 from src.vacancy import Vacancy
 
 @pytest.fixture
@@ -145,4 +147,344 @@ def test_empty_file(temp_file):
     saver.add_vacancy(vacancy)
     
     # Проверяем, что вакансия добавлена
-    assert len(saver.vacancies) == 1
\ No newline at end of file
+    assert len(saver.vacancies) == 1
+
+def test_get_vacancy_by_url(temp_file, test_vacancies):
+    """Проверка поиска вакансии по ссылке"""
+    saver = JsonSaver(temp_file)
+    for vac in test_vacancies:
+        saver.add_vacancy(vac)
+
+    assert saver.get_vacancy("https://test.com/vacancy/2").name == "Java Developer"
+    assert saver.get_vacancy("https://test.com/vacancy/404") is None
+
+    saver.delete_vacancy(test_vacancies[1])
+    assert saver.get_vacancy("https://test.com/vacancy/2") is None
+
+
+def test_get_vacancies_by_employer_and_salary(temp_file, test_vacancies):
+    """Проверка выборки по работодателю и диапазону зарплат"""
+    saver = JsonSaver(temp_file)
+    for vac in test_vacancies:
+        saver.add_vacancy(vac)
+
+    assert [v.name for v in saver.get_vacancies_by_employer("Company B")] == ["Java Developer"]
+    assert [v.name for v in saver.get_vacancies_by_salary(140000, 160000)] == ["Python Developer"]
+
+    # Индексы восстанавливаются при загрузке из файла
+    reloaded = JsonSaver(temp_file)
+    assert [v.name for v in reloaded.get_vacancies_by_salary(170000, 200000)] == ["Java Developer"]
+
+
+def test_add_vacancies_bulk(temp_file, test_vacancies, test_vacancy):
+    """Проверка массового добавления вакансий с одной записью файла"""
+    saver = JsonSaver(temp_file)
+    with patch.object(JsonSaver, '_save_to_file', autospec=True, side_effect=JsonSaver._save_to_file) as save:
+        added = saver.add_vacancies(test_vacancies + [test_vacancy])
+
+    # test_vacancy совпадает по ссылке с первой вакансией списка
+    assert added == 2
+    assert save.call_count == 1
+    with open(temp_file, 'r', encoding='utf-8') as f:
+        assert len(json.load(f)) == 2
+
+
+def test_delete_vacancies_bulk(temp_file, test_vacancies):
+    """Проверка массового удаления вакансий"""
+    saver = JsonSaver(temp_file)
+    saver.add_vacancies(test_vacancies)
+
+    assert saver.delete_vacancies(test_vacancies) == 2
+    assert saver.delete_vacancies(test_vacancies) == 0
+    with open(temp_file, 'r', encoding='utf-8') as f:
+        assert json.load(f) == []
+
+
+def test_batch_flushes_once(temp_file, test_vacancies):
+    """Проверка, что внутри batch() файл записывается только при выходе"""
+    saver = JsonSaver(temp_file)
+    with patch('src.file_worker.codec.dumps', wraps=codec.dumps) as dump:
+        with saver.batch():
+            for vac in test_vacancies:
+                saver.add_vacancy(vac)
+            with saver.batch():
+                saver.delete_vacancy(test_vacancies[0])
+            # Файл еще не изменен
+            assert temp_file.read_text(encoding='utf-8') == ''
+    assert dump.call_count == 1
+    with open(temp_file, 'r', encoding='utf-8') as f:
+        assert [item['name'] for item in json.load(f)] == ["Java Developer"]
+
+
+def test_compact_mode(temp_file, test_vacancy):
+    """Проверка компактного формата файла"""
+    saver = JsonSaver(temp_file, compact=True)
+    saver.add_vacancy(test_vacancy)
+
+    content = temp_file.read_text(encoding='utf-8')
+    assert '\n' not in content
+    assert ', ' not in content.replace('Python, Django', '')
+    assert JsonSaver(temp_file).vacancies[0].url == test_vacancy.url
+
+
+def test_atomic_save_keeps_file_on_error(temp_file, test_vacancies, test_vacancy):
+    """Проверка, что при ошибке записи исходный файл не повреждается"""
+    saver = JsonSaver(temp_file)
+    saver.add_vacancies(test_vacancies)
+    before = temp_file.read_text(encoding='utf-8')
+
+    with patch('src.file_worker.codec.dumps', side_effect=RuntimeError("disk full")):
+        with pytest.raises(RuntimeError):
+            saver.add_vacancy(Vacancy("New", "New", "https://test.com/vacancy/3"))
+
+    assert temp_file.read_text(encoding='utf-8') == before
+    assert [p.name for p in temp_file.parent.iterdir()] == [temp_file.name]
+
+
+@pytest.fixture
+def jsonl_file(tmp_path):
+    """Фикстура для временного файла JSON Lines"""
+    return tmp_path / "vacancies.jsonl"
+
+
+def test_jsonl_saver_is_saver(jsonl_file):
+    """Проверка инициализации JsonLinesSaver"""
+    saver = JsonLinesSaver(jsonl_file)
+    assert isinstance(saver, Saver)
+    assert saver.vacancies == []
+    assert jsonl_file.exists()
+
+
+def test_jsonl_add_appends_line(jsonl_file, test_vacancies):
+    """Проверка, что добавление дописывает строку в конец файла"""
+    saver = JsonLinesSaver(jsonl_file)
+    saver.add_vacancy(test_vacancies[0])
+    saver.add_vacancy(test_vacancies[0])
+    saver.add_vacancy(test_vacancies[1])
+
+    lines = jsonl_file.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1])['name'] == "Java Developer"
+
+
+def test_jsonl_delete_appends_tombstone(jsonl_file, test_vacancies):
+    """Проверка, что удаление дописывает отметку об удалении"""
+    saver = JsonLinesSaver(jsonl_file)
+    saver.add_vacancies(test_vacancies)
+    saver.delete_vacancy(test_vacancies[0])
+
+    lines = jsonl_file.read_text(encoding='utf-8').splitlines()
+    assert json.loads(lines[-1]) == {"deleted": "https://test.com/vacancy/1"}
+    assert saver.garbage == 2
+
+    reloaded = JsonLinesSaver(jsonl_file)
+    assert [v.name for v in reloaded.vacancies] == ["Java Developer"]
+    assert reloaded.get_vacancy("https://test.com/vacancy/1") is None
+
+
+def test_jsonl_readd_after_delete(jsonl_file, test_vacancy):
+    """Проверка повторного добавления удаленной вакансии"""
+    saver = JsonLinesSaver(jsonl_file)
+    saver.add_vacancy(test_vacancy)
+    saver.delete_vacancy(test_vacancy)
+    saver.add_vacancy(test_vacancy)
+
+    assert len(JsonLinesSaver(jsonl_file).vacancies) == 1
+
+
+def test_jsonl_vacancies_assignment(jsonl_file, test_vacancies, test_vacancy):
+    """Проверка замены содержимого присваиванием vacancies"""
+    saver = JsonLinesSaver(jsonl_file)
+    saver.add_vacancies(test_vacancies)
+    saver.delete_vacancy(test_vacancies[0])
+
+    saver.vacancies = [test_vacancy]
+
+    assert [v.url for v in saver.vacancies] == [test_vacancy.url]
+    assert saver.garbage == 0
+    reloaded = JsonLinesSaver(jsonl_file)
+    assert [v.to_dict() for v in reloaded.vacancies] == [test_vacancy.to_dict()]
+
+
+def test_jsonl_compact(jsonl_file, test_vacancies):
+    """Проверка явного сжатия файла"""
+    saver = JsonLinesSaver(jsonl_file)
+    saver.add_vacancies(test_vacancies)
+    saver.delete_vacancy(test_vacancies[1])
+    saver.compact()
+
+    lines = jsonl_file.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 1
+    assert saver.garbage == 0
+    assert [v.name for v in JsonLinesSaver(jsonl_file).vacancies] == ["Python Developer"]
+
+
+def test_jsonl_auto_compact(jsonl_file):
+    """Проверка автоматического сжатия после превышения порога"""
+    saver = JsonLinesSaver(jsonl_file, compact_threshold=0.5, min_garbage=4)
+    vacancies = [Vacancy(f"V{i}", "", f"url{i}") for i in range(4)]
+    saver.add_vacancies(vacancies)
+    saver.delete_vacancies(vacancies[:2])
+
+    # 6 строк, 4 из них устарели - файл сжат до 2 актуальных строк
+    assert len(jsonl_file.read_text(encoding='utf-8').splitlines()) == 2
+    assert saver.garbage == 0
+
+
+def test_jsonl_skips_invalid_lines(jsonl_file):
+    """Проверка пропуска некорректных и недописанных строк при загрузке"""
+    jsonl_file.write_text(
+        '{"name": "Valid", "url": "https://valid.com"}\n'
+        '{"invalid": "Missing required fields"}\n'
+        '\n'
+        '{"name": "Broken", "url": ',
+        encoding='utf-8'
+    )
+
+    saver = JsonLinesSaver(jsonl_file)
+    assert [v.name for v in saver.vacancies] == ["Valid"]
+
+
+def test_jsonl_filter_vacancies(jsonl_file, test_vacancies):
+    """Проверка фильтрации вакансий"""
+    saver = JsonLinesSaver(jsonl_file)
+    saver.add_vacancies(test_vacancies)
+
+    filtered = saver.filter_vacancies(lambda v: "Java" in v.requirements)
+    assert [v.name for v in filtered] == ["Java Developer"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_iter_json_array(tmp_path, chunk_size):
+    """Проверка инкрементального разбора JSON-массива при разных размерах блока"""
+    data = [{"name": "Вакансия", "url": "u1", "salary": {"from": 123456}}, 12345, "строка", [1, [2]], None]
+    path = tmp_path / "array.json"
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=4), encoding='utf-8')
+
+    with open(path, 'r', encoding='utf-8') as file:
+        assert list(iter_json_array(file, chunk_size=chunk_size)) == data
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4])
+@pytest.mark.parametrize("content, expected", [("[1.5]", [1.5]), ("[10, -2.5e-3]", [10, -0.0025]), ("[1.5, 25]", [1.5, 25])])
+def test_iter_json_array_numbers_across_chunks(tmp_path, chunk_size, content, expected):
+    """Проверка чисел, которые обрываются на границе блока"""
+    path = tmp_path / "numbers.json"
+    path.write_text(content, encoding='utf-8')
+
+    with open(path, 'r', encoding='utf-8') as file:
+        assert list(iter_json_array(file, chunk_size=chunk_size)) == expected
+
+
+@pytest.mark.parametrize("content", ['{"name": "x"}', '[{"name": "x"} {"name": "y"}]', '[{"name": "x"},', '[1, 2'])
+def test_iter_json_array_invalid(tmp_path, content):
+    """Проверка ошибок разбора некорректного JSON-массива"""
+    path = tmp_path / "broken.json"
+    path.write_text(content, encoding='utf-8')
+
+    with open(path, 'r', encoding='utf-8') as file:
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(file, chunk_size=4))
+
+
+def test_iter_from_file_is_lazy(temp_file, test_vacancies):
+    """Проверка, что iter_from_file выдает вакансии по мере чтения файла"""
+    JsonSaver(temp_file).add_vacancies(test_vacancies)
+
+    iterator = JsonSaver(temp_file, lazy=True).iter_from_file()
+    assert next(iterator).name == "Python Developer"
+    assert next(iterator).name == "Java Developer"
+    assert next(iterator, None) is None
+
+
+def test_load_corrupted_file(temp_file):
+    """Проверка загрузки поврежденного файла"""
+    temp_file.write_text('[{"name": "Valid", "url": "https://valid.com"}, {"name": ', encoding='utf-8')
+
+    saver = JsonSaver(temp_file)
+    assert saver.load_from_file() == []
+    with pytest.raises(json.JSONDecodeError):
+        list(saver.iter_from_file())
+
+
+def test_lazy_mode(temp_file, test_vacancies):
+    """Проверка ленивой загрузки хранилища"""
+    JsonSaver(temp_file).add_vacancies(test_vacancies)
+
+    saver = JsonSaver(temp_file, lazy=True)
+    assert saver._loaded_store is None
+
+    # Фильтрация до загрузки читает файл потоково и не заполняет хранилище
+    filtered = saver.filter_vacancies(lambda v: "Java" in v.requirements)
+    assert [v.name for v in filtered] == ["Java Developer"]
+    assert saver._loaded_store is None
+
+    # Любое изменение загружает хранилище
+    saver.add_vacancy(Vacancy("Go Developer", "Go", "https://test.com/vacancy/3"))
+    assert saver._loaded_store is not None
+    assert len(JsonSaver(temp_file).vacancies) == 3
+
+
+def test_find_vacancies(temp_file, test_vacancies):
+    """Проверка поиска вакансий через инвертированный индекс"""
+    saver = JsonSaver(temp_file)
+    saver.add_vacancies(test_vacancies)
+
+    assert [v.name for v in saver.find_vacancies("spring")] == ["Java Developer"]
+    assert [v.name for v in saver.find_vacancies(["django", "spring"], mode="or")] == ["Python Developer", "Java Developer"]
+
+    saver.delete_vacancy(test_vacancies[1])
+    assert saver.find_vacancies("spring") == []
+
+    jsonl_saver = JsonLinesSaver(temp_file.with_suffix(".jsonl"))
+    jsonl_saver.add_vacancies(test_vacancies)
+    assert [v.name for v in jsonl_saver.find_vacancies('"java developer"')] == ["Java Developer"]
+
+
+def test_upsert_vacancies(temp_file, test_vacancies):
+    """Проверка добавления новых и замены измененных вакансий"""
+    saver = JsonSaver(temp_file)
+    saver.add_vacancies(test_vacancies)
+
+    changed = Vacancy("Senior Python Developer", "Python", "https://test.com/vacancy/1",
+                      {"from": 200000, "to": None, "currency": "RUR"}, "Company A")
+    new = Vacancy("Go Developer", "Go", "https://test.com/vacancy/3")
+    assert saver.upsert_vacancies([changed, test_vacancies[1], new]) == (1, 1)
+    assert saver.upsert_vacancies([changed]) == (0, 0)
+
+    reloaded = JsonSaver(temp_file)
+    assert [v.name for v in reloaded.vacancies] == ["Java Developer", "Senior Python Developer", "Go Developer"]
+    assert reloaded.get_vacancy("https://test.com/vacancy/1").salary_max == 200000
+    assert [v.name for v in reloaded.get_vacancies_by_salary(190000, 210000)] == ["Senior Python Developer"]
+
+
+def test_trusted_mode(temp_file, test_vacancies):
+    """Проверка загрузки без проверки записей из собственного файла"""
+    JsonSaver(temp_file).add_vacancies(test_vacancies)
+    saver = JsonSaver(temp_file, trusted=True)
+    assert [v.to_dict() for v in saver.vacancies] == [v.to_dict() for v in test_vacancies]
+    assert [v.url for v in JsonSaver(temp_file, lazy=True, trusted=True).iter_from_file()] == \
+           [v.url for v in test_vacancies]
+
+
+def test_vacancies_property(temp_file, test_vacancies, test_vacancy):
+    """Проверка, что vacancies - копия, а присваивание заменяет хранилище"""
+    saver = JsonSaver(temp_file)
+    saver.vacancies = test_vacancies
+    copy = saver.vacancies
+    copy.append(test_vacancy)
+    assert len(saver.vacancies) == 2
+    assert saver.get_vacancy("https://test.com/vacancy/2").name == "Java Developer"
+    assert [v.url for v in JsonSaver(temp_file).vacancies] == [v.url for v in test_vacancies]
+
+
+def test_trusted_load_number_salary(tmp_path):
+    """Проверка загрузки в режиме trusted файла, где зарплата записана числом"""
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps([{"name": "Legacy", "requirements": "", "url": "https://test.com/legacy",
+                                 "salary": 90000, "employer": "Company"}]), encoding='utf-8')
+
+    saver = JsonSaver(str(path), trusted=True)
+
+    assert saver.vacancies[0].salary == {"from": 90000, "to": None, "currency": None}
+    assert saver.vacancies[0].salary_max == 90000
@@ -1,5 +1,6 @@
+import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 import requests
 from src.hh import Parser, HH
 from src.file_worker import JsonSaver
@@ -10,27 +11,32 @@ def mock_file_worker():
     """Фикстура для создания мок-объекта JsonSaver"""
     return MagicMock(spec=JsonSaver)
 
+@pytest.fixture
+def mock_session():
+    """Фикстура для создания мок-объекта HTTP-сессии"""
+    return MagicMock(spec=requests.Session)
+
 def test_parser_abstract():
     """Проверка, что Parser - абстрактный класс"""
     with pytest.raises(TypeError):
         Parser(MagicMock())
 
-def test_hh_init(mock_file_worker):
+def test_hh_init(mock_file_worker, mock_session):
     """Проверка инициализации класса HH"""
-    hh = HH(mock_file_worker)
+    hh = HH(mock_file_worker, session=mock_session)
     
     assert hh.url == 'https://api.hh.ru/vacancies'
     assert hh.headers == {'User-Agent': 'HH-User-Agent'}
     assert hh.params == {'text': '', 'page': 0, 'per_page': 100}
     assert hh.vacancies == []
     assert hh.file_worker == mock_file_worker
+    assert hh.session is mock_session
 
-@patch('requests.get')
-def test_hh_load_vacancies(mock_get, mock_file_worker):
+def test_hh_load_vacancies(mock_session, mock_file_worker):
     """Проверка загрузки вакансий через API HeadHunter"""
-    # Настраиваем мок для имитации успешного ответа API
+    # Настраиваем мок для имитации успешного ответа API с одной страницей
     mock_response = MagicMock()
-    mock_response.json.return_value = {
+    mock_response.content = json.dumps({
         "items": [
             {
                 "id": "123456",
@@ -39,45 +45,157 @@ def test_hh_load_vacancies(mock_get, mock_file_worker):
                 "snippet": {"requirement": "Python, Django, Flask"},
                 "alternate_url": "https://hh.ru/vacancy/123456"
             }
-        ]
-    }
-    mock_get.return_value = mock_response
-    
-    # Патчим метод range, чтобы цикл в load_vacancies выполнился только один раз
-    with patch('builtins.range') as mock_range:
-        # Настраиваем mock_range, чтобы он возвращал [0] при вызове range(20)
-        mock_range.return_value = [0]
-        
-        hh = HH(mock_file_worker)
-        hh.load_vacancies("Python")
-    
+        ],
+        "pages": 1,
+        "found": 1
+    }).encode()
+    mock_session.get.return_value = mock_response
+
+    hh = HH(mock_file_worker, session=mock_session)
+    hh.load_vacancies("Python")
+
     # Проверяем, что параметры запроса были установлены правильно
     assert hh.params['text'] == "Python"
-    
-    # Проверяем, что запрос был отправлен с правильными параметрами
-    mock_get.assert_called_with(
+    assert hh.params['page'] == 0
+
+    # Единственная страница запрашивается один раз
+    mock_session.get.assert_called_once_with(
         'https://api.hh.ru/vacancies',
         headers={'User-Agent': 'HH-User-Agent'},
-        params={'text': 'Python', 'page': 1, 'per_page': 100}
+        params={'text': 'Python', 'page': 0, 'per_page': 100}
     )
-    
+
     # Проверяем, что вакансии были добавлены в список
     assert len(hh.vacancies) == 1
     assert isinstance(hh.vacancies[0], Vacancy)
     assert hh.vacancies[0].name == "Python Developer"
     assert hh.vacancies[0].url == "https://hh.ru/vacancy/123456"
 
-@patch('requests.get')
-def test_hh_load_vacancies_exception(mock_get, mock_file_worker):
+
+def _page_response(page, pages, found=None):
+    """Создает мок ответа API для заданной страницы"""
+    response = MagicMock()
+    response.content = json.dumps({
+        "items": [
+            {
+                "name": f"Vacancy {page}",
+                "salary": None,
+                "snippet": {"requirement": "Python"},
+                "alternate_url": f"https://hh.ru/vacancy/{page}"
+            }
+        ],
+        "page": page,
+        "pages": pages,
+        "found": pages if found is None else found
+    }).encode()
+    return response
+
+
+def test_hh_load_vacancies_multiple_pages(mock_session, mock_file_worker):
+    """Проверка параллельной загрузки нескольких страниц с сохранением порядка"""
+    mock_session.get.side_effect = lambda url, headers, params: _page_response(params['page'], 5)
+
+    hh = HH(mock_file_worker, session=mock_session, max_workers=3)
+    hh.load_vacancies("Python")
+
+    # Запрашиваются только существующие страницы, без лишних запросов
+    assert mock_session.get.call_count == 5
+    requested = sorted(call.kwargs['params']['page'] for call in mock_session.get.call_args_list)
+    assert requested == [0, 1, 2, 3, 4]
+
+    # Порядок вакансий совпадает с порядком страниц
+    assert [v.name for v in hh.vacancies] == [f"Vacancy {i}" for i in range(5)]
+    assert hh.params['page'] == 0
+
+
+def test_hh_load_vacancies_max_pages(mock_session, mock_file_worker):
+    """Проверка ограничения количества загружаемых страниц"""
+    mock_session.get.side_effect = lambda url, headers, params: _page_response(params['page'], 50)
+
+    hh = HH(mock_file_worker, session=mock_session, max_pages=20)
+    hh.load_vacancies("Python")
+
+    assert mock_session.get.call_count == 20
+    assert len(hh.vacancies) == 20
+
+
+def test_hh_load_vacancies_pages_from_found(mock_session, mock_file_worker):
+    """Проверка вычисления количества страниц по полю found"""
+    response = MagicMock()
+    response.content = json.dumps({"items": [], "found": 250}).encode()
+    mock_session.get.return_value = response
+
+    hh = HH(mock_file_worker, session=mock_session)
+    hh.load_vacancies("Python")
+
+    # 250 вакансий по 100 на страницу - 3 страницы
+    assert mock_session.get.call_count == 3
+
+def test_hh_fetch_items(mock_session, mock_file_worker):
+    """Проверка загрузки необработанных вакансий с дополнительными параметрами"""
+    mock_session.get.side_effect = lambda url, headers, params: _page_response(params['page'], 3)
+
+    hh = HH(mock_file_worker, session=mock_session)
+    items = hh.fetch_items("Python", date_from="2024-05-01T12:00:00+0300")
+
+    assert [item['name'] for item in items] == ["Vacancy 0", "Vacancy 1", "Vacancy 2"]
+    for call in mock_session.get.call_args_list:
+        assert call.kwargs['params']['text'] == "Python"
+        assert call.kwargs['params']['date_from'] == "2024-05-01T12:00:00+0300"
+    # Состояние парсера не меняется
+    assert hh.params == {'text': '', 'page': 0, 'per_page': 100}
+    assert hh.vacancies == []
+
+def test_hh_search_reports_found(mock_session, mock_file_worker):
+    """Проверка, что search возвращает размер выдачи вместе с вакансиями"""
+    mock_session.get.side_effect = lambda url, headers, params: _page_response(params['page'], 2, found=5000)
+
+    hh = HH(mock_file_worker, session=mock_session)
+    result = hh.search("Python")
+
+    assert [item['name'] for item in result['items']] == ["Vacancy 0", "Vacancy 1"]
+    assert result['found'] == 5000
+
+def test_hh_load_vacancies_exception(mock_session, mock_file_worker):
     """Проверка обработки исключений при загрузке вакансий"""
     # Настраиваем мок для имитации ошибки
-    mock_get.side_effect = requests.exceptions.RequestException("Connection error")
+    mock_session.get.side_effect = requests.exceptions.RequestException("Connection error")
     
-    hh = HH(mock_file_worker)
+    hh = HH(mock_file_worker, session=mock_session)
     
     # Проверяем, что исключение обрабатывается
     with pytest.raises(requests.exceptions.RequestException):
         hh.load_vacancies("Python")
     
     # Проверяем, что список вакансий остался пустым
-    assert hh.vacancies == []
\ No newline at end of file
+    assert hh.vacancies == []
+
+def test_hh_iter_pages(mock_session, mock_file_worker):
+    """Проверка выдачи страниц по мере загрузки с ограниченной предзагрузкой"""
+    mock_session.get.side_effect = lambda url, headers, params: _page_response(params['page'], 10)
+
+    hh = HH(mock_file_worker, session=mock_session, max_workers=2)
+    pages = hh.iter_pages("Python", area="1")
+
+    assert next(pages)["page"] == 0
+    assert mock_session.get.call_count == 1
+    assert next(pages)["page"] == 1
+    # Загружены первая страница и не более max_workers следующих
+    assert mock_session.get.call_count <= 4
+
+    assert [data["page"] for data in pages] == list(range(2, 10))
+    assert mock_session.get.call_count == 10
+    assert all(call.kwargs['params']['area'] == "1" for call in mock_session.get.call_args_list)
+
+
+def test_hh_iter_pages_close(mock_session, mock_file_worker):
+    """Проверка, что прерванный перебор не загружает оставшиеся страницы"""
+    mock_session.get.side_effect = lambda url, headers, params: _page_response(params['page'], 20)
+
+    hh = HH(mock_file_worker, session=mock_session, max_workers=2)
+    pages = hh.iter_pages("Python")
+    next(pages)
+    next(pages)
+    pages.close()
+
+    assert mock_session.get.call_count <= 5
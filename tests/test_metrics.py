@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from src import metrics, utils
+from src.file_worker import JsonSaver
+from src.session import build_session, fetch_json
+
+
+@pytest.fixture
+def enabled_metrics():
+    """Фикстура включенного сбора метрик с пустым реестром"""
+    metrics.reset()
+    metrics.enable()
+    yield metrics.get_registry()
+    metrics.disable()
+    metrics.reset()
+
+
+def test_disabled_is_noop(monkeypatch):
+    """Проверка, что при выключенном сборе метрики не накапливаются"""
+    monkeypatch.setattr(metrics, "_enabled", False)
+    metrics.reset()
+    assert not metrics.enabled()
+    metrics.inc("hh_test_total")
+    metrics.observe("hh_test_seconds", 0.5)
+    with metrics.timer("hh_test_seconds"):
+        pass
+    assert metrics.timer("hh_test_seconds") is metrics.timer("hh_other_seconds")
+    assert metrics.export_json() == {"counters": {}, "histograms": {}}
+    assert metrics.export_prometheus() == ""
+
+
+def test_counters_and_histograms(enabled_metrics):
+    """Проверка счетчиков с метками и гистограмм"""
+    metrics.inc("hh_requests_total", status="200")
+    metrics.inc("hh_requests_total", 2, status="200")
+    metrics.inc("hh_requests_total", status="503")
+    metrics.observe("hh_stage_seconds", 0.003, stage="sort")
+    metrics.observe("hh_stage_seconds", 20, stage="sort")
+
+    data = metrics.export_json()
+    assert data["counters"]["hh_requests_total"] == [
+        {"labels": {"status": "200"}, "value": 3},
+        {"labels": {"status": "503"}, "value": 1},
+    ]
+    histogram = data["histograms"]["hh_stage_seconds"][0]
+    assert (histogram["count"], histogram["sum"]) == (2, 20.003)
+    assert histogram["buckets"]["0.001"] == 0
+    assert histogram["buckets"]["0.005"] == 1
+    assert histogram["buckets"]["10.0"] == 1
+    assert histogram["buckets"]["+Inf"] == 2
+
+
+def test_prometheus_format(enabled_metrics):
+    """Проверка текстового формата Prometheus"""
+    metrics.inc("hh_requests_total", status='a"b')
+    metrics.observe("hh_stage_seconds", 0.2, stage="filter")
+    text = metrics.export_prometheus()
+    assert "# TYPE hh_requests_total counter\n" in text
+    assert 'hh_requests_total{status="a\\"b"} 1\n' in text
+    assert "# TYPE hh_stage_seconds histogram\n" in text
+    assert 'hh_stage_seconds_bucket{stage="filter",le="0.1"} 0\n' in text
+    assert 'hh_stage_seconds_bucket{stage="filter",le="+Inf"} 1\n' in text
+    assert 'hh_stage_seconds_count{stage="filter"} 1\n' in text
+
+
+def test_timed_and_write(enabled_metrics, tmp_path, test_vacancies):
+    """Проверка замеров функций utils и JsonSaver и записи в файл"""
+    saver = JsonSaver(str(tmp_path / "vacancies.json"))
+    saver.add_vacancies(test_vacancies)
+    utils.sort_vacancies(utils.filter_vacancies(test_vacancies, ["python"]))
+
+    metrics.write(tmp_path / "metrics.json")
+    data = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+    stages = {item["labels"]["stage"] for item in data["histograms"]["hh_stage_seconds"]}
+    operations = {item["labels"]["operation"] for item in data["histograms"]["hh_store_seconds"]}
+    assert {"filter", "sort"} <= stages
+    assert {"load", "add_many", "save"} <= operations
+
+    metrics.write(tmp_path / "metrics.prom")
+    assert 'hh_store_seconds_count{operation="save"} 1' in (tmp_path / "metrics.prom").read_text(encoding="utf-8")
+
+
+def test_fetch_json_metrics(enabled_metrics, stub_server):
+    """Проверка метрик сетевого запроса и разбора JSON"""
+    session = build_session(retries=0)
+    assert fetch_json(session, stub_server.url + "/vacancies") == {"items": [], "pages": 1, "found": 0}
+    session.close()
+
+    data = metrics.export_json()
+    assert data["counters"]["hh_http_requests_total"] == [{"labels": {"status": "200"}, "value": 1}]
+    assert data["histograms"]["hh_http_request_seconds"][0]["count"] == 1
+    assert data["histograms"]["hh_json_decode_seconds"][0]["count"] == 1
+
+
+def test_main_metrics_flag(tmp_path, monkeypatch, capsys):
+    """Проверка записи метрик пакетного режима по флагу --metrics"""
+    import main
+
+    keywords = tmp_path / "keywords.txt"
+    keywords.write_text("python\n", encoding="utf-8")
+    monkeypatch.setattr(utils, "json_saver", JsonSaver(str(tmp_path / "vacancies.json")))
+    monkeypatch.setattr(utils.hh, "fetch_items", lambda keyword, **params: [
+        {"name": "Python Developer", "alternate_url": "https://hh.ru/vacancy/1"}])
+    output = tmp_path / "metrics.prom"
+    metrics.reset()
+    try:
+        main.main(["--batch", str(keywords), "--metrics", str(output)])
+    finally:
+        metrics.disable()
+        metrics.reset()
+    text = output.read_text(encoding="utf-8")
+    assert 'hh_stage_seconds_count{stage="validate"} 1' in text
+    assert 'hh_store_seconds_count{operation="add_many"} 1' in text
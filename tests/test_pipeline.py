@@ -0,0 +1,125 @@
+import threading
+import time
+
+import pytest
+
+from src.file_worker import JsonSaver
+from src.pipeline import VacancyPipeline
+
+
+def _item(number, salary=None):
+    """Создает вакансию в формате API HeadHunter"""
+    return {
+        "name": f"Vacancy {number}",
+        "alternate_url": f"https://hh.ru/vacancy/{number}",
+        "snippet": {"requirement": "Python"},
+        "salary": salary,
+        "employer": {"name": "Company"},
+    }
+
+
+def _pages(count, per_page=3):
+    for page in range(count):
+        yield {"items": [_item(page * per_page + i) for i in range(per_page)], "page": page}
+
+
+@pytest.fixture
+def saver(tmp_path):
+    return JsonSaver(str(tmp_path / "vacancies.json"))
+
+
+def test_pipeline_writes_all(saver):
+    """Проверка, что все вакансии проходят стадии и записываются пачками"""
+    stats = VacancyPipeline(saver, queue_size=2, batch_size=4).run(_pages(5))
+
+    assert stats == {"pages": 5, "items": 15, "invalid": 0, "duplicates": 0, "batches": 4, "added": 15}
+    assert [v.url for v in JsonSaver(saver.__file__).vacancies] == \
+           [f"https://hh.ru/vacancy/{i}" for i in range(15)]
+
+
+def test_pipeline_skips_invalid_and_duplicates(saver):
+    """Проверка отбрасывания некорректных вакансий и повторов"""
+    pages = [
+        {"items": [_item(1), _item(2, salary="много"), {"name": "", "alternate_url": "x"}]},
+        {"items": [_item(1), _item(3)]},
+        {"items": []},
+    ]
+    stats = VacancyPipeline(saver).run(pages)
+
+    assert stats["pages"] == 3
+    assert stats["invalid"] == 2
+    assert stats["duplicates"] == 1
+    assert stats["added"] == 2
+    assert [v.url for v in saver.vacancies] == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/3"]
+
+
+def test_pipeline_validates_page_at_once(saver, monkeypatch):
+    """Проверка, что страница проверяется одним вызовом, а по одной - только страница с ошибкой"""
+    from src.vacancy import Vacancy
+
+    calls = []
+    from_api_batch = Vacancy.from_api_batch
+    monkeypatch.setattr(Vacancy, "from_api_batch", lambda items: calls.append(len(items)) or from_api_batch(items))
+    pages = [{"items": [_item(1), _item(2), _item(3)]}, {"items": [_item(4), _item(5, salary="много")]}]
+
+    stats = VacancyPipeline(saver).run(pages)
+
+    assert calls == [3, 2, 1, 1]
+    assert stats["invalid"] == 1
+    assert stats["added"] == 4
+
+
+def test_pipeline_backpressure():
+    """Проверка, что источник страниц ждет, пока запись отстает"""
+    produced = []
+    release = threading.Event()
+
+    class SlowSaver:
+        def add_vacancies(self, vacancies):
+            release.wait(5)
+            return len(vacancies)
+
+    def pages():
+        for page in _pages(100, per_page=1):
+            produced.append(page)
+            yield page
+
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(
+        VacancyPipeline(SlowSaver(), queue_size=1, batch_size=1).run(pages())))
+    thread.start()
+    time.sleep(0.2)
+    # Страницы в очередях и в обработке стадий, но не весь источник
+    assert len(produced) < 10
+    release.set()
+    thread.join(5)
+    assert result["added"] == 100
+
+
+def test_pipeline_saver_error_stops_source():
+    """Проверка, что ошибка записи прерывает загрузку и передается вызывающему"""
+    produced = []
+
+    class BrokenSaver:
+        def add_vacancies(self, vacancies):
+            raise OSError("disk full")
+
+    def pages():
+        for page in _pages(1000, per_page=1):
+            produced.append(page)
+            yield page
+
+    with pytest.raises(OSError, match="disk full"):
+        VacancyPipeline(BrokenSaver(), queue_size=1, batch_size=1).run(pages())
+    assert len(produced) < 1000
+
+
+def test_pipeline_source_error(saver):
+    """Проверка, что ошибка источника передается после записи полученных вакансий"""
+    def pages():
+        yield from _pages(2)
+        raise ConnectionError("network down")
+
+    with pytest.raises(ConnectionError):
+        VacancyPipeline(saver, batch_size=100).run(pages())
+    assert len(JsonSaver(saver.__file__).vacancies) == 6
@@ -0,0 +1,85 @@
+import pstats
+
+import pytest
+import main
+from src import utils
+from src.file_worker import JsonSaver
+from src.profiling import RecordingInput, ReplayInput, load_answers, profile_call, save_answers
+
+ITEMS = [
+    {"name": "Python Developer", "alternate_url": "https://hh.ru/vacancy/1",
+     "snippet": {"requirement": "Python, SQL"}, "salary": {"from": 150000, "to": None, "currency": "RUR"}},
+    {"name": "Java Developer", "alternate_url": "https://hh.ru/vacancy/2",
+     "snippet": {"requirement": "Java"}, "salary": {"from": 120000, "to": None, "currency": "RUR"}},
+]
+
+
+@pytest.fixture
+def offline(tmp_path, monkeypatch):
+    """Подменяет хранилище и API модуля utils, чтобы сеанс не обращался к сети"""
+    saver = JsonSaver(str(tmp_path / "vacancies.json"))
+    monkeypatch.setattr(utils, "json_saver", saver)
+    monkeypatch.setattr(utils.hh_api, "get_vacancies", lambda keyword, **params: ITEMS)
+    return saver
+
+
+def test_replay_input(capsys):
+    """Проверка выдачи записанных ответов по порядку"""
+    replay = ReplayInput(["5", ""])
+    assert replay("Топ: ") == "5"
+    assert replay("Слова: ") == ""
+    with pytest.raises(EOFError):
+        replay("Еще: ")
+    assert capsys.readouterr().out == "Топ: 5\nСлова: \n"
+
+
+def test_record_and_load_answers(tmp_path):
+    """Проверка записи ответов и чтения файла записи"""
+    recording = RecordingInput(ReplayInput(["3", "python"], echo=False))
+    recording("a")
+    recording("b")
+    filename = tmp_path / "session.json"
+    save_answers(filename, recording.answers)
+    assert load_answers(filename) == ["3", "python"]
+
+    filename.write_text('["3"]', encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_answers(filename)
+
+
+def test_profile_call(tmp_path):
+    """Проверка отчета и файла статистики профилирования"""
+    prefix = str(tmp_path / "run")
+    assert profile_call(lambda: sorted([b"x" * 1000 for _ in range(100)]), prefix, top=5)
+
+    report = (tmp_path / "run.txt").read_text(encoding="utf-8")
+    assert "Функции по суммарному времени" in report
+    assert "Места выделения памяти" in report
+    assert pstats.Stats(prefix + ".prof").total_calls > 0
+
+
+def test_profile_call_saves_report_on_error(tmp_path):
+    """Проверка, что отчет сохраняется при исключении"""
+    prefix = str(tmp_path / "failed")
+    with pytest.raises(RuntimeError):
+        profile_call(lambda: (_ for _ in ()).throw(RuntimeError("boom")), prefix)
+    assert (tmp_path / "failed.prof").exists()
+    assert (tmp_path / "failed.txt").exists()
+
+
+def test_main_record_replay_profile(tmp_path, offline, monkeypatch, capsys):
+    """Проверка записи сеанса и его воспроизведения под профилировщиком"""
+    answers = iter(["1", "python", "", "python"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    session = tmp_path / "session.json"
+    main.main(["--record", str(session)])
+    recorded = capsys.readouterr().out
+    assert load_answers(session) == ["1", "python", "", "python"]
+
+    prefix = str(tmp_path / "profile")
+    main.main(["--replay", str(session), "--profile", prefix])
+    replayed = capsys.readouterr().out
+    assert "Python Developer" in recorded and "Python Developer" in replayed
+    assert "Java Developer" not in replayed
+    assert "user_interaction" in (tmp_path / "profile.txt").read_text(encoding="utf-8")
+    assert len(offline.vacancies) == 2
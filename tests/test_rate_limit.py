@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from src.hh import HH
+from src.rate_limit import RateLimiter, TokenBucket, get_rate_limiter
+from src.session import build_session
+
+
+def test_bucket_burst_without_wait():
+    """Проверка, что запросы в пределах пачки не ждут"""
+    bucket = TokenBucket(rate=1, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+
+
+def test_bucket_acquire_rate():
+    """Проверка, что скорость после исчерпания пачки ограничена"""
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_bucket_thread_safe():
+    """Проверка, что из нескольких потоков выдается не больше токенов, чем разрешено"""
+    bucket = TokenBucket(rate=0.001, burst=10)
+    granted = []
+
+    def worker():
+        for _ in range(5):
+            granted.append(bucket.reserve() == 0.0)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(granted) == 10
+
+
+def test_bucket_acquire_async():
+    """Проверка асинхронного ожидания токенов"""
+    bucket = TokenBucket(rate=50, burst=1)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_bucket_throttled_and_recovery():
+    """Проверка замедления после 429 и постепенного восстановления"""
+    bucket = TokenBucket(rate=8, burst=1, recovery=2)
+    bucket.throttled()
+    assert bucket.rate == 4
+    bucket.succeeded()
+    assert bucket.rate == 6
+    bucket.succeeded()
+    bucket.succeeded()
+    assert bucket.rate == 8
+
+
+def test_bucket_retry_after_blocks():
+    """Проверка, что Retry-After приостанавливает выдачу токенов"""
+    bucket = TokenBucket(rate=10, burst=10)
+    bucket.throttled(retry_after=2)
+    assert bucket.reserve() >= 2
+
+
+def test_limiter_per_host_quotas():
+    """Проверка отдельных квот для хостов"""
+    limiter = RateLimiter(rate=1, burst=1, quotas={'api.hh.ru': (5, 10)})
+    hh_bucket = limiter.bucket('https://api.hh.ru/vacancies?page=1')
+
+    assert hh_bucket is limiter.bucket('https://api.hh.ru/vacancies')
+    assert hh_bucket.burst == 10
+    assert limiter.bucket('https://example.com/').burst == 1
+
+
+def test_limiter_unlimited_host():
+    """Проверка отключения ограничения для хостов без квоты"""
+    limiter = RateLimiter(rate=None, quotas={})
+    assert limiter.bucket('https://api.hh.ru/') is None
+    limiter.acquire('https://api.hh.ru/')
+
+
+def test_get_rate_limiter_shared():
+    """Проверка, что общий ограничитель один для всех коннекторов"""
+    assert get_rate_limiter() is get_rate_limiter()
+    assert HH(MagicMock(), session=MagicMock()).limiter is get_rate_limiter()
+
+
+def test_record_response_429(stub_server):
+    """Проверка замедления по ответам 429, в том числе повторенным сессией"""
+    limiter = RateLimiter(rate=10, burst=10, quotas={})
+    session = build_session(retries=1, backoff_factor=0)
+    url = stub_server.url + '/vacancies'
+    stub_server.responses = [(429, {'Retry-After': '0'}, {})]
+
+    response = session.get(url)
+    limiter.record_response(url, response)
+    assert response.status_code == 200
+    assert limiter.bucket(url).rate == 5
+
+    stub_server.responses = [(429, {'Retry-After': '0'}, {}), (429, {'Retry-After': '0'}, {})]
+    response = session.get(url)
+    limiter.record_response(url, response)
+    assert response.status_code == 429
+    assert limiter.bucket(url).rate == 2.5
+    session.close()
+
+
+def test_hh_acquires_limiter():
+    """Проверка, что HH запрашивает разрешение перед каждым запросом"""
+    limiter = MagicMock(spec=RateLimiter)
+    session = MagicMock(spec=requests.Session)
+    response = MagicMock(status_code=200)
+    response.content = json.dumps({"items": [], "pages": 3}).encode()
+    session.get.return_value = response
+
+    HH(MagicMock(), session=session, limiter=limiter).load_vacancies("Python")
+
+    assert limiter.acquire.call_count == 3
+    assert limiter.record_response.call_count == 3
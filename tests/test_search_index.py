@@ -0,0 +1,75 @@
+import pytest
+from src.search_index import InvertedIndex, parse_query, tokenize
+
+
+@pytest.fixture
+def index():
+    """Фикстура индекса с несколькими документами"""
+    index = InvertedIndex()
+    index.add("url1", "Python Developer", "Опыт работы с <highlighttext>Python</highlighttext>, Django")
+    index.add("url2", "Java Developer", "Java, Spring Boot")
+    index.add("url3", "Backend Developer", "Python или Java, знание Spring")
+    index.add("url4", "Аналитик", None)
+    return index
+
+
+def test_tokenize():
+    """Проверка нормализации регистра и удаления разметки"""
+    assert tokenize("Опыт <highlighttext>Python</highlighttext>, DJANGO!") == ["опыт", "python", "django"]
+    assert tokenize(None) == []
+
+
+def test_parse_query():
+    """Проверка разбора запроса на слова и фразы"""
+    assert parse_query('python "Spring Boot"') == [("python",), ("spring", "boot")]
+    assert parse_query(["Python", "spring boot", ""]) == [("python",), ("spring",), ("boot",)]
+    assert parse_query(["\"spring boot\""]) == [("spring", "boot")]
+    assert parse_query("") == []
+
+
+def test_search_and(index):
+    """Проверка поиска документов со всеми словами"""
+    assert index.search("python java") == ["url3"]
+    assert index.search("developer") == ["url1", "url2", "url3"]
+    assert index.search("python golang") == []
+
+
+def test_search_or(index):
+    """Проверка поиска документов с любым из слов"""
+    assert index.search("django spring", mode="or") == ["url1", "url2", "url3"]
+    assert index.search(["golang", "АНАЛИТИК"], mode="or") == ["url4"]
+
+
+def test_search_phrase(index):
+    """Проверка поиска фразы"""
+    assert index.search('"spring boot"') == ["url2"]
+    assert index.search('"java developer"') == ["url2"]
+    # Слова фразы не должны переходить из одного поля в другое
+    assert index.search('"developer java"') == []
+
+
+def test_search_highlight_markup(index):
+    """Проверка, что разметка <highlighttext> не попадает в индекс"""
+    assert index.search("highlighttext") == []
+
+
+def test_search_invalid_mode(index):
+    """Проверка ошибки при неизвестном режиме поиска"""
+    with pytest.raises(ValueError):
+        index.search("python", mode="xor")
+
+
+def test_remove_and_readd(index):
+    """Проверка инкрементального удаления и повторного добавления"""
+    index.remove("url1")
+    assert index.search("django") == []
+    assert "django" not in index._postings
+    assert len(index) == 3
+
+    index.add("url1", "Python Developer", "Flask")
+    index.add("url1", "Python Developer", "FastAPI")
+    assert index.search("flask") == []
+    assert index.search("fastapi") == ["url1"]
+    # Повторно добавленный документ оказывается в конце
+    assert index.search("python", mode="or") == ["url3", "url1"]
+    index.remove("missing")
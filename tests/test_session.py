@@ -0,0 +1,80 @@
+import time
+
+import pytest
+import requests
+from src.session import build_session, close_session, get_session
+from src.transport import TimeoutHTTPAdapter
+
+
+@pytest.fixture
+def session():
+    """Фикстура сессии без задержек между повторами"""
+    session = build_session(retries=3, backoff_factor=0)
+    yield session
+    session.close()
+
+
+def test_build_session_adapter():
+    """Проверка настройки пула соединений, повторов и таймаута"""
+    session = build_session(pool_maxsize=7, retries=5, timeout=2)
+    adapter = session.get_adapter('https://api.hh.ru/vacancies')
+
+    assert isinstance(adapter, TimeoutHTTPAdapter)
+    assert adapter.timeout == 2
+    assert adapter._pool_maxsize == 7
+    assert adapter.max_retries.total == 5
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.respect_retry_after_header
+
+
+def test_get_session_shared():
+    """Проверка, что общая сессия создается один раз"""
+    close_session()
+    first = get_session()
+    assert get_session() is first
+    close_session()
+    assert get_session() is not first
+
+
+def test_retry_on_server_error(stub_server, session):
+    """Проверка повтора запроса после ответа 5xx"""
+    stub_server.responses = [(503, {}, {}), (502, {}, {}), (200, {}, {'items': [1]})]
+
+    response = session.get(stub_server.url + '/vacancies')
+
+    assert response.status_code == 200
+    assert response.json() == {'items': [1]}
+    assert len(stub_server.requests) == 3
+
+
+def test_retry_after_header(stub_server, session):
+    """Проверка ожидания по заголовку Retry-After при ответе 429"""
+    stub_server.responses = [(429, {'Retry-After': '1'}, {})]
+
+    start = time.monotonic()
+    response = session.get(stub_server.url + '/vacancies')
+
+    assert response.status_code == 200
+    assert time.monotonic() - start >= 0.9
+    assert len(stub_server.requests) == 2
+
+
+def test_retries_exhausted(stub_server, session):
+    """Проверка, что после исчерпания повторов возвращается ошибочный ответ"""
+    stub_server.handler = lambda request: (500, {}, {})
+
+    response = session.get(stub_server.url + '/vacancies')
+
+    assert response.status_code == 500
+    assert len(stub_server.requests) == 4
+    with pytest.raises(requests.exceptions.HTTPError):
+        response.raise_for_status()
+
+
+def test_keep_alive(stub_server, session):
+    """Проверка повторного использования соединения"""
+    session.get(stub_server.url + '/vacancies')
+    session.get(stub_server.url + '/vacancies')
+
+    pool = session.get_adapter(stub_server.url).poolmanager.connection_from_url(stub_server.url)
+    assert pool.num_connections == 1
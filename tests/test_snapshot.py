@@ -0,0 +1,181 @@
+import os
+import tracemalloc
+
+import pytest
+
+from src.file_worker import JsonSaver
+from src.snapshot import SnapshotReader, SnapshotSaver, open_shared_reader, snapshot_path, write_snapshot
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def vacancies(test_vacancies):
+    """Тестовые вакансии с пустой зарплатой, валютой и требованиями None"""
+    return test_vacancies + [
+        Vacancy("Go Developer", None, "https://test.com/vacancy/3", None, "Company A"),
+        Vacancy("Аналитик", "SQL, «Excel»", "https://test.com/vacancy/4",
+                {"from": None, "to": 2000, "currency": "USD"}),
+        Vacancy("QA", "", "https://test.com/vacancy/5", 90000, "Company B"),
+    ]
+
+
+@pytest.fixture
+def snapshot_file(tmp_path, vacancies):
+    filename = tmp_path / "vacancies.snap"
+    write_snapshot(filename, vacancies)
+    return filename
+
+
+def test_snapshot_round_trip(snapshot_file, vacancies):
+    """Проверка, что снимок сохраняет все поля вакансий и порядок"""
+    with SnapshotReader(snapshot_file) as reader:
+        assert len(reader) == 5
+        restored = list(reader)
+    assert [v.to_dict() for v in restored] == [v.to_dict() for v in vacancies]
+    assert [v.salary_max for v in restored] == [v.salary_max for v in vacancies]
+
+
+def test_snapshot_empty_salary(tmp_path):
+    """Проверка, что пустой словарь зарплаты не превращается в None"""
+    filename = tmp_path / "vacancies.snap"
+    write_snapshot(filename, [Vacancy("Empty", "", "https://test.com/vacancy/1", {}),
+                              Vacancy("None", "", "https://test.com/vacancy/2", None)])
+
+    with SnapshotReader(filename) as reader:
+        assert [v.salary for v in reader] == [{}, None]
+        assert reader.get_view("https://test.com/vacancy/1").salary == {}
+
+
+def test_snapshot_lookup(snapshot_file):
+    """Проверка поиска по ссылке через индекс"""
+    with SnapshotReader(snapshot_file) as reader:
+        assert reader.get("https://test.com/vacancy/4").name == "Аналитик"
+        assert reader.get("https://test.com/vacancy/404") is None
+        assert "https://test.com/vacancy/1" in reader
+        assert "https://test.com/vacancy/40" not in reader
+
+
+def test_snapshot_queries(snapshot_file):
+    """Проверка выборок по работодателю и зарплате"""
+    with SnapshotReader(snapshot_file) as reader:
+        assert [v.name for v in reader.by_employer("Company A")] == ["Python Developer", "Go Developer"]
+        assert reader.by_employer("Unknown") == []
+        assert [v.name for v in reader.by_salary(90000, 170000)] == ["Python Developer", "QA"]
+
+
+def test_snapshot_skips_duplicates(tmp_path, test_vacancy, test_vacancies):
+    """Проверка, что из вакансий с одной ссылкой сохраняется первая"""
+    filename = tmp_path / "vacancies.snap"
+    assert write_snapshot(filename, [test_vacancy] + test_vacancies) == 2
+    with SnapshotReader(filename) as reader:
+        assert reader.get("https://test.com/vacancy/1").name == "Test Vacancy"
+
+
+def test_snapshot_from_json_stream(tmp_path, vacancies):
+    """Проверка записи снимка из потока вакансий JsonSaver"""
+    json_saver = JsonSaver(str(tmp_path / "vacancies.json"))
+    json_saver.add_vacancies(vacancies)
+    filename = tmp_path / "vacancies.snap"
+    assert write_snapshot(filename, JsonSaver(json_saver.__file__, lazy=True).iter_from_file()) == 5
+    with SnapshotReader(filename) as reader:
+        assert [v.url for v in reader] == [v.url for v in json_saver.vacancies]
+
+
+@pytest.mark.parametrize("content", [b"", b"HHVS", b"not a snapshot at all, definitely not"])
+def test_snapshot_invalid_file(tmp_path, content):
+    """Проверка ошибки для пустого или чужого файла"""
+    filename = tmp_path / "broken.snap"
+    filename.write_bytes(content)
+    with pytest.raises(ValueError):
+        SnapshotReader(filename)
+
+
+def test_snapshot_saver(tmp_path, test_vacancies, test_vacancy):
+    """Проверка добавления, удаления и запросов SnapshotSaver"""
+    filename = tmp_path / "vacancies.snap"
+    with SnapshotSaver(filename) as saver:
+        assert len(saver) == 0
+        assert saver.add_vacancies(test_vacancies + test_vacancies) == 2
+        assert saver.add_vacancies([test_vacancy]) == 0
+        assert saver.get_vacancy("https://test.com/vacancy/2").name == "Java Developer"
+        assert [v.name for v in saver.get_vacancies_by_employer("Company B")] == ["Java Developer"]
+        assert [v.name for v in saver.get_vacancies_by_salary(160000, 200000)] == ["Java Developer"]
+        assert [v.name for v in saver.filter_vacancies(lambda v: "Python" in v.requirements)] == ["Python Developer"]
+
+        assert saver.delete_vacancies([test_vacancy]) == 1
+        assert [v.url for v in saver.vacancies] == ["https://test.com/vacancy/2"]
+
+    with SnapshotSaver(filename) as saver:
+        assert len(saver) == 1
+
+
+def test_vacancy_view(snapshot_file, vacancies):
+    """Проверка, что ленивое представление читает те же поля, что у Vacancy"""
+    with SnapshotReader(snapshot_file) as reader:
+        views = list(reader.iter_views())
+        for view, vacancy in zip(views, vacancies):
+            assert (view.name, view.requirements, view.url, view.employer, view.salary) == \
+                   (vacancy.name, vacancy.requirements, vacancy.url, vacancy.employer, vacancy.salary)
+            assert (view.salary_min, view.salary_max) == (vacancy.salary_min, vacancy.salary_max)
+            assert view == vacancy and vacancy == view
+            assert not view != vacancy and not vacancy != view
+            assert view.to_dict() == vacancy.to_dict()
+        assert max(views).name == "Java Developer"
+        assert reader.get_view("https://test.com/vacancy/2").to_vacancy() == vacancies[1]
+        assert reader.get_view("https://test.com/vacancy/404") is None
+
+
+def test_reader_filter_vacancies(snapshot_file):
+    """Проверка контракта filter_vacancies у читателя снимка"""
+    with SnapshotReader(snapshot_file) as reader:
+        result = reader.filter_vacancies(lambda v: v.requirements and "sql" in v.requirements.lower())
+        assert [v.name for v in result] == ["Аналитик"]
+        assert reader.filter_vacancies(lambda v: False) == []
+
+
+def test_reader_filter_memory_is_flat(tmp_path):
+    """Проверка, что фильтрация снимка не держит в памяти все вакансии"""
+    filename = tmp_path / "big.snap"
+    write_snapshot(filename, (
+        Vacancy(f"Vacancy {i}", "Python " * 20, f"https://test.com/vacancy/{i}", {"from": i, "to": None})
+        for i in range(1, 5001)
+    ))
+    with SnapshotReader(filename) as reader:
+        tracemalloc.start()
+        try:
+            assert len(reader.filter_vacancies(lambda v: v.salary_max > 4990)) == 10
+            _, filter_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            vacancies = list(reader)
+            _, load_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    assert len(vacancies) == 5000
+    assert filter_peak * 20 < load_peak
+
+
+def test_open_shared_reader(tmp_path, test_vacancies, test_vacancy):
+    """Проверка построения и обновления снимка рядом с JSON-хранилищем"""
+    json_file = tmp_path / "vacancies.json"
+    saver = JsonSaver(str(json_file))
+    saver.add_vacancies(test_vacancies)
+
+    with open_shared_reader(str(json_file)) as reader:
+        assert reader.filename == snapshot_path(str(json_file)) == str(tmp_path / "vacancies.snap")
+        assert len(reader) == 2
+
+    # Снимок новее JSON-файла - используется без перестроения
+    mtime = os.path.getmtime(reader.filename)
+    with open_shared_reader(str(json_file)) as reader:
+        assert os.path.getmtime(reader.filename) == mtime
+
+    saver.delete_vacancy(test_vacancy)
+    os.utime(json_file, (mtime + 10, mtime + 10))
+    with open_shared_reader(str(json_file)) as reader:
+        assert [v.url for v in reader] == ["https://test.com/vacancy/2"]
+
+
+def test_open_shared_reader_missing_json(tmp_path):
+    """Проверка пустого снимка, если JSON-файла нет"""
+    with open_shared_reader(str(tmp_path / "missing.json")) as reader:
+        assert len(reader) == 0
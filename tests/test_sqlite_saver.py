@@ -0,0 +1,169 @@
+import pytest
+from src.file_worker import Saver
+from src.sqlite_saver import SqliteSaver
+from src.utils import query_vacancies
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def saver(tmp_path):
+    """Фикстура хранилища SQLite во временном файле"""
+    saver = SqliteSaver(str(tmp_path / "vacancies.db"))
+    yield saver
+    saver.close()
+
+
+@pytest.fixture
+def filled_saver(saver, test_vacancies):
+    """Фикстура хранилища SQLite с тестовыми вакансиями"""
+    saver.add_vacancies(test_vacancies + [
+        Vacancy("Frontend Developer", "JavaScript, React", "https://test.com/vacancy/3",
+                {"from": 90000, "to": 130000, "currency": "RUR"}, "Company C"),
+        Vacancy("Intern", "Желание учиться, Python", "https://test.com/vacancy/4", None, "Company A"),
+    ])
+    return saver
+
+
+def test_sqlite_saver_is_saver(saver):
+    """Проверка, что SqliteSaver реализует интерфейс Saver"""
+    assert isinstance(saver, Saver)
+    assert len(saver) == 0
+
+
+def test_sqlite_add_and_get(saver, test_vacancy):
+    """Проверка добавления, пропуска дубликатов и поиска по ссылке"""
+    saver.add_vacancy(test_vacancy)
+    saver.add_vacancy(test_vacancy)
+
+    assert len(saver) == 1
+    loaded = saver.get_vacancy(test_vacancy.url)
+    assert loaded.to_dict() == test_vacancy.to_dict()
+    assert saver.get_vacancy("https://test.com/vacancy/404") is None
+
+
+def test_sqlite_bulk_counts(saver, test_vacancies):
+    """Проверка количества добавленных и удаленных вакансий"""
+    assert saver.add_vacancies(test_vacancies) == 2
+    assert saver.add_vacancies(test_vacancies) == 0
+    assert saver.delete_vacancies(test_vacancies) == 2
+    assert len(saver) == 0
+
+
+def test_sqlite_delete_updates_fts(filled_saver, test_vacancies):
+    """Проверка, что удаленная вакансия не находится полнотекстовым поиском"""
+    filled_saver.delete_vacancy(test_vacancies[0])
+
+    names = [v.name for v in filled_saver.search(["django"])]
+    assert names == []
+
+
+def test_sqlite_persistence(tmp_path, test_vacancies):
+    """Проверка сохранения данных между подключениями"""
+    path = str(tmp_path / "vacancies.db")
+    with SqliteSaver(path) as saver:
+        saver.add_vacancies(test_vacancies)
+    with SqliteSaver(path) as saver:
+        assert [v.name for v in saver.iter_vacancies()] == ["Python Developer", "Java Developer"]
+
+
+def test_sqlite_filter_vacancies(filled_saver):
+    """Проверка фильтрации по произвольному критерию"""
+    filtered = filled_saver.filter_vacancies(lambda v: "Java" in v.requirements)
+    assert [v.name for v in filtered] == ["Java Developer", "Frontend Developer"]
+
+
+def test_sqlite_by_employer(filled_saver):
+    """Проверка выборки по работодателю"""
+    assert [v.name for v in filled_saver.get_vacancies_by_employer("Company A")] == ["Python Developer", "Intern"]
+
+
+def test_sqlite_search_keywords(filled_saver):
+    """Проверка поиска по ключевым словам (любое слово, без учета регистра, по префиксу)"""
+    assert [v.name for v in filled_saver.search(["python"])] == ["Python Developer", "Intern"]
+    assert [v.name for v in filled_saver.search(["spring", "react"])] == ["Java Developer", "Frontend Developer"]
+    assert [v.name for v in filled_saver.search(["Djan"])] == ["Python Developer"]
+    assert [v.name for v in filled_saver.search(['"quoted'])] == []
+    assert [v.name for v in filled_saver.search(["developer"], columns=("name",))] == [
+        "Java Developer", "Python Developer", "Frontend Developer"]
+
+
+def test_sqlite_search_whole_words(filled_saver):
+    """Проверка поиска только целых слов и фраз (prefix=False)"""
+    assert filled_saver.search(["Djan"], prefix=False) == []
+    assert [v.name for v in filled_saver.search(["django"], prefix=False)] == ["Python Developer"]
+    assert [v.name for v in filled_saver.search(['"java developer"', "react"], columns=("name", "requirements"),
+                                                prefix=False)] == ["Java Developer", "Frontend Developer"]
+
+
+def test_sqlite_search_salary_and_top(filled_saver):
+    """Проверка фильтрации по зарплате и выбора топ-N"""
+    assert [v.name for v in filled_saver.search(min_salary=130000, max_salary=150000)] == [
+        "Python Developer", "Frontend Developer"]
+    assert [v.name for v in filled_saver.search(top_n=2)] == ["Java Developer", "Python Developer"]
+    assert [v.name for v in filled_saver.search(["python"], min_salary=1)] == ["Python Developer"]
+
+
+def test_query_vacancies_pushdown(filled_saver):
+    """Проверка, что query_vacancies выполняет запрос в SqliteSaver"""
+    result = query_vacancies(filled_saver, ["python", "react"], "100000-200000", 1)
+    assert [v.name for v in result] == ["Python Developer"]
+
+
+def test_query_vacancies_matches_json_saver(filled_saver, tmp_path):
+    """Проверка совпадения результатов SqliteSaver и JsonSaver"""
+    from src.file_worker import JsonSaver
+
+    json_saver = JsonSaver(str(tmp_path / "vacancies.json"))
+    json_saver.add_vacancies(filled_saver.iter_vacancies())
+
+    cases = [(["python"], ""), ([], "120000-160000"), (["java"], "0-1000000"), (["script"], ""), (["++"], ""),
+             (["developer"], ""), (["djan"], ""), (['"java developer"'], ""), (["желание"], "")]
+    for words, salary_range in cases:
+        expected = [v.url for v in query_vacancies(json_saver, words, salary_range, 10)]
+        assert [v.url for v in query_vacancies(filled_saver, words, salary_range, 10)] == expected
+
+
+def test_sqlite_tokens_match_inverted_index(saver, tmp_path):
+    """Проверка, что FTS5 выделяет слова так же, как search_index.tokenize"""
+    from src.file_worker import JsonSaver
+
+    vacancies = [
+        Vacancy("Barista", "Café, <highlighttext>Python</highlighttext>", "https://test.com/vacancy/1", None, "A"),
+        Vacancy("Backend", "snake_case, highlighttext", "https://test.com/vacancy/2", None, "B"),
+    ]
+    saver.add_vacancies(vacancies)
+    json_saver = JsonSaver(str(tmp_path / "vacancies.json"))
+    json_saver.add_vacancies(vacancies)
+
+    assert saver.get_vacancy("https://test.com/vacancy/1").requirements == "Café, Python"
+    for words in (["café"], ["cafe"], ["snake"], ["snake_case"], ["highlighttext"], ['"café python"']):
+        expected = [v.url for v in query_vacancies(json_saver, words, "", 10)]
+        assert [v.url for v in query_vacancies(saver, words, "", 10)] == expected
+
+
+def test_sqlite_migrates_fts_tokenizer(tmp_path):
+    """Проверка перестроения индекса базы, созданной со старым токенизатором"""
+    import sqlite3
+    from src.sqlite_saver import FTS_TOKENIZER, SCHEMA
+
+    filename = str(tmp_path / "vacancies.db")
+    connection = sqlite3.connect(filename)
+    connection.executescript(SCHEMA.replace(f'"{FTS_TOKENIZER}"', "'unicode61'"))
+    connection.execute("INSERT INTO vacancies (name, requirements, url) VALUES "
+                       "('Backend', '<highlighttext>snake_case</highlighttext>', 'https://test.com/vacancy/1')")
+    connection.commit()
+    connection.close()
+
+    with SqliteSaver(filename) as saver:
+        assert saver.get_vacancy("https://test.com/vacancy/1").requirements == "snake_case"
+        assert [v.url for v in saver.search(["snake_case"], prefix=False)] == ["https://test.com/vacancy/1"]
+        assert saver.search(["snake"], prefix=False) == []
+        saver.add_vacancy(Vacancy("Data", "snake", "https://test.com/vacancy/2", None, "B"))
+        assert [v.url for v in saver.search(["snake"], prefix=False)] == ["https://test.com/vacancy/2"]
+
+
+def test_query_vacancies_restricted_to_urls(filled_saver, test_vacancies):
+    """Проверка выбора только среди переданных вакансий в обоих путях"""
+    result = query_vacancies(filled_saver, [], "", 10, vacancies=test_vacancies[1:])
+    assert [v.url for v in result] == [v.url for v in query_vacancies(None, [], "", 10, test_vacancies[1:])]
+    assert [v.url for v in result] == [test_vacancies[1].url]
@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Бюджет времени импорта main.py (секунды); обычно импорт занимает десятки миллисекунд
+STARTUP_BUDGET = 0.5
+# Модули, которые не должны загружаться до первого запроса к API или запуска тяжелых режимов
+HEAVY_MODULES = ['requests', 'urllib3', 'asyncio', 'msgspec', 'cProfile', 'concurrent.futures']
+
+
+def _run_python(code: str, cwd=ROOT) -> str:
+    # Без переменных pytest-cov, чтобы покрытие не замедляло дочерний процесс
+    env = {key: value for key, value in os.environ.items()
+           if key not in ('HH_JSON_BACKEND', 'HH_METRICS') and not key.startswith('COV_CORE_')}
+    env['PYTHONPATH'] = str(ROOT)
+    result = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, capture_output=True,
+                            text=True, check=True, timeout=60)
+    return result.stdout
+
+
+def test_import_is_lazy(tmp_path):
+    """Проверка, что импорт main укладывается в бюджет времени, не загружает HTTP-стек и не читает хранилище"""
+    output = _run_python(
+        "import json, sys, time\n"
+        "started = time.perf_counter()\n"
+        "import main\n"
+        "elapsed = time.perf_counter() - started\n"
+        f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules],"
+        " 'saver': 'json_saver' in vars(main.utils)}))",
+        cwd=tmp_path,
+    )
+    result = json.loads(output)
+    assert result['loaded'] == []
+    assert result['saver'] is False
+    assert not (tmp_path / 'vacancies.json').exists()
+    assert result['elapsed'] < STARTUP_BUDGET
+
+
+def test_top_command_is_offline(tmp_path, test_vacancies):
+    """Проверка, что --top выводит сохраненные вакансии без загрузки HTTP-стека"""
+    records = [vacancy.to_dict() for vacancy in test_vacancies]
+    (tmp_path / 'vacancies.json').write_text(json.dumps(records, ensure_ascii=False), encoding='utf-8')
+    output = _run_python(
+        "import runpy, sys\n"
+        "sys.argv = ['main.py', '--top', '1']\n"
+        f"runpy.run_path({str(ROOT / 'main.py')!r}, run_name='__main__')\n"
+        "print('requests loaded:', 'requests' in sys.modules)",
+        cwd=tmp_path,
+    )
+    assert 'Java Developer' in output
+    assert 'Python Developer' not in output
+    assert 'requests loaded: False' in output
@@ -0,0 +1,103 @@
+import pytest
+from src.store import VacancyStore
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def store(test_vacancies):
+    """Фикстура хранилища с тестовыми вакансиями"""
+    return VacancyStore(test_vacancies)
+
+
+def test_store_add_and_get(store, test_vacancy):
+    """Проверка добавления и поиска по ссылке"""
+    assert len(store) == 2
+    assert store.get("https://test.com/vacancy/2").name == "Java Developer"
+    assert store.get("https://test.com/vacancy/404") is None
+
+    new = Vacancy("Go Developer", "Go", "https://test.com/vacancy/3", employer="Company A")
+    assert store.add(new)
+    assert new in store
+    assert "https://test.com/vacancy/3" in store
+
+
+def test_store_add_duplicate(store):
+    """Проверка, что вакансия с той же ссылкой не добавляется повторно"""
+    duplicate = Vacancy("Other", "Other", "https://test.com/vacancy/1")
+    assert not store.add(duplicate)
+    assert len(store) == 2
+    assert store.get("https://test.com/vacancy/1").name == "Python Developer"
+
+
+def test_store_iteration_order(store):
+    """Проверка, что вакансии перебираются в порядке добавления"""
+    assert [v.name for v in store] == ["Python Developer", "Java Developer"]
+
+
+def test_store_remove(store):
+    """Проверка удаления вакансии и очистки индексов"""
+    removed = store.remove("https://test.com/vacancy/1")
+
+    assert removed.name == "Python Developer"
+    assert len(store) == 1
+    assert store.by_employer("Company A") == []
+    assert store.by_salary(0, 1000000) == [store.get("https://test.com/vacancy/2")]
+    assert store.remove("https://test.com/vacancy/1") is None
+
+
+def test_store_remove_after_change(store):
+    """Проверка удаления вакансии, зарплату и работодателя которой изменили после добавления"""
+    vacancy = store.get("https://test.com/vacancy/1")
+    vacancy.salary = {"from": 900000, "to": None, "currency": "RUR"}
+    vacancy.employer = "Company Z"
+
+    assert store.remove(vacancy.url) is vacancy
+    assert len(store) == 1
+    assert store.by_salary(0, 1000000) == [store.get("https://test.com/vacancy/2")]
+    assert store.by_employer("Company A") == []
+    assert store.by_employer("Company Z") == []
+
+
+def test_store_by_employer(store):
+    """Проверка поиска по работодателю"""
+    store.add(Vacancy("Go Developer", "Go", "https://test.com/vacancy/3", employer="Company A"))
+
+    names = [v.name for v in store.by_employer("Company A")]
+    assert names == ["Python Developer", "Go Developer"]
+    assert store.by_employer("Unknown") == []
+
+
+def test_store_by_salary():
+    """Проверка выборки по диапазону зарплат, включая границы корзин"""
+    store = VacancyStore(bucket_size=10000)
+    for i, amount in enumerate([None, 95000, 100000, 109999, 110000, 250000]):
+        salary = {"from": amount, "to": None, "currency": "RUR"} if amount else None
+        store.add(Vacancy(f"V{i}", "", f"url{i}", salary))
+
+    assert [v.name for v in store.by_salary(100000, 110000)] == ["V2", "V3", "V4"]
+    assert [v.name for v in store.by_salary(0, 0)] == ["V0"]
+    assert store.by_salary(300000, 400000) == []
+    assert store.by_salary(200000, 100000) == []
+
+
+def test_store_matches_linear_scan():
+    """Проверка совпадения индексной выборки с полным перебором"""
+    vacancies = [Vacancy(f"V{i}", "", f"url{i}", {"from": i * 3571 % 400000, "to": None, "currency": "RUR"})
+                 for i in range(500)]
+    store = VacancyStore(vacancies, bucket_size=7000)
+    for i in range(0, 400, 37):
+        store.remove(f"url{i}")
+
+    expected = [v for v in store if 120000 <= v.get_min_salary() <= 180000]
+    result = store.by_salary(120000, 180000)
+    assert len(result) == len(expected)
+    assert set(result) == set(expected)
+
+
+def test_store_search(store):
+    """Проверка поиска по ключевым словам с обновлением индекса"""
+    assert [v.name for v in store.search("django")] == ["Python Developer"]
+    assert [v.name for v in store.search(["python", "spring"], mode="or")] == ["Python Developer", "Java Developer"]
+
+    store.remove("https://test.com/vacancy/1")
+    assert store.search("django") == []
@@ -0,0 +1,180 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.file_worker import JsonSaver
+from src.sync import IncrementalSync, parse_date, sync_state_path
+
+
+def _item(number, published_at, name=None, archived=False):
+    """Создает вакансию в формате API HeadHunter"""
+    return {
+        "name": name or f"Vacancy {number}",
+        "alternate_url": f"https://hh.ru/vacancy/{number}",
+        "snippet": {"requirement": "Python"},
+        "salary": {"from": 100000, "to": None, "currency": "RUR"},
+        "employer": {"name": "Company"},
+        "published_at": published_at,
+        "archived": archived,
+    }
+
+
+class FakeApi:
+    """Имитация HH.fetch_items / HH.search: запоминает параметры и отдает заданные ответы"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def fetch_items(self, keyword, **params):
+        self.calls.append((keyword, params))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+NOW = datetime(2024, 5, 10, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def saver(tmp_path):
+    return JsonSaver(str(tmp_path / "vacancies.json"))
+
+
+def test_first_sync_loads_everything(saver):
+    """Проверка первой синхронизации: без date_from, с сохранением отметки"""
+    api = FakeApi([_item(1, "2024-05-01T10:00:00+0300"), _item(2, "2024-05-02T10:00:00+0300")])
+    sync = IncrementalSync(saver, api.fetch_items)
+
+    result = sync.sync("python", now=NOW)
+
+    assert result == {"fetched": 2, "added": 2, "updated": 0, "expired": 0}
+    assert api.calls == [("python", {"order_by": "publication_time"})]
+    assert sync.watermark("python") == "2024-05-02T10:00:00+0300"
+    assert len(saver.vacancies) == 2
+
+
+def test_next_sync_requests_only_new(saver):
+    """Проверка, что повторная синхронизация запрашивает вакансии с отметки и обновляет по ссылке"""
+    api = FakeApi(
+        [_item(1, "2024-05-01T10:00:00+0300"), _item(2, "2024-05-02T10:00:00+0300")],
+        [_item(2, "2024-05-02T10:00:00+0300", name="Vacancy 2 (updated)"), _item(3, "2024-05-03T09:00:00+0300")],
+    )
+    IncrementalSync(saver, api.fetch_items).sync("python", now=NOW)
+
+    # Состояние читается из файла рядом с хранилищем
+    sync = IncrementalSync(saver, api.fetch_items)
+    result = sync.sync("python", now=NOW)
+
+    assert api.calls[1] == ("python", {"order_by": "publication_time", "date_from": "2024-05-02T10:00:00+0300"})
+    assert result == {"fetched": 2, "added": 1, "updated": 1, "expired": 0}
+    assert saver.get_vacancy("https://hh.ru/vacancy/2").name == "Vacancy 2 (updated)"
+    assert sync.watermark("python") == "2024-05-03T09:00:00+0300"
+
+
+def test_watermarks_are_per_query(saver):
+    """Проверка, что отметки хранятся отдельно для каждого запроса"""
+    api = FakeApi([_item(1, "2024-05-01T10:00:00+0300")], [])
+    sync = IncrementalSync(saver, api.fetch_items)
+    sync.sync("python", now=NOW)
+    sync.sync("java", now=NOW)
+
+    assert api.calls[1] == ("java", {"order_by": "publication_time"})
+    assert sync.watermark("java") is None
+    # Пустой ответ не сбрасывает отметку
+    assert sync.watermark("python") == "2024-05-01T10:00:00+0300"
+
+
+def test_sync_expires_old_and_archived(saver):
+    """Проверка удаления устаревших и архивных вакансий"""
+    api = FakeApi(
+        [_item(1, "2024-03-01T10:00:00+0300"), _item(2, "2024-05-02T10:00:00+0300"),
+         _item(3, "2024-05-03T10:00:00+0300")],
+        [_item(3, "2024-05-03T10:00:00+0300", archived=True)],
+    )
+    sync = IncrementalSync(saver, api.fetch_items, max_age=timedelta(days=30))
+
+    assert sync.sync("python", now=NOW)["expired"] == 1
+    assert saver.get_vacancy("https://hh.ru/vacancy/1") is None
+
+    assert sync.sync("python", now=NOW)["expired"] == 1
+    assert [v.url for v in saver.vacancies] == ["https://hh.ru/vacancy/2"]
+
+    assert sync.expire(now=NOW + timedelta(days=60)) == 1
+    assert saver.vacancies == []
+
+
+def test_sync_state_file(saver, tmp_path):
+    """Проверка расположения и содержимого файла состояния"""
+    sync = IncrementalSync(saver, FakeApi([_item(1, "2024-05-01T10:00:00+0300")]).fetch_items)
+    sync.sync("python", now=NOW)
+
+    assert sync.state_file == sync_state_path(saver.__file__) == str(tmp_path / "vacancies.sync.json")
+    with open(sync.state_file, encoding="utf-8") as file:
+        state = json.load(file)
+    assert state["queries"] == {"python": "2024-05-01T10:00:00+0300"}
+    assert state["published"] == {"https://hh.ru/vacancy/1": "2024-05-01T10:00:00+0300"}
+
+
+def test_failed_fetch_keeps_state(saver):
+    """Проверка, что при ошибке загрузки отметка, хранилище и файл состояния не изменяются"""
+    api = FakeApi([_item(1, "2024-05-01T10:00:00+0300")], ConnectionError("обрыв на странице 3"))
+    sync = IncrementalSync(saver, api.fetch_items)
+    sync.sync("python", now=NOW)
+    with open(sync.state_file, "rb") as file:
+        state = file.read()
+
+    with pytest.raises(ConnectionError):
+        sync.sync("python", now=NOW + timedelta(days=60))
+
+    assert sync.watermark("python") == "2024-05-01T10:00:00+0300"
+    assert [v.url for v in saver.vacancies] == ["https://hh.ru/vacancy/1"]
+    with open(sync.state_file, "rb") as file:
+        assert file.read() == state
+
+
+def test_truncated_result_loads_older_windows(saver):
+    """Проверка, что обрезанная выдача дозагружается окнами date_to до закрытия пропуска"""
+    api = FakeApi(
+        {"items": [_item(3, "2024-05-03T10:00:00+0300"), _item(2, "2024-05-02T10:00:00+0300")], "found": 3},
+        {"items": [_item(2, "2024-05-02T10:00:00+0300"), _item(1, "2024-05-01T10:00:00+0300")], "found": 2},
+    )
+    sync = IncrementalSync(saver, api.fetch_items)
+
+    result = sync.sync("python", now=NOW)
+
+    assert result["fetched"] == 3
+    assert api.calls[1] == ("python", {"order_by": "publication_time", "date_to": "2024-05-02T10:00:00+0300"})
+    assert sync.watermark("python") == "2024-05-03T10:00:00+0300"
+    assert len(saver.vacancies) == 3
+
+
+def test_truncated_result_keeps_watermark(saver):
+    """Проверка, что отметка не сдвигается, если обрезанную выдачу не удалось загрузить"""
+    api = FakeApi(
+        [_item(1, "2024-05-01T10:00:00+0300")],
+        {"items": [_item(3, "2024-05-03T10:00:00+0300")], "found": 2},
+        {"items": [_item(3, "2024-05-03T10:00:00+0300")], "found": 2},
+    )
+    sync = IncrementalSync(saver, api.fetch_items)
+    sync.sync("python", now=NOW)
+
+    result = sync.sync("python", now=NOW)
+
+    assert result["fetched"] == 1
+    assert sync.watermark("python") == "2024-05-01T10:00:00+0300"
+    assert len(saver.vacancies) == 2
+
+
+def test_default_fetch_loads_all_pages(saver):
+    """Проверка, что по умолчанию используется HH.search"""
+    sync = IncrementalSync(saver)
+
+    assert sync.fetch.__func__.__qualname__ == "HH.search"
+
+
+def test_parse_date():
+    """Проверка разбора даты HeadHunter с часовым поясом"""
+    assert parse_date("2024-05-01T10:00:00+0300") == datetime(2024, 5, 1, 7, 0, tzinfo=timezone.utc)
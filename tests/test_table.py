@@ -0,0 +1,118 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import currency
+from src.file_worker import JsonSaver
+from src.table import VacancyTable
+from src.utils import select_top_vacancies, sort_vacancies
+from src.vacancy import Vacancy
+
+
+@pytest.fixture
+def mixed_vacancies():
+    """Вакансии с разными валютами, пустыми зарплатами и одинаковыми суммами"""
+    return [
+        Vacancy("A", "Python", "https://test.com/a", {"from": 100000, "to": 150000, "currency": "RUR"}, "Company A"),
+        Vacancy("B", "Java", "https://test.com/b", {"from": 2000, "to": None, "currency": "USD"}, "Company B"),
+        Vacancy("C", "Go", "https://test.com/c", None, "Company A"),
+        Vacancy("D", "Rust", "https://test.com/d", {"from": None, "to": 150000, "currency": "RUR"}),
+        Vacancy("E", "SQL", "https://test.com/e", {"from": 50000, "to": 0, "currency": "KZT"}, "Company C"),
+        Vacancy("F", "C++", "https://test.com/f", 150000, "Company B"),
+    ]
+
+
+@pytest.fixture
+def table(mixed_vacancies):
+    return VacancyTable.from_vacancies(mixed_vacancies)
+
+
+def test_table_columns(table, mixed_vacancies):
+    """Проверка типов столбцов и нормализованных зарплат"""
+    assert len(table) == 6
+    assert table.salary_max.dtype == np.int64
+    assert table.employer_codes.dtype == np.int32
+    assert list(table.salary_min) == [v.salary_min for v in mixed_vacancies]
+    assert list(table.salary_max) == [v.salary_max for v in mixed_vacancies]
+    assert list(table.employer) == [v.employer for v in mixed_vacancies]
+    # Категории хранятся один раз
+    assert sorted(table.employers) == ["Company A", "Company B", "Company C", "Не указан"]
+
+
+def test_table_round_trip(table, mixed_vacancies):
+    """Проверка преобразования в список вакансий и словарей без потерь"""
+    assert table.to_records() == [v.to_dict() for v in mixed_vacancies]
+    restored = table.to_vacancies()
+    assert restored == mixed_vacancies
+    assert [v.salary_max for v in restored] == [v.salary_max for v in mixed_vacancies]
+
+
+def test_table_by_salary(table):
+    """Проверка векторной фильтрации по диапазону зарплат"""
+    result = table.by_salary(100000, 160000)
+    assert list(result.urls) == ["https://test.com/a", "https://test.com/d", "https://test.com/f"]
+    assert len(table.by_salary(200000, 100000)) == 0
+
+
+def test_table_by_employer(table):
+    """Проверка выборки по коду работодателя"""
+    assert [v.name for v in table.by_employer("Company A")] == ["A", "C"]
+    assert len(table.by_employer("Unknown")) == 0
+
+
+def test_table_sort_and_top_match_python(table, mixed_vacancies):
+    """Проверка, что сортировка и топ-N совпадают с реализацией на объектах"""
+    expected = [v.url for v in sort_vacancies(mixed_vacancies)]
+    assert list(table.sort_by_salary().urls) == expected
+    for top_n in range(0, 8):
+        assert list(table.top(top_n).urls) == [v.url for v in select_top_vacancies(mixed_vacancies, top_n)]
+
+
+def test_table_top_random_ties():
+    """Проверка топ-N на большом наборе с повторяющимися зарплатами"""
+    rng = np.random.default_rng(0)
+    vacancies = [
+        Vacancy(f"V{i}", "", f"https://test.com/{i}", {"from": int(s), "to": None, "currency": "RUR"})
+        for i, s in enumerate(rng.integers(0, 20, 500) * 1000)
+    ]
+    table = VacancyTable.from_vacancies(vacancies)
+    assert list(table.top(37).urls) == [v.url for v in select_top_vacancies(vacancies, 37)]
+
+
+def test_table_getitem(table):
+    """Проверка доступа по номеру, маске и срезу"""
+    assert table[1].name == "B"
+    assert table[1].salary == {"from": 2000, "to": None, "currency": "USD"}
+    assert list(table[table.salary_max == 0].urls) == ["https://test.com/c"]
+    assert len(table[:2]) == 2
+
+
+def test_table_uses_current_rates(mixed_vacancies):
+    """Проверка, что рубли считаются по текущей таблице курсов"""
+    old = currency.get_rates()
+    try:
+        currency.set_rates({"USD": 100})
+        table = VacancyTable.from_records(v.to_dict() for v in mixed_vacancies)
+        assert table.salary_max[1] == 200000
+    finally:
+        currency.set_rates(old, replace=True)
+
+
+def test_table_json_saver(tmp_path, table, mixed_vacancies):
+    """Проверка обмена данными с JsonSaver"""
+    filename = tmp_path / "vacancies.json"
+    saver = JsonSaver(str(filename))
+    assert table.to_saver(saver) == 6
+
+    from_file = VacancyTable.read_json(str(filename))
+    assert from_file.to_records() == [v.to_dict() for v in saver.vacancies]
+    assert list(from_file.salary_max) == [v.salary_max for v in saver.vacancies]
+    assert list(VacancyTable.from_saver(saver).urls) == list(table.urls)
+
+
+def test_table_empty(tmp_path):
+    """Проверка пустой таблицы"""
+    table = VacancyTable.read_json(str(tmp_path / "missing.json"))
+    assert len(table) == 0
+    assert len(table.top(5)) == 0
+    assert table.to_vacancies() == []
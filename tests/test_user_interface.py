@@ -1,6 +1,5 @@
-import pytest
-from unittest.mock import patch, MagicMock
-from src.user_interface import show_vacancies_from_file, get_vacancies_by_salary, sort_vacancies, print_vacancies
+from unittest.mock import patch
+from src.user_interface import show_vacancies_from_file, get_vacancies_by_salary, sort_vacancies, print_vacancies, top_vacancies
 from src.vacancy import Vacancy
 from src.file_worker import JsonSaver
 
@@ -20,8 +19,8 @@ def test_show_vacancies_from_file_empty(mock_load, mock_print):
 
 def test_get_vacancies_by_salary_valid_range(test_vacancies):
     """Проверка фильтрации вакансий по диапазону зарплат (валидный диапазон)"""
-    # Диапазон, который включает только Python Developer
-    filtered_vacancies = get_vacancies_by_salary(test_vacancies, "90000-110000")
+    # Диапазон, который включает только Python Developer (верхняя граница 150000)
+    filtered_vacancies = get_vacancies_by_salary(test_vacancies, "140000-160000")
     
     assert len(filtered_vacancies) == 1
     assert filtered_vacancies[0].name == "Python Developer"
@@ -59,4 +58,46 @@ def test_print_vacancies(mock_print, test_vacancies):
     # Проверяем, что в выводе есть названия вакансий
     printed_text = ''.join(str(args) for args, _ in mock_print.call_args_list)
     assert "Python Developer" in printed_text
-    assert "Java Developer" in printed_text
\ No newline at end of file
+    assert "Java Developer" in printed_text
+
+def test_show_vacancies_from_file(tmp_path, test_vacancies, capsys):
+    """Проверка потокового вывода вакансий из файла"""
+    path = tmp_path / "vacancies.json"
+    JsonSaver(str(path)).add_vacancies(test_vacancies)
+
+    show_vacancies_from_file(str(path))
+
+    output = capsys.readouterr().out
+    assert output.index("Python Developer") < output.index("Java Developer")
+    assert "Найдено 2 вакансий" in output
+
+
+def test_show_vacancies_from_corrupted_file(tmp_path, capsys):
+    """Проверка вывода сообщения об ошибке для поврежденного файла"""
+    path = tmp_path / "vacancies.json"
+    path.write_text('[{"name": "Valid", "url": "https://valid.com"}, {', encoding='utf-8')
+
+    show_vacancies_from_file(str(path))
+
+    output = capsys.readouterr().out
+    assert "Valid" in output
+    assert "Ошибка чтения файла" in output
+
+
+def test_top_vacancies(test_vacancies):
+    """Проверка выбора топ-N вакансий без полной сортировки"""
+    assert [v.name for v in top_vacancies(test_vacancies, 1)] == ["Java Developer"]
+    assert top_vacancies(test_vacancies, 5) == sort_vacancies(test_vacancies)
+    assert top_vacancies(test_vacancies, 0) == []
+
+
+def test_ranking_uses_salary_in_rubles(test_vacancies):
+    """Проверка, что зарплаты в разных валютах сравниваются в рублях"""
+    dollars = Vacancy("Remote Developer", "Python", "https://test.com/vacancy/usd",
+                      {"from": 3000, "to": None, "currency": "USD"}, "Company D")
+    vacancies = test_vacancies + [dollars]
+
+    assert sort_vacancies(vacancies)[0] is dollars
+    assert top_vacancies(vacancies, 1) == [dollars]
+    assert get_vacancies_by_salary(vacancies, "200000-300000") == [dollars]
+    assert get_vacancies_by_salary(vacancies, "2000-5000") == []
@@ -1,5 +1,5 @@
 import pytest
-from src.utils import sort_vacancies, get_vacancies_by_salary
+from src.utils import filter_vacancies, sort_vacancies, get_vacancies_by_salary, select_top_vacancies
 from src.vacancy import Vacancy
 
 @pytest.fixture
@@ -70,4 +70,108 @@ def test_get_vacancies_by_salary_no_matches(test_vacancies):
     filtered_vacancies = get_vacancies_by_salary(test_vacancies, "200000-250000")
     
     # Не должно быть совпадений
-    assert len(filtered_vacancies) == 0
\ No newline at end of file
+    assert len(filtered_vacancies) == 0
+
+def test_select_top_vacancies(test_vacancies):
+    """Проверка выбора топ-N вакансий"""
+    top = select_top_vacancies(test_vacancies, 2)
+    assert [v.name for v in top] == ["Java Developer", "Python Developer"]
+    assert select_top_vacancies(test_vacancies, 0) == []
+    assert len(select_top_vacancies(test_vacancies, 10)) == 3
+
+
+def test_select_top_vacancies_matches_sort():
+    """Проверка совпадения с полной сортировкой, включая порядок при равной зарплате"""
+    vacancies = [
+        Vacancy(f"V{i}", "", f"url{i}", {"from": (i * 7919) % 13 * 10000, "to": None, "currency": "RUR"})
+        for i in range(200)
+    ]
+    for top_n in (1, 5, 50, 200):
+        expected = sort_vacancies(vacancies)[:top_n]
+        assert [v.url for v in select_top_vacancies(vacancies, top_n)] == [v.url for v in expected]
+
+
+def test_select_top_vacancies_key_once(test_vacancies):
+    """Проверка, что ключ вычисляется один раз для каждой вакансии"""
+    calls = []
+
+    def key(vacancy):
+        calls.append(vacancy.url)
+        return vacancy.get_min_salary()
+
+    select_top_vacancies(test_vacancies * 10, 2, key=key)
+    assert len(calls) == 30
+
+
+def test_filter_vacancies_substring():
+    """Проверка, что ключевое слово ищется подстрокой в требованиях без учета регистра"""
+    vacancies = [
+        Vacancy("DBA", "PostgreSQL", "https://test.com/vacancy/1", None, "A"),
+        Vacancy("Backend", "REST", "https://test.com/vacancy/2", None, "B"),
+        Vacancy("Intern", None, "https://test.com/vacancy/3", None, "C"),
+    ]
+
+    assert [v.name for v in filter_vacancies(vacancies, ["sql", "rest"])] == ["DBA", "Backend"]
+    assert filter_vacancies(vacancies, []) == vacancies
+
+
+def test_query_vacancies_uses_index(tmp_path, monkeypatch, test_vacancies):
+    """Проверка, что для JsonSaver ключевые слова ищутся инвертированным индексом"""
+    from src.file_worker import JsonSaver
+    from src.utils import query_vacancies
+
+    saver = JsonSaver(str(tmp_path / "vacancies.json"))
+    saver.add_vacancies(test_vacancies)
+    monkeypatch.setattr(saver, "filter_vacancies", lambda criteria: pytest.fail("полный перебор хранилища"))
+
+    assert [v.name for v in query_vacancies(saver, ["spring", "django"], "", 5)] == [
+        "Java Developer", "Python Developer"]
+    assert query_vacancies(saver, ["spr"], "", 5) == []
+    assert [v.name for v in query_vacancies(saver, ["developer"], "", 5, vacancies=test_vacancies[:1])] == [
+        "Python Developer"]
+
+
+def test_user_interaction_uses_sqlite_search(tmp_path, monkeypatch, capsys):
+    """Проверка, что при хранилище SQLite выборка выполняется запросом только среди загруженных вакансий"""
+    from src import utils
+
+    saver = utils.open_saver(str(tmp_path / "vacancies.db"))
+    saver.add_vacancy(Vacancy("Old Python", "Python", "https://test.com/vacancy/0", {"from": 500000}, "A"))
+    searches = []
+    search = saver.search
+    monkeypatch.setattr(saver, "search", lambda *args, **kwargs: searches.append(kwargs) or search(*args, **kwargs))
+    monkeypatch.setattr(utils, "json_saver", saver)
+    monkeypatch.setattr(utils.hh_api, "get_vacancies", lambda keyword, **params: [{
+        "name": "Python Developer",
+        "alternate_url": "https://test.com/vacancy/1",
+        "snippet": {"requirement": "Python, SQL"},
+        "salary": {"from": 100000, "to": None, "currency": "RUR"},
+        "employer": {"name": "B"},
+    }])
+    answers = iter(["5", "python", "", "python"])
+    utils.user_interaction(lambda prompt: next(answers))
+
+    out = capsys.readouterr().out
+    assert "Python Developer" in out and "Old Python" not in out
+    assert searches[0]["urls"] == ["https://test.com/vacancy/1"]
+    assert len(saver) == 2
+    saver.close()
+
+
+def test_user_interaction_reports_request_error(tmp_path, monkeypatch, capsys):
+    """Проверка, что ошибка запроса к API выводится пользователю, а хранилище не изменяется"""
+    import requests
+    from src import utils
+    from src.file_worker import JsonSaver
+
+    def failing(keyword, **params):
+        raise requests.exceptions.HTTPError("503 Server Error")
+
+    saver = JsonSaver(str(tmp_path / "vacancies.json"))
+    monkeypatch.setattr(utils, "json_saver", saver)
+    monkeypatch.setattr(utils.hh_api, "get_vacancies", failing)
+    answers = iter(["5", "", "", "python"])
+    utils.user_interaction(lambda prompt: next(answers))
+
+    assert "Ошибка при получении вакансий: 503 Server Error" in capsys.readouterr().out
+    assert saver.vacancies == []
@@ -1,4 +1,5 @@
 import pytest
+from src import currency
 from src.vacancy import Vacancy
 
 # Тесты для класса Vacancy
@@ -100,6 +101,7 @@ def test_vacancy_equality():
     assert vac1 == vac2
     assert vac1 != vac3
     assert vac1 != "not_a_vacancy"  # Сравнение с другим типом
+    assert vac1.__eq__("not_a_vacancy") is NotImplemented
 
 
 def test_vacancy_hash():
@@ -154,4 +156,123 @@ def test_cast_to_object_list():
     assert len(vacancies) == 2
     assert isinstance(vacancies[0], Vacancy)
     assert vacancies[0].name == "Python Developer"
-    assert vacancies[1].name == "Java Developer"
\ No newline at end of file
+    assert vacancies[1].name == "Java Developer"
+
+def test_normalized_salary_fields():
+    """Проверка нормализованных границ зарплаты"""
+    vac = Vacancy(name="Test", requirements="Test", url="test",
+                  salary={"from": 100000, "to": 150000, "currency": "RUR"})
+    assert (vac.salary_min, vac.salary_max) == (100000, 150000)
+
+    vac = Vacancy(name="Test", requirements="Test", url="test", salary={"from": None, "to": 90000})
+    assert (vac.salary_min, vac.salary_max) == (90000, 90000)
+
+    vac = Vacancy(name="Test", requirements="Test", url="test")
+    assert (vac.salary_min, vac.salary_max) == (0, 0)
+
+
+def test_numeric_salary_normalized():
+    """Проверка, что числовая зарплата сохраняется в виде словаря"""
+    vac = Vacancy(name="Test", requirements="Test", url="test", salary=120000)
+    assert vac.salary == {"from": 120000, "to": None, "currency": None}
+    assert vac.get_min_salary() == 120000
+    assert vac.to_dict()["salary"]["from"] == 120000
+
+
+def test_salary_currency_ranking(monkeypatch):
+    """Проверка сравнения зарплат в разных валютах"""
+    monkeypatch.setitem(currency._rates, "USD", 90.0)
+    monkeypatch.setitem(currency._rates, "KZT", 0.2)
+    rub = Vacancy(name="RUB", requirements="", url="rub", salary={"from": 150000, "to": None, "currency": "RUR"})
+    usd = Vacancy(name="USD", requirements="", url="usd", salary={"from": 2000, "to": None, "currency": "USD"})
+    kzt = Vacancy(name="KZT", requirements="", url="kzt", salary={"from": 500000, "to": None, "currency": "KZT"})
+
+    assert usd.salary_max == 180000
+    assert kzt.salary_max == 100000
+    assert [v.name for v in sorted([rub, usd, kzt], reverse=True)] == ["USD", "RUB", "KZT"]
+
+
+def test_salary_assignment_recomputes():
+    """Проверка пересчета нормализованных полей при изменении зарплаты"""
+    vac = Vacancy(name="Test", requirements="Test", url="test", salary={"from": 100000})
+    vac.salary = {"from": 200000, "to": 250000, "currency": "RUR"}
+    assert vac.salary_max == 250000
+
+    with pytest.raises(ValueError, match="Некорректный формат зарплаты"):
+        vac.salary = "много"
+
+
+API_ITEMS = [
+    {
+        "name": "Python Developer",
+        "alternate_url": "https://hh.ru/vacancy/1",
+        "snippet": {"requirement": "Python"},
+        "salary": {"from": 100000, "to": 150000, "currency": "RUR", "gross": True},
+        "employer": {"name": "XYZ Company"},
+    },
+    {
+        "name": "Go Developer",
+        "alternate_url": "https://hh.ru/vacancy/2",
+        "snippet": None,
+        "salary": None,
+        "employer": None,
+    },
+    {"name": "QA", "alternate_url": "https://hh.ru/vacancy/3", "employer": "ABC Company"},
+]
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_api_batch(trusted):
+    """Проверка пакетного создания вакансий из ответа API"""
+    vacancies = Vacancy.from_api_batch(API_ITEMS, trusted=trusted)
+    assert [v.to_dict() for v in vacancies] == [
+        {"name": "Python Developer", "requirements": "Python", "url": "https://hh.ru/vacancy/1",
+         "salary": API_ITEMS[0]["salary"], "employer": "XYZ Company"},
+        {"name": "Go Developer", "requirements": "", "url": "https://hh.ru/vacancy/2",
+         "salary": None, "employer": "Не указан"},
+        {"name": "QA", "requirements": "", "url": "https://hh.ru/vacancy/3",
+         "salary": None, "employer": "ABC Company"},
+    ]
+    assert (vacancies[0].salary_min, vacancies[0].salary_max) == (100000, 150000)
+    assert (vacancies[1].salary_min, vacancies[1].salary_max) == (0, 0)
+
+
+def test_from_api_batch_validation():
+    """Проверка ошибок пакетного создания"""
+    with pytest.raises(ValueError, match="Ожидался список вакансий"):
+        Vacancy.from_api_batch({"items": API_ITEMS})
+    with pytest.raises(ValueError, match="Некорректный формат зарплаты"):
+        Vacancy.from_api_batch([{"name": "Test", "alternate_url": "test", "salary": "много"}])
+
+
+def test_from_records_matches_constructor(test_vacancies):
+    """Проверка, что быстрый путь создает те же вакансии, что и конструктор"""
+    records = [v.to_dict() for v in test_vacancies] + [
+        {"name": "USD", "requirements": None, "url": "usd", "salary": {"from": None, "to": 2000, "currency": "USD"}},
+    ]
+    checked = Vacancy.from_records(records)
+    trusted = Vacancy.from_records(records, trusted=True)
+    for fast, slow in zip(trusted, checked):
+        assert fast.to_dict() == slow.to_dict()
+        assert (fast.salary_min, fast.salary_max) == (slow.salary_min, slow.salary_max)
+    assert trusted[2].employer == "Не указан"
+
+
+def test_from_records_trusted_skips_validation():
+    """Проверка, что проверка зарплаты выполняется только без trusted"""
+    records = [{"name": "Test", "url": "test", "salary": {"from": "100", "to": None, "currency": None}}]
+    with pytest.raises(ValueError):
+        Vacancy.from_records(records)
+    assert Vacancy.from_records(records, trusted=True)[0].salary == records[0]["salary"]
+    with pytest.raises(KeyError):
+        Vacancy.from_records([{"name": "Test"}], trusted=True)
+
+
+@pytest.mark.parametrize("salary", [120000, 120000.0])
+def test_from_trusted_number_salary(salary):
+    """Проверка, что число в зарплате (старые файлы) обрабатывается так же, как при проверке"""
+    trusted = Vacancy.from_trusted("Test", "", "test", salary)
+    checked = Vacancy("Test", "", "test", salary)
+
+    assert trusted.salary == checked.salary == {"from": salary, "to": None, "currency": None}
+    assert (trusted.salary_min, trusted.salary_max) == (checked.salary_min, checked.salary_max) == (120000, 120000)